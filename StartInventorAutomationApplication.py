@@ -6,12 +6,31 @@ Created on Saturday 7th June 2025.
 
 """
 
+import argparse
 import logging.config
 import json
 import os
+import sys
 from datetime import datetime
 
-from src.InventorAutomationApplication import InventorAutomationApplication
+from src.InventorAutomationApplication import (
+    InventorAutomationApplication,
+    PART_CACHE_FILENAME,
+)
+from src.InventorBackend import get_default_backend
+from src.InventorManager import InventorManager
+from src.BatchExporter import (
+    BatchExporter,
+    FORMATS,
+    find_assemblies,
+    read_assembly_list,
+)
+from src.ColumnPlan import ColumnPlan, Column
+from src.FetchPlan import FetchPlan
+from src.MassPropertiesReader import ACCURACY_LEVELS
+from src.PartCache import PartCache
+from src.RecordingBackend import RecordingBackend
+from src.ReplayBackend import ReplayBackend
 
 # - - - - - - - - - - - - - - - - - - - - -
 
@@ -20,7 +39,149 @@ logger = logging.getLogger()
 
 # - - - - - - - - - - - - - - - - - - - - -
 
+
+def parse_arguments():
+    """
+    Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Export Inventor parts lists. Starts the UI unless assemblies "
+        "are given."
+    )
+    parser.add_argument(
+        "assemblies",
+        nargs="*",
+        help="Assembly files or glob patterns to export without the UI.",
+    )
+    parser.add_argument(
+        "--assembly-list",
+        help="Text file with one assembly file or glob pattern per line.",
+    )
+    parser.add_argument(
+        "--options",
+        nargs="+",
+        help="Options to export, as named in the UI. Defaults to all options.",
+    )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=list(FORMATS),
+        default=["html"],
+        help="Output formats. Defaults to html.",
+    )
+    parser.add_argument(
+        "--output",
+        default="exports",
+        help="Directory for exported files. Defaults to exports.",
+    )
+    parser.add_argument(
+        "--show-inventor",
+        action="store_true",
+        help="Show the Inventor window while exporting.",
+    )
+    parser.add_argument(
+        "--accuracy",
+        choices=list(ACCURACY_LEVELS),
+        help="Accuracy of mass properties. Defaults to each document's setting.",
+    )
+    parser.add_argument(
+        "--binding",
+        choices=["early", "cached", "late"],
+        default="late",
+        help="COM binding to Inventor. Early binding falls back to cached if "
+        "type library wrappers cannot be generated. Defaults to late.",
+    )
+    parser.add_argument(
+        "--record",
+        help="Record every Inventor call of the export to this file.",
+    )
+    parser.add_argument(
+        "--replay",
+        help="Export from a recording instead of Inventor. Assembly patterns "
+        "match recorded documents, all are exported if none are given.",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=1.0,
+        help="Multiplier of recorded call times when replaying. Defaults to 1.",
+    )
+    return parser.parse_args()
+
+
+def run_batch(args) -> int:
+    """
+    Export assemblies without the UI.
+
+    Args:
+        args (argparse.Namespace): Arguments.
+
+    Returns:
+        int: Exit code, 1 if any assembly failed.
+    """
+    # Find assemblies.
+    patterns = list(args.assemblies)
+    if args.assembly_list:
+        patterns += read_assembly_list(args.assembly_list)
+    if args.replay:
+        backend = ReplayBackend.load(args.replay, args.replay_latency)
+        filenames = backend.find_documents(patterns)
+    else:
+        backend = get_default_backend(args.binding)
+        filenames = find_assemblies(patterns)
+    if args.record:
+        backend = RecordingBackend(backend)
+    if not filenames:
+        print("No assemblies found.")
+        return 1
+
+    # Plan columns and fields from options.
+    with open("config/option_config.json") as f:
+        options_config = json.load(f)
+    selected_options = args.options or [
+        option["option_name"] for option in options_config["options"]
+    ]
+    column_plan = ColumnPlan.from_options(options_config, selected_options)
+    fetch_plan = FetchPlan.from_column_plan(column_plan, args.accuracy)
+
+    # Record accuracy of each row when mass properties are read at a set level.
+    if args.accuracy is not None:
+        column_plan = ColumnPlan(
+            column_plan.columns + [Column("Accuracy", "accuracy")],
+            column_plan.required_fields,
+        )
+
+    # Export over one Inventor connection.
+    manager = InventorManager(visible=args.show_inventor, backend=backend)
+    if manager.app is None:
+        print("Unable to connect to Inventor.")
+        return 1
+
+    # Cached parts would skip the calls being recorded or replayed.
+    part_cache = None
+    if not (args.record or args.replay):
+        part_cache = PartCache(PART_CACHE_FILENAME)
+    exporter = BatchExporter(
+        manager, column_plan, fetch_plan, args.formats, args.output, part_cache
+    )
+    try:
+        results = exporter.export_all(filenames)
+    finally:
+        if part_cache is not None:
+            part_cache.log_statistics()
+            part_cache.close()
+        if args.record:
+            backend.save(args.record)
+    return int(any(result.error is not None for result in results))
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
 if __name__ == "__main__":
+    args = parse_arguments()
 
     # Set up logging to output to console.
     with open("config/logging_config.json") as f:
@@ -39,6 +200,12 @@ if __name__ == "__main__":
         ] = f"logs/{current_time}/{current_time}.log"
         logging.config.dictConfig(config_dict)
 
+    # Export assemblies given on command line.
+    if args.assemblies or args.assembly_list or args.replay:
+        sys.exit(run_batch(args))
+
     # Start InventorAutomationApplication.
-    app = InventorAutomationApplication()
+    app = InventorAutomationApplication(
+        log_path, PART_CACHE_FILENAME, get_default_backend(args.binding)
+    )
     app.run()
@@ -0,0 +1,81 @@
+"""
+Micro-benchmark of per-row column access, eval against a compiled column plan.
+
+Run from the repository root with:
+    python -m benchmarks.ColumnPlan_benchmark
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import json
+import timeit
+
+from src.ColumnPlan import ColumnPlan
+from src.Part import Part
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+ROWS = 10000
+REPEATS = 5
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def get_rows_eval(parts_list: list, options_config: dict, selected_options: list):
+    """
+    Get rows as previously done, scanning options and evaluating each cell.
+    """
+    rows = []
+    for part in parts_list:
+        row = []
+        for selected_option in selected_options:
+            for option in options_config["options"]:
+                if option["option_name"] == selected_option:
+                    for attribute in option["attribute_name"]:
+                        row.append(eval(f"part.{attribute}"))
+        rows.append(row)
+    return rows
+
+
+def get_rows_plan(parts_list: list, options_config: dict, selected_options: list):
+    """
+    Get rows from a compiled column plan.
+    """
+    get_row = ColumnPlan.from_options(options_config, selected_options).get_row
+    return [get_row(part) for part in parts_list]
+
+
+def main():
+    with open("config/option_config.json") as f:
+        options_config = json.load(f)
+    selected_options = [option["option_name"] for option in options_config["options"]]
+    parts_list = [
+        Part.from_record(
+            {
+                "part_number": f"TBRE-{i}",
+                "part_name": "Bracket",
+                "mass": 1.0 + i,
+                "x_axis": 1.0,
+                "y_axis": 2.0,
+                "z_axis": 3.0,
+            }
+        )
+        for i in range(ROWS)
+    ]
+
+    # Time each approach, keeping the best run.
+    for name, function in [("eval", get_rows_eval), ("plan", get_rows_plan)]:
+        best = min(
+            timeit.repeat(
+                lambda: function(parts_list, options_config, selected_options),
+                number=1,
+                repeat=REPEATS,
+            )
+        )
+        print(f"{name}: {best / ROWS * 1e6:.2f} us per row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark of per-call overhead of each COM binding against a running Inventor.
+
+Run on a workstation with Inventor from the repository root with:
+    python -m benchmarks.Dispatch_benchmark path/to/assembly.iam --occurrences 1000
+
+Each binding reads the properties Part reads from the same part occurrences.
+Results are written as JSON to benchmarks/results so they can be compared
+between commits.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import time
+from datetime import datetime
+
+from src.ComBackend import BINDINGS, ComBackend
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+RESULTS_DIRECTORY = "benchmarks/results"
+
+# Reads made of each part occurrence, as attribute paths.
+READS = [
+    "Name",
+    "Definition.Document.FullFileName",
+    "Definition.Document.PropertySets",
+    "MassProperties.Mass",
+    "MassProperties.CenterOfMass.X",
+    "Transformation",
+]
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def read_path(target, path: str):
+    """
+    Read attribute path, one COM call per attribute.
+    """
+    for name in path.split("."):
+        target = getattr(target, name)
+    return target
+
+
+def run_binding(binding: str, filename: str, occurrence_count: int) -> dict:
+    """
+    Time reads of part occurrences with binding.
+
+    Returns:
+        dict: Result of binding.
+    """
+    backend = ComBackend(binding)
+
+    # Leave visibility of running Inventor unchanged.
+    app = backend.connect(None)
+    _, assembly_doc = backend.open_document(app, filename, False)
+
+    # Collect part occurrences before timing.
+    occurrences = []
+    for occurrence in assembly_doc.ComponentDefinition.Occurrences.AllLeafOccurrences:
+        occurrences.append(occurrence)
+        if len(occurrences) == occurrence_count:
+            break
+
+    start_time = time.perf_counter()
+    for occurrence in occurrences:
+        for path in READS:
+            read_path(occurrence, path)
+    seconds = time.perf_counter() - start_time
+
+    calls = len(occurrences) * sum(len(path.split(".")) for path in READS)
+    return {
+        "binding": backend.binding,
+        "occurrences": len(occurrences),
+        "calls": calls,
+        "seconds": seconds,
+        "microseconds_per_call": 1e6 * seconds / calls,
+    }
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("assembly", help="Assembly file to read.")
+    parser.add_argument("--bindings", nargs="+", choices=BINDINGS, default=BINDINGS)
+    parser.add_argument("--occurrences", type=int, default=1000)
+    parser.add_argument("--output", help="JSON results file.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    logging.disable(logging.CRITICAL)
+    filename = os.path.abspath(args.assembly)
+
+    results = []
+    for binding in args.bindings:
+        result = run_binding(binding, filename, args.occurrences)
+        results.append(result)
+        print(
+            f"{binding} ({result['binding']}): {result['calls']} calls in "
+            f"{result['seconds']:.3f}s, "
+            f"{result['microseconds_per_call']:.1f}us per call"
+        )
+
+    # Write results.
+    current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    output = args.output or os.path.join(
+        RESULTS_DIRECTORY, f"dispatch_{current_time}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "created": current_time,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "assembly": filename,
+                "reads": READS,
+                "results": results,
+            },
+            f,
+            indent=4,
+        )
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Benchmark of each export stage on synthetic assemblies of increasing size.
+
+Run from the repository root with:
+    python -m benchmarks.Export_benchmark --sizes 1000 10000 100000
+
+Results are written as JSON to benchmarks/results so they can be compared
+between commits.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import time
+from datetime import datetime
+
+from src.AssemblyGenerator import AssemblyGenerator
+from src.ColumnPlan import ColumnPlan
+from src.FakeBackend import FakeBackend
+from src.HtmlReportWriter import write_html_parts_list
+from src.InventorManager import InventorManager
+from src.MainWindow import PAGE_ROWS
+from src.MassSummary import MassSummary
+from src.OccurrenceEnumerator import OccurrenceEnumerator, PART_DOCUMENT
+from src.Part import Part
+from src.PartTable import PartTable
+from src.PartTableView import PartTableView
+from src.PropertyCache import PropertyCache
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+SIZES = [1000, 10000, 100000]
+RESULTS_DIRECTORY = "benchmarks/results"
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def time_stage(timings: dict, name: str, function, *args):
+    """
+    Time stage, storing seconds taken.
+
+    Returns:
+        Result of function.
+    """
+    start_time = time.perf_counter()
+    result = function(*args)
+    timings[name] = time.perf_counter() - start_time
+    return result
+
+
+def traverse(occurrences) -> list:
+    """
+    Walk every occurrence, collecting part occurrences.
+    """
+    enumerator = OccurrenceEnumerator()
+    return [
+        entry.occurrence
+        for entry in enumerator.walk(occurrences)
+        if not entry.end and entry.doc_type == PART_DOCUMENT
+    ]
+
+
+def construct_parts(leaf_occurrences: list) -> list:
+    """
+    Construct part for each part occurrence.
+    """
+    property_cache = PropertyCache()
+    return [
+        Part(occurrence, property_cache=property_cache)
+        for occurrence in leaf_occurrences
+    ]
+
+
+def render_html(table: PartTable, column_plan: ColumnPlan, summary: MassSummary):
+    """
+    Render HTML report in memory.
+    """
+    write_html_parts_list(io.StringIO(), table, column_plan, summary)
+
+
+def update_preview(table: PartTable, column_plan: ColumnPlan):
+    """
+    Open preview, sort by each column and scroll through ten pages.
+    """
+    view = PartTableView(table, column_plan)
+    view.get_page(0, PAGE_ROWS)
+    for column_index in range(len(column_plan.columns)):
+        view.sort(column_index)
+        view.get_page(0, PAGE_ROWS)
+    step = max(len(view) // 10, 1)
+    for start in range(0, len(view), step):
+        view.get_page(start, PAGE_ROWS)
+
+
+def run_size(size: int, args, column_plan: ColumnPlan) -> dict:
+    """
+    Benchmark every stage for assembly of size.
+
+    Returns:
+        dict: Result of size.
+    """
+    generator = AssemblyGenerator.from_occurrences(
+        size,
+        args.depth,
+        reuse_ratio=args.reuse_ratio,
+        missing_rate=args.missing_rate,
+        seed=args.seed,
+    )
+    backend = FakeBackend(args.latency)
+    timings = {}
+    top_level = time_stage(timings, "generate", generator.generate, backend)
+    occurrences = backend.get_component_definition(top_level).Occurrences
+    backend.reset_calls()
+
+    # Time stages over the same parts list.
+    leaf_occurrences = time_stage(timings, "traversal", traverse, occurrences)
+    parts_list = time_stage(
+        timings, "part_construction", construct_parts, leaf_occurrences
+    )
+    calls = backend.call_count
+    table = time_stage(timings, "part_table", PartTable.from_parts, parts_list)
+    summary = time_stage(timings, "summary", MassSummary, table, True)
+    time_stage(timings, "dataframe", table.to_dataframe, column_plan)
+    time_stage(timings, "html", render_html, table, column_plan, summary)
+    time_stage(timings, "preview", update_preview, table, column_plan)
+
+    # Time whole export with sub-assembly memoization.
+    manager = InventorManager(backend=backend)
+    time_stage(timings, "export", manager.get_parts_list, top_level)
+
+    return {
+        "size": size,
+        "depth": generator.depth,
+        "fan_out": generator.fan_out,
+        "occurrences": generator.occurrences,
+        "leaf_occurrences": generator.leaf_occurrences,
+        "definitions": generator.definition_count,
+        "calls": calls,
+        "timings": timings,
+    }
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--reuse-ratio", type=float, default=0.5)
+    parser.add_argument("--missing-rate", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON results file.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    # Logging per part would dominate timings.
+    logging.disable(logging.CRITICAL)
+
+    with open("config/option_config.json") as f:
+        options_config = json.load(f)
+    selected_options = [option["option_name"] for option in options_config["options"]]
+    column_plan = ColumnPlan.from_options(options_config, selected_options)
+
+    results = []
+    for size in args.sizes:
+        result = run_size(size, args, column_plan)
+        results.append(result)
+        timings = ", ".join(
+            f"{stage} {seconds:.3f}s" for stage, seconds in result["timings"].items()
+        )
+        print(f"{result['leaf_occurrences']} parts: {timings}")
+
+    # Write results.
+    current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    output = args.output or os.path.join(
+        RESULTS_DIRECTORY, f"export_{current_time}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "created": current_time,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "parameters": {
+                    "depth": args.depth,
+                    "reuse_ratio": args.reuse_ratio,
+                    "missing_rate": args.missing_rate,
+                    "latency": args.latency,
+                    "seed": args.seed,
+                },
+                "results": results,
+            },
+            f,
+            indent=4,
+        )
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
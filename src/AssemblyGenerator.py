@@ -0,0 +1,208 @@
+"""
+AssemblyGenerator is a class for building synthetic assemblies in a FakeBackend.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+
+import numpy as np
+
+from .FakeBackend import FakeBackend
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Folder of generated documents.
+GENERATED_FOLDER = "C:/generated"
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def random_rotation(rng: np.random.Generator) -> np.ndarray:
+    """
+    Create random rotation matrix.
+
+    Args:
+        rng (np.random.Generator): Random number generator.
+
+    Returns:
+        np.ndarray: 3x3 rotation matrix.
+    """
+    q, r = np.linalg.qr(rng.normal(size=(3, 3)))
+    q *= np.sign(np.diag(r))
+    if np.linalg.det(q) < 0:
+        q[:, 0] = -q[:, 0]
+    return q
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class AssemblyGenerator:
+    """
+    Builds a random assembly tree of fixed depth and fan-out.
+
+    Every assembly at depth below the given depth holds fan_out occurrences,
+    and occurrences at the deepest level are parts. Each occurrence places
+    an existing definition of its level with probability reuse_ratio,
+    otherwise a new one. Each new part is missing its mass properties, and
+    separately its description, with probability missing_rate.
+
+    Attributes
+    ----------
+    depth: int
+        Number of assembly levels above the parts.
+    fan_out: int
+        Number of occurrences in each assembly.
+    reuse_ratio: float
+        Probability an occurrence reuses an existing definition.
+    missing_rate: float
+        Probability a new part is missing each property.
+    seed: int
+        Random seed, the same seed builds the same assembly.
+    """
+
+    def __init__(
+        self,
+        depth: int = 3,
+        fan_out: int = 10,
+        reuse_ratio: float = 0.5,
+        missing_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Initialise.
+
+        Args:
+            depth (int): Number of assembly levels above the parts. Defaults to 3.
+            fan_out (int): Number of occurrences in each assembly. Defaults to 10.
+            reuse_ratio (float): Probability of reusing a definition. Defaults
+                to 0.5.
+            missing_rate (float): Probability of each missing part property.
+                Defaults to 0.
+            seed (int): Random seed. Defaults to 0.
+        """
+        if depth < 1 or fan_out < 1:
+            raise ValueError("Depth and fan-out must be at least 1.")
+        for name, value in [
+            ("reuse_ratio", reuse_ratio),
+            ("missing_rate", missing_rate),
+        ]:
+            if not 0 <= value <= 1:
+                raise ValueError(f"{name} must be between 0 and 1.")
+        self.depth = depth
+        self.fan_out = fan_out
+        self.reuse_ratio = reuse_ratio
+        self.missing_rate = missing_rate
+        self.seed = seed
+
+    @classmethod
+    def from_occurrences(cls, leaf_occurrences: int, depth: int = 3, **kwargs):
+        """
+        Create generator for about a number of part occurrences.
+
+        Args:
+            leaf_occurrences (int): Approximate number of part occurrences.
+            depth (int): Number of assembly levels above the parts. Defaults to 3.
+            **kwargs: Other AssemblyGenerator arguments.
+
+        Returns:
+            AssemblyGenerator: Generator with fan-out giving closest count.
+        """
+        fan_out = max(1, round(leaf_occurrences ** (1 / depth)))
+        return cls(depth, fan_out, **kwargs)
+
+    @property
+    def leaf_occurrences(self) -> int:
+        """
+        Number of part occurrences generated.
+        """
+        return self.fan_out**self.depth
+
+    @property
+    def occurrences(self) -> int:
+        """
+        Number of part and sub-assembly occurrences generated.
+        """
+        return sum(self.fan_out**level for level in range(1, self.depth + 1))
+
+    def generate(self, backend: FakeBackend = None) -> str:
+        """
+        Build assembly.
+
+        Args:
+            backend (FakeBackend): Backend to add documents to, optional.
+
+        Returns:
+            str: Top-level assembly FullFileName, in backend.
+        """
+        self.backend = FakeBackend() if backend is None else backend
+        self.rng = np.random.default_rng(self.seed)
+        self.pools = [[] for _ in range(self.depth + 1)]
+        self.definition_count = 0
+
+        top_level = self.create_definition(0)
+        logger.info(
+            f"Generated {self.occurrences} occurrences of "
+            f"{self.definition_count} definitions, "
+            f"{self.leaf_occurrences} parts."
+        )
+        return top_level
+
+    def create_definition(self, level: int) -> str:
+        """
+        Create new definition at level, with new definitions below it.
+
+        Args:
+            level (int): Depth of definition, 0 for top-level assembly.
+
+        Returns:
+            str: Definition FullFileName.
+        """
+        self.definition_count += 1
+        number = f"GEN-{self.definition_count:06d}"
+
+        # Create part at deepest level.
+        if level == self.depth:
+            filename = f"{GENERATED_FOLDER}/{number}.ipt"
+            missing_mass, missing_description = self.rng.random(2) < self.missing_rate
+            self.backend.add_part(
+                filename,
+                number,
+                "" if missing_description else f"Part {number}",
+                mass=None if missing_mass else float(self.rng.uniform(0.01, 5.0)),
+                centre_of_mass=self.rng.uniform(-5.0, 5.0, 3),
+                inertia=np.diag(self.rng.uniform(0.1, 10.0, 3)),
+            )
+            self.pools[level].append(filename)
+            return filename
+
+        # Create assembly of fan_out occurrences.
+        filename = f"{GENERATED_FOLDER}/{number}.iam"
+        self.backend.add_assembly(filename, number, f"Assembly {number}")
+        for _ in range(self.fan_out):
+            pool = self.pools[level + 1]
+            if pool and self.rng.random() < self.reuse_ratio:
+                child = pool[self.rng.integers(len(pool))]
+            else:
+                child = self.create_definition(level + 1)
+            self.backend.add_occurrence(filename, child, matrix=self.create_matrix())
+        self.pools[level].append(filename)
+        return filename
+
+    def create_matrix(self) -> np.ndarray:
+        """
+        Create random placement.
+
+        Returns:
+            np.ndarray: 4x4 matrix with translation in cm.
+        """
+        matrix = np.eye(4)
+        matrix[:3, :3] = random_rotation(self.rng)
+        matrix[:3, 3] = self.rng.uniform(-50.0, 50.0, 3)
+        return matrix
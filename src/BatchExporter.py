@@ -0,0 +1,329 @@
+"""
+BatchExporter is a class for exporting parts lists of many assemblies without the UI.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import glob
+import ntpath
+import os
+import time
+
+from .InventorManager import InventorManager
+from .PropertyCache import PropertyCache
+from .FetchPlan import FetchPlan
+from .SubAssemblyCache import SubAssemblyCache
+from .PartCache import PartCache
+from .ColumnPlan import ColumnPlan
+from .PartTable import PartTable
+from .MassSummary import MassSummary
+from .HtmlReportWriter import write_html_parts_list
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Output formats and their file extension.
+FORMATS = {"html": ".html", "csv": ".csv"}
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def read_assembly_list(filename: str) -> list:
+    """
+    Read assembly files or glob patterns from text file.
+
+    Blank lines and lines starting with # are ignored.
+
+    Args:
+        filename (str): Text file with one assembly file or pattern per line.
+
+    Returns:
+        list: Assembly files or patterns.
+    """
+    with open(filename) as f:
+        lines = [line.strip() for line in f]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def find_assemblies(patterns: list) -> list:
+    """
+    Expand glob patterns into assembly files.
+
+    Args:
+        patterns (list): Assembly files or glob patterns.
+
+    Returns:
+        list: Assembly files in pattern order, without duplicates.
+    """
+    filenames = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            logger.warning(f"No assemblies found for {pattern}.")
+        for filename in matches:
+            filename = os.path.abspath(filename)
+            if filename not in filenames:
+                filenames.append(filename)
+    return filenames
+
+
+def get_output_names(filenames: list) -> list:
+    """
+    Get name of output files of each assembly, numbering assemblies with the
+    same name so their outputs are not overwritten.
+
+    Args:
+        filenames (list): Assembly files.
+
+    Returns:
+        list: Output name of each assembly.
+    """
+    names = []
+    used = set()
+    for filename in filenames:
+        # Windows paths are split on any platform, for replayed recordings.
+        base_name = os.path.splitext(ntpath.basename(filename))[0]
+        name = base_name
+        number = 1
+
+        # Names are compared ignoring case, as on Windows.
+        while name.lower() in used:
+            number += 1
+            name = f"{base_name}_{number}"
+        if name != base_name:
+            logger.warning(f"Writing outputs of {filename} as {name}.")
+        used.add(name.lower())
+        names.append(name)
+    return names
+
+
+def format_result(result) -> str:
+    """
+    Format result of assembly export as one line.
+
+    Args:
+        result (BatchResult): Result of assembly export.
+
+    Returns:
+        str: Result text.
+    """
+    name = ntpath.basename(result.filename)
+    if result.error is not None:
+        return f"{name}: FAILED after {result.seconds:.2f}s, {result.error}"
+    timings = ", ".join(
+        f"{stage} {seconds:.2f}s" for stage, seconds in result.timings.items()
+    )
+    return f"{name}: {result.part_count} parts in {result.seconds:.2f}s ({timings})"
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class BatchResult:
+    """
+    Result of exporting one assembly.
+
+    Attributes
+    ----------
+    filename: str
+        Assembly file.
+    part_count: int
+        Number of parts exported.
+    seconds: float
+        Total time taken.
+    timings: dict
+        Seconds taken keyed by stage.
+    outputs: list
+        Files written.
+    error: str
+        Reason export failed, None if successful.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Initialise.
+
+        Args:
+            filename (str): Assembly file.
+        """
+        self.filename = filename
+        self.part_count = 0
+        self.seconds = 0.0
+        self.timings = {}
+        self.outputs = []
+        self.error = None
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class BatchExporter:
+    """
+    Exports assemblies back to back over one Inventor connection.
+
+    Document properties, sub-assemblies and the part cache are shared between
+    assemblies, so parts common to several assemblies are only read once.
+
+    Attributes
+    ----------
+    manager: InventorManager
+        Connection to Inventor.
+    column_plan: ColumnPlan
+        Columns to export.
+    fetch_plan: FetchPlan
+        Part fields to fetch.
+    formats: list
+        Output formats, from FORMATS.
+    output_directory: str
+        Directory for exported files.
+    property_cache: PropertyCache
+        Document properties shared between assemblies.
+    sub_assembly_cache: SubAssemblyCache
+        Sub-assemblies shared between assemblies.
+    part_cache: PartCache
+        Cache of part properties on disk, optional.
+    """
+
+    def __init__(
+        self,
+        manager: InventorManager,
+        column_plan: ColumnPlan,
+        fetch_plan: FetchPlan,
+        formats: list,
+        output_directory: str,
+        part_cache: PartCache = None,
+    ):
+        """
+        Initialise.
+
+        Args:
+            manager (InventorManager): Connection to Inventor.
+            column_plan (ColumnPlan): Columns to export.
+            fetch_plan (FetchPlan): Part fields to fetch.
+            formats (list): Output formats, from FORMATS.
+            output_directory (str): Directory for exported files.
+            part_cache (PartCache): Cache of part properties on disk, optional.
+        """
+        unknown_formats = set(formats).difference(FORMATS)
+        if unknown_formats:
+            raise ValueError(f"Unknown output formats: {sorted(unknown_formats)}")
+        self.manager = manager
+        self.column_plan = column_plan
+        self.fetch_plan = fetch_plan
+        self.formats = list(formats)
+        self.output_directory = output_directory
+        self.property_cache = PropertyCache()
+        self.sub_assembly_cache = SubAssemblyCache()
+        self.part_cache = part_cache
+
+    def export_all(self, filenames: list, report=print) -> list:
+        """
+        Export assemblies in order, continuing past failures.
+
+        Args:
+            filenames (list): Assembly files.
+            report: Function called with result text of each assembly. Defaults
+                to print.
+
+        Returns:
+            list: BatchResult of each assembly.
+        """
+        os.makedirs(self.output_directory, exist_ok=True)
+        results = []
+        output_names = get_output_names(filenames)
+        for index, (filename, output_name) in enumerate(
+            zip(filenames, output_names), start=1
+        ):
+            logger.info(f"Exporting assembly {index} of {len(filenames)}: {filename}")
+            result = self.export_assembly(filename, output_name)
+            results.append(result)
+            report(f"[{index}/{len(filenames)}] {format_result(result)}")
+
+        # Report totals.
+        failed = sum(result.error is not None for result in results)
+        total_seconds = sum(result.seconds for result in results)
+        report(
+            f"Exported {len(results) - failed} of {len(results)} assemblies in "
+            f"{total_seconds:.2f}s."
+        )
+        return results
+
+    def export_assembly(self, filename: str, output_name: str = None) -> BatchResult:
+        """
+        Export parts list of assembly.
+
+        Args:
+            filename (str): Assembly file.
+            output_name (str): Name of output files, optional. Defaults to
+                assembly name.
+
+        Returns:
+            BatchResult: Result of export.
+        """
+        result = BatchResult(filename)
+        start_time = time.perf_counter()
+        try:
+            # Traverse assembly.
+            stage_time = time.perf_counter()
+            parts_list = self.manager.get_parts_list(
+                filename,
+                fetch_plan=self.fetch_plan,
+                property_cache=self.property_cache,
+                sub_assembly_cache=self.sub_assembly_cache,
+                part_cache=self.part_cache,
+            )
+            if self.part_cache is not None:
+                self.part_cache.flush()
+            result.timings["traverse"] = time.perf_counter() - stage_time
+
+            # Summarise parts list.
+            stage_time = time.perf_counter()
+            table = PartTable.from_parts(parts_list)
+            summary = MassSummary(table, "inertia" in self.fetch_plan)
+            result.part_count = len(table)
+            result.timings["summarise"] = time.perf_counter() - stage_time
+
+            # Write each format.
+            stage_time = time.perf_counter()
+            if output_name is None:
+                output_name = get_output_names([filename])[0]
+            result.outputs = self.write_outputs(output_name, table, summary)
+            result.timings["write"] = time.perf_counter() - stage_time
+        except Exception as e:
+            logger.error(f"Error exporting assembly {filename}: {e}")
+            result.error = str(e)
+        finally:
+            self.manager.close_document()
+        result.seconds = time.perf_counter() - start_time
+        return result
+
+    def write_outputs(self, name: str, table: PartTable, summary: MassSummary):
+        """
+        Write parts list in each output format.
+
+        Args:
+            name (str): Name of output files.
+            table (PartTable): Parts list.
+            summary (MassSummary): Summary of parts list.
+
+        Returns:
+            list: Files written.
+        """
+        outputs = []
+        for output_format in self.formats:
+            output = os.path.join(
+                self.output_directory, f"{name}_PARTS_LIST{FORMATS[output_format]}"
+            )
+            if output_format == "html":
+                with open(output, "w") as f:
+                    write_html_parts_list(f, table, self.column_plan, summary)
+            else:
+                table.to_dataframe(self.column_plan).to_csv(output, index=False)
+            outputs.append(output)
+            logger.info(f"Wrote {output}.")
+        return outputs
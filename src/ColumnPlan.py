@@ -0,0 +1,255 @@
+"""
+ColumnPlan is a class for the parts list columns of the selected options.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+from operator import attrgetter
+
+import numpy as np
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Column types in option config.
+TEXT_COLUMN = "text"
+NUMBER_COLUMN = "number"
+
+# Number of table rows formatted at once.
+FORMAT_CHUNK_ROWS = 1000
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class Column:
+    """
+    A parts list column.
+
+    Attributes
+    ----------
+    display_name: str
+        Column heading.
+    attribute_name: str
+        Part attribute shown in column.
+    getter: operator.attrgetter
+        Getter for part attribute.
+    formatter:
+        Function converting value to text.
+    column_type: str
+        "text" or "number".
+    precision: int
+        Decimal places of number columns.
+    """
+
+    def __init__(
+        self,
+        display_name: str,
+        attribute_name: str,
+        formatter=None,
+        column_type: str = TEXT_COLUMN,
+        precision: int = 3,
+    ):
+        """
+        Initialise.
+
+        Args:
+            display_name (str): Column heading.
+            attribute_name (str): Part attribute shown in column.
+            formatter: Function converting value to text, optional. Defaults to
+                fixed decimal places for number columns and str otherwise.
+            column_type (str): "text" or "number". Defaults to "text".
+            precision (int): Decimal places of number columns. Defaults to 3.
+        """
+        if column_type not in (TEXT_COLUMN, NUMBER_COLUMN):
+            raise ValueError(f"Unknown column type {column_type}.")
+        self.display_name = display_name
+        self.attribute_name = attribute_name
+        self.getter = attrgetter(attribute_name)
+        self.column_type = column_type
+        self.precision = precision
+        if formatter is not None:
+            self.formatter = formatter
+        elif column_type == NUMBER_COLUMN:
+            self.formatter = f"{{:.{precision}f}}".format
+        else:
+            self.formatter = str
+
+    def format_value(self, value) -> str:
+        """
+        Format value, missing values are blank.
+
+        Args:
+            value: Value, None if missing.
+
+        Returns:
+            str: Text shown in cell.
+        """
+        if value is None:
+            return ""
+        return self.formatter(value)
+
+    def format_column(self, values) -> list:
+        """
+        Format column of values.
+
+        Number columns of a PartTable are formatted in one vectorized call.
+
+        Args:
+            values: List of values, or float array with NaN where missing.
+
+        Returns:
+            list: Text for each value.
+        """
+        if not isinstance(values, np.ndarray):
+            return [self.format_value(value) for value in values]
+
+        missing = np.isnan(values)
+        if self.column_type == NUMBER_COLUMN:
+            text = np.char.mod(f"%.{self.precision}f", values).astype(object)
+        else:
+            text = np.array(
+                [self.formatter(value) for value in values.tolist()], dtype=object
+            )
+        text[missing] = ""
+        return text.tolist()
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class ColumnPlan:
+    """
+    Columns for the selected options, compiled once and shared by every output.
+
+    Attributes
+    ----------
+    columns: list
+        Columns in display order.
+    required_fields: set
+        Part fields needed for columns.
+    """
+
+    def __init__(self, columns: list, required_fields: set = None):
+        """
+        Initialise.
+
+        Args:
+            columns (list): Columns in display order.
+            required_fields (set): Part fields needed for columns, optional.
+        """
+        self.columns = columns
+        self.required_fields = set() if required_fields is None else required_fields
+        self.display_names = [column.display_name for column in columns]
+        self.attribute_names = [column.attribute_name for column in columns]
+
+        # Get all values of a row in one call.
+        if len(columns) == 1:
+            getter = columns[0].getter
+            self.get_row = lambda part: (getter(part),)
+        elif columns:
+            self.get_row = attrgetter(*self.attribute_names)
+        else:
+            self.get_row = lambda part: ()
+
+    @classmethod
+    def from_options(cls, options_config: dict, selected_options: list):
+        """
+        Compile column plan for selected options.
+
+        Args:
+            options_config (dict): Dictionary of options.
+            selected_options (list): Selected option names, in display order.
+
+        Returns:
+            ColumnPlan: Column plan.
+        """
+        options = {
+            option["option_name"]: option for option in options_config["options"]
+        }
+
+        columns = []
+        required_fields = set()
+        for selected in selected_options:
+            option = options[selected]
+            required_fields.update(option["required_fields"])
+            for display_name, attribute_name, column_type, precision in zip(
+                option["display_name"],
+                option["attribute_name"],
+                option["column_type"],
+                option["precision"],
+            ):
+                columns.append(
+                    Column(
+                        display_name,
+                        attribute_name,
+                        column_type=column_type,
+                        precision=precision,
+                    )
+                )
+        return cls(columns, required_fields)
+
+    def format_table(self, table) -> list:
+        """
+        Format every row of table, one column at a time.
+
+        Args:
+            table (PartTable): Parts list.
+
+        Returns:
+            list: Tuple of text for each row.
+        """
+        formatted = [
+            column.format_column(table.get_column(column.attribute_name))
+            for column in self.columns
+        ]
+        return list(zip(*formatted))
+
+    def iter_formatted_rows(self, parts_list):
+        """
+        Iterate over formatted rows of parts.
+
+        Args:
+            parts_list: PartTable, or iterable of parts.
+
+        Yields:
+            Text for each column of a row.
+        """
+        if not hasattr(parts_list, "get_column"):
+            yield from map(self.format_row, parts_list)
+            return
+
+        # Format table in chunks to bound memory used by text.
+        for start in range(0, len(parts_list), FORMAT_CHUNK_ROWS):
+            stop = start + FORMAT_CHUNK_ROWS
+            yield from self.format_table(parts_list[start:stop])
+
+    def format_values(self, values) -> list:
+        """
+        Format row values.
+
+        Args:
+            values: Value for each column.
+
+        Returns:
+            list: Text for each column.
+        """
+        return [
+            column.format_value(value) for column, value in zip(self.columns, values)
+        ]
+
+    def format_row(self, part) -> list:
+        """
+        Get formatted values of part.
+
+        Args:
+            part (Part): Part.
+
+        Returns:
+            list: Text for each column.
+        """
+        return self.format_values(self.get_row(part))
@@ -0,0 +1,219 @@
+"""
+ComBackend is a class for accessing a running Inventor through COM.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import pythoncom
+import win32com.client
+from win32com.client import dynamic, gencache
+import logging.config
+
+from .InventorBackend import InventorBackend
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Inventor application ProgID.
+PROG_ID = "Inventor.Application"
+
+# Dispatch bindings, fastest first.
+EARLY_BINDING = "early"
+CACHED_BINDING = "cached"
+LATE_BINDING = "late"
+BINDINGS = [EARLY_BINDING, CACHED_BINDING, LATE_BINDING]
+
+# Items fetched per call when enumerating collections.
+ENUM_BATCH = 256
+
+# Dispatch representations shared by every object of an interface, keyed by IID.
+OLE_REPRESENTATIONS = {}
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def get_ole_representation(dispatch):
+    """
+    Get dispatch representation of interface, building it once per interface.
+
+    The representation maps member names to DISPIDs, so objects sharing it
+    skip the type information walk and GetIDsOfNames lookups of late binding.
+
+    Args:
+        dispatch (PyIDispatch): Dispatch of object.
+
+    Returns:
+        Dispatch representation of object's interface.
+    """
+    typeinfo = dispatch.GetTypeInfo()
+    iid = typeinfo.GetTypeAttr()[0]
+    if iid not in OLE_REPRESENTATIONS:
+        OLE_REPRESENTATIONS[iid] = dynamic.MakeOleRepr(dispatch, typeinfo, None)
+    return OLE_REPRESENTATIONS[iid]
+
+
+def create_cached_dispatch(dispatch, user_name: str = None):
+    """
+    Wrap dispatch with representation of its interface.
+
+    Args:
+        dispatch (PyIDispatch): Dispatch of object.
+        user_name (str): Name used in errors, optional.
+
+    Returns:
+        CachedDispatch: Object, or late-bound object without type information.
+    """
+    try:
+        olerepr = get_ole_representation(dispatch)
+    except pythoncom.com_error:
+        return dynamic.Dispatch(dispatch, user_name)
+    return CachedDispatch(dispatch, olerepr, user_name)
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class CachedDispatch(dynamic.CDispatch):
+    """
+    Late-bound object that shares DISPIDs with every object of its interface,
+    and wraps the objects it returns the same way.
+    """
+
+    def _wrap_dispatch_(self, ob, userName=None, returnCLSID=None):
+        return create_cached_dispatch(ob, userName)
+
+    def __iter__(self):
+        enum = self._oleobj_.Invoke(
+            pythoncom.DISPID_NEWENUM,
+            0,
+            pythoncom.DISPATCH_METHOD | pythoncom.DISPATCH_PROPERTYGET,
+            True,
+        )
+        enum = enum.QueryInterface(pythoncom.IID_IEnumVARIANT)
+        dispatch_type = pythoncom.TypeIIDs[pythoncom.IID_IDispatch]
+        while True:
+            items = enum.Next(ENUM_BATCH)
+            if not items:
+                return
+            for item in items:
+                if isinstance(item, dispatch_type):
+                    item = create_cached_dispatch(item)
+                yield item
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class ComBackend(InventorBackend):
+    """
+    Inventor through win32com, the only module that imports win32com or pythoncom.
+
+    Objects are bound in one of three ways:
+        early: generated type library wrappers with DISPIDs compiled in.
+        cached: late binding with DISPIDs looked up once per interface.
+        late: late binding, looking up type information for each object.
+    Late binding is the default until early and cached binding are measured
+    on a workstation. Early binding falls back to cached binding if the
+    wrappers cannot be generated.
+
+    Attributes
+    ----------
+    binding: str
+        Binding in use, one of BINDINGS.
+    """
+
+    name = "com"
+
+    def __init__(self, binding: str = LATE_BINDING):
+        """
+        Initialise.
+
+        Args:
+            binding (str): One of BINDINGS. Defaults to late.
+        """
+        if binding not in BINDINGS:
+            raise ValueError(f"Unknown binding {binding}, expected one of {BINDINGS}.")
+        self.binding = binding
+
+    def initialise_thread(self):
+        """
+        Initialise COM apartment of current thread.
+        """
+        pythoncom.CoInitialize()
+
+    def uninitialise_thread(self):
+        """
+        Uninitialise COM apartment of current thread.
+        """
+        pythoncom.CoUninitialize()
+
+    def pump_messages(self):
+        """
+        Pump Windows messages so COM events are delivered.
+        """
+        pythoncom.PumpWaitingMessages()
+
+    def connect(self, visible: bool = True):
+        """
+        Connect to Inventor application, starting it if not running.
+
+        Args:
+            visible (bool): Show Inventor window, or None to leave it unchanged.
+                Defaults to True.
+
+        Returns:
+            Inventor Application.
+        """
+        app = None
+        if self.binding == EARLY_BINDING:
+            try:
+                app = gencache.EnsureDispatch(PROG_ID)
+            except Exception as e:
+                logger.warning(
+                    f"Unable to generate Inventor type library wrappers, using "
+                    f"cached binding. {e}"
+                )
+                self.binding = CACHED_BINDING
+        if self.binding == CACHED_BINDING:
+            app = create_cached_dispatch(dynamic.Dispatch(PROG_ID)._oleobj_, PROG_ID)
+        elif self.binding == LATE_BINDING:
+            app = dynamic.Dispatch(PROG_ID)
+        logger.info(f"Connected to Inventor with {self.binding} binding.")
+        if visible is not None:
+            app.Visible = visible
+        return app
+
+    def cast(self, document, interface: str):
+        """
+        Cast document to Inventor interface.
+
+        Late-bound documents already resolve every member of their interface,
+        so they are only cast with early binding.
+
+        Args:
+            document: Document.
+            interface (str): Interface name, e.g. "AssemblyDocument".
+
+        Returns:
+            Document with interface.
+        """
+        if self.binding != EARLY_BINDING:
+            return document
+        return win32com.client.CastTo(document, interface)
+
+    def with_events(self, source, handler_class):
+        """
+        Attach event handler to event source.
+
+        Args:
+            source: Inventor event source, e.g. ApplicationEvents.
+            handler_class: Handler class.
+
+        Returns:
+            Handler instance receiving events.
+        """
+        return win32com.client.WithEvents(source, handler_class)
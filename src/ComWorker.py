@@ -0,0 +1,106 @@
+"""
+ComWorker is a class for running all Inventor COM access on a single thread.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import queue
+import threading
+from concurrent.futures import Future
+
+from .InventorBackend import InventorBackend, get_default_backend
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class ComWorker:
+    """
+    A worker thread that owns the COM apartment used for Inventor.
+
+    COM objects must only be used on the thread that created them, so every call
+    into Inventor is submitted to this worker and its result returned as a future.
+    Windows messages are pumped while idle so COM events are delivered.
+
+    Attributes
+    ----------
+    requests: queue.Queue
+        Queue of requests waiting to run.
+    thread: threading.Thread
+        Worker thread.
+    pump_interval: float
+        Time in seconds between pumping messages while idle.
+    backend: InventorBackend
+        Backend preparing thread for Inventor access.
+    """
+
+    def __init__(self, pump_interval: float = 0.05, backend: InventorBackend = None):
+        """
+        Initialise and start worker thread.
+
+        Args:
+            pump_interval (float): Time between pumping messages. Defaults to 0.05.
+            backend (InventorBackend): Inventor backend, optional. Defaults to COM.
+        """
+        self.pump_interval = pump_interval
+        self.backend = get_default_backend() if backend is None else backend
+        self.requests = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name="ComWorker", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """
+        Run requests until stopped.
+        """
+        self.backend.initialise_thread()
+        try:
+            while True:
+                # Pump messages for COM events while idle.
+                try:
+                    request = self.requests.get(timeout=self.pump_interval)
+                except queue.Empty:
+                    self.backend.pump_messages()
+                    continue
+                if request is None:
+                    break
+
+                # Run request.
+                future, function, args, kwargs = request
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(function(*args, **kwargs))
+                except BaseException as e:
+                    logger.error(f"Error running {function.__name__} on worker: {e}")
+                    future.set_exception(e)
+        finally:
+            self.backend.uninitialise_thread()
+            logger.info("Stopped COM worker.")
+
+    def submit(self, function, *args, **kwargs) -> Future:
+        """
+        Submit function to run on worker thread.
+
+        Args:
+            function: Function to run.
+
+        Returns:
+            Future: Future for result of function.
+        """
+        future = Future()
+        self.requests.put((future, function, args, kwargs))
+        return future
+
+    def stop(self):
+        """
+        Stop worker thread once queued requests have run.
+        """
+        self.requests.put(None)
+        self.thread.join()
@@ -0,0 +1,122 @@
+"""
+DocumentTracker is a class for tracking active document changes from Inventor events.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import threading
+import time
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+# Inventor EventTimingEnum values.
+BEFORE_EVENT = 18689
+AFTER_EVENT = 18690
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class ApplicationEventsHandler:
+    """
+    Handler for Inventor ApplicationEvents, used with InventorBackend.with_events.
+
+    Attributes
+    ----------
+    tracker: DocumentTracker
+        Tracker notified once document events have happened.
+    """
+
+    tracker = None
+
+    def OnActivateDocument(self, DocumentObject, BeforeOrAfter, Context, HandlingCode):
+        self.notify("OnActivateDocument", BeforeOrAfter)
+
+    def OnOpenDocument(
+        self, DocumentObject, FullDocumentName, BeforeOrAfter, Context, HandlingCode
+    ):
+        self.notify("OnOpenDocument", BeforeOrAfter)
+
+    def OnCloseDocument(
+        self, DocumentObject, FullDocumentName, BeforeOrAfter, Context, HandlingCode
+    ):
+        self.notify("OnCloseDocument", BeforeOrAfter)
+
+    def notify(self, event_name: str, before_or_after: int):
+        """
+        Notify tracker of event once it has happened.
+
+        Args:
+            event_name (str): Name of event.
+            before_or_after (int): Event timing.
+        """
+        if before_or_after == AFTER_EVENT and self.tracker is not None:
+            self.tracker.notify(event_name)
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class DocumentTracker:
+    """
+    Debounces document events so the UI updates once per burst of events.
+
+    Events arrive on the COM worker thread and are checked from the UI thread.
+    Opening an assembly fires several events in quick succession, so a change is
+    only reported once no events have arrived for the debounce time.
+
+    Attributes
+    ----------
+    debounce: float
+        Quiet time in seconds before a change is reported.
+    events: int
+        Number of events received.
+    """
+
+    def __init__(self, debounce: float = 0.3, clock=time.monotonic):
+        """
+        Initialise.
+
+        Args:
+            debounce (float): Quiet time in seconds. Defaults to 0.3.
+            clock: Function returning current time in seconds, optional.
+        """
+        self.debounce = debounce
+        self.clock = clock
+        self.events = 0
+        self.last_event_time = None
+        self.lock = threading.Lock()
+
+    def notify(self, event_name: str):
+        """
+        Record document event.
+
+        Args:
+            event_name (str): Name of event.
+        """
+        logger.info(f"Received document event {event_name}.")
+        with self.lock:
+            self.events += 1
+            self.last_event_time = self.clock()
+
+    def check(self) -> bool:
+        """
+        Check for a settled document change, clearing it if found.
+
+        Returns:
+            bool: True if document has changed, False otherwise.
+        """
+        with self.lock:
+            if self.last_event_time is None:
+                return False
+            if self.clock() - self.last_event_time < self.debounce:
+                return False
+            self.last_event_time = None
+            return True
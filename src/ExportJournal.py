@@ -0,0 +1,193 @@
+"""
+ExportJournal is a class for checkpointing exports so they can be resumed.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import hashlib
+import json
+import os
+from datetime import datetime
+from glob import glob
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class ExportJournal:
+    """
+    An append-only journal of processed occurrences for an assembly export.
+
+    The journal is a JSON lines file starting with a header describing the export,
+    followed by one record per processed occurrence and a footer once complete. An
+    incomplete journal for the same assembly is resumed by the next export.
+
+    Attributes
+    ----------
+    filename: str
+        Journal filename.
+    records: dict
+        Part records keyed by occurrence path, loaded when resuming.
+    """
+
+    def __init__(self, filename: str, records: dict = None):
+        """
+        Initialise.
+
+        Args:
+            filename (str): Journal filename.
+            records (dict): Part records keyed by occurrence path, optional.
+        """
+        self.filename = filename
+        self.records = records or {}
+        self.file = None
+
+    @staticmethod
+    def get_journal_name(assembly_name: str) -> str:
+        """
+        Get journal filename for assembly.
+
+        Args:
+            assembly_name (str): Assembly FullFileName.
+
+        Returns:
+            str: Journal filename without directory.
+        """
+        digest = hashlib.sha1(assembly_name.lower().encode("utf-8")).hexdigest()
+        return f"EXPORT_JOURNAL_{digest[:12]}.jsonl"
+
+    @classmethod
+    def open(cls, log_path: str, assembly_name: str, fields: list):
+        """
+        Open journal for export, resuming an incomplete journal if available.
+
+        Args:
+            log_path (str): Log directory for current run.
+            assembly_name (str): Assembly FullFileName.
+            fields (list): Part fields fetched by export.
+
+        Returns:
+            ExportJournal: Journal ready for appending.
+        """
+        journal_name = cls.get_journal_name(assembly_name)
+        fields = sorted(fields)
+
+        # Search previous runs, most recent first.
+        logs_root = os.path.dirname(os.path.normpath(log_path))
+        previous = sorted(
+            glob(os.path.join(logs_root, "*", journal_name)),
+            key=os.path.getmtime,
+            reverse=True,
+        )
+        for filename in previous:
+            header, records, complete = cls.read(filename)
+            if complete or header is None:
+                break
+            if header["assembly"] != assembly_name or header["fields"] != fields:
+                break
+
+            logger.info(f"Resuming export from {filename} ({len(records)} records).")
+            journal = cls(filename, records)
+            journal.file = open(filename, "a", encoding="utf-8")
+            journal.repair()
+            return journal
+
+        # Start new journal.
+        filename = os.path.join(log_path, journal_name)
+        logger.info(f"Starting export journal {filename}.")
+        journal = cls(filename)
+        journal.file = open(filename, "w", encoding="utf-8")
+        journal.write(
+            {
+                "assembly": assembly_name,
+                "fields": fields,
+                "started": datetime.now().isoformat(),
+            }
+        )
+        return journal
+
+    @staticmethod
+    def read(filename: str) -> tuple:
+        """
+        Read journal file, ignoring a partially written last line.
+
+        Args:
+            filename (str): Journal filename.
+
+        Returns:
+            tuple: Header, records keyed by occurrence path and complete flag.
+        """
+        header = None
+        records = {}
+        complete = False
+        with open(filename, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring incomplete line in {filename}.")
+                    continue
+
+                if header is None:
+                    header = entry
+                elif entry.get("complete"):
+                    complete = True
+                else:
+                    records[tuple(entry["path"])] = entry["part"]
+        return header, records, complete
+
+    def repair(self):
+        """
+        Make sure appended entries start on a new line.
+        """
+        with open(self.filename, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            last_byte = f.read(1)
+        if last_byte != b"\n":
+            self.file.write("\n")
+
+    def write(self, entry: dict):
+        """
+        Write entry to journal.
+
+        Args:
+            entry (dict): Entry to write.
+        """
+        self.file.write(json.dumps(entry) + "\n")
+        self.file.flush()
+
+    def append(self, path: tuple, record: dict):
+        """
+        Append processed occurrence.
+
+        Args:
+            path (tuple): Occurrence path.
+            record (dict): Part record.
+        """
+        self.write({"path": list(path), "part": record})
+
+    def complete(self):
+        """
+        Mark export as complete and close journal.
+        """
+        self.write({"complete": True})
+        self.close()
+        logger.info(f"Completed export journal {self.filename}.")
+
+    def close(self):
+        """
+        Close journal, leaving it incomplete if not marked complete.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
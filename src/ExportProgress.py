@@ -0,0 +1,148 @@
+"""
+ExportProgress is a class for sharing export progress between threads.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import threading
+import time
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class ExportProgress:
+    """
+    Thread-safe progress of an export running on the COM worker.
+
+    The worker updates progress and the UI reads it periodically, so the UI is
+    never touched from the worker thread.
+
+    Attributes
+    ----------
+    maximum: int
+        Total number of steps.
+    progress: int
+        Number of completed steps.
+    task: str
+        Current task.
+    task_interval: float
+        Minimum time in seconds between task updates.
+    """
+
+    def __init__(self, task_interval: float = 0.1, clock=time.monotonic):
+        """
+        Initialise.
+
+        Args:
+            task_interval (float): Minimum time between task updates. Defaults to 0.1.
+            clock: Function returning current time in seconds, optional.
+        """
+        self.maximum = 0
+        self.progress = 0
+        self.task = ""
+        self.task_interval = task_interval
+        self.clock = clock
+        self.start_time = clock()
+        self.task_time = None
+        self.lock = threading.Lock()
+        self.cancel_event = threading.Event()
+
+    def set_length(self, max_length: int):
+        """
+        Set total number of steps, timing progress from now.
+
+        Args:
+            max_length (int): Total number of steps.
+        """
+        with self.lock:
+            self.maximum = max_length
+            self.start_time = self.clock()
+
+    def set_progress(self, progress: int):
+        """
+        Set number of completed steps.
+
+        Args:
+            progress (int): Completed steps.
+        """
+        with self.lock:
+            self.progress = progress
+
+    def add_to_progress_bar(self):
+        """
+        Add completed step.
+        """
+        with self.lock:
+            self.progress += 1
+
+    def update_task(self, task: str):
+        """
+        Update task.
+
+        Args:
+            task (str): Current task.
+        """
+        with self.lock:
+            self.task = task
+
+    def check_task_due(self) -> bool:
+        """
+        Check if task should be updated, so tasks that are slow to describe are
+        only described at a fixed rate.
+
+        Returns:
+            bool: True if task interval has passed since last update.
+        """
+        now = self.clock()
+        with self.lock:
+            if self.task_time is not None and now - self.task_time < self.task_interval:
+                return False
+            self.task_time = now
+            return True
+
+    def get_throughput(self) -> tuple:
+        """
+        Get rate of progress and estimated time remaining.
+
+        Returns:
+            tuple: Steps per second and seconds remaining, None if unknown.
+        """
+        with self.lock:
+            elapsed = self.clock() - self.start_time
+            if elapsed <= 0 or self.progress == 0:
+                return None, None
+            rate = self.progress / elapsed
+            remaining = max(self.maximum - self.progress, 0) / rate
+            return rate, remaining
+
+    def snapshot(self) -> tuple:
+        """
+        Get consistent copy of progress.
+
+        Returns:
+            tuple: Completed steps, total steps and current task.
+        """
+        with self.lock:
+            return self.progress, self.maximum, self.task
+
+    def cancel(self):
+        """
+        Request export to stop.
+        """
+        logger.info("Export cancel requested.")
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether export has been cancelled.
+        """
+        return self.cancel_event.is_set()
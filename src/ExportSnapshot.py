@@ -0,0 +1,427 @@
+"""
+ExportSnapshot is a class for re-exporting only occurrences that have changed.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import os
+
+import numpy as np
+
+from .Part import Part
+from .SubAssemblyCache import transform_part
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def get_file_key(filename: str) -> tuple:
+    """
+    Get modification time and size of file.
+
+    Args:
+        filename (str): Filename.
+
+    Returns:
+        tuple: Modification time and size, None if file unavailable.
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime, stat.st_size
+
+
+def get_dirty_files(app) -> set:
+    """
+    Get documents open in Inventor with unsaved changes.
+
+    Args:
+        app: Inventor application.
+
+    Returns:
+        set: FullFileName of each dirty document.
+    """
+    dirty_files = set()
+    try:
+        for document in app.Documents:
+            if document.Dirty:
+                dirty_files.add(document.FullFileName)
+    except Exception as e:
+        logger.error(f"Unable to check for unsaved documents: {e}")
+    return dirty_files
+
+
+def check_moved(delta: np.ndarray) -> bool:
+    """
+    Check if change in placement moves occurrence.
+
+    Args:
+        delta (np.ndarray): 4x4 homogeneous matrix.
+
+    Returns:
+        bool: Moved or not.
+    """
+    return not np.allclose(delta, np.eye(4))
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class AssemblySnapshot:
+    """
+    An exported sub-assembly occurrence.
+
+    Attributes
+    ----------
+    filename: str
+        Definition FullFileName.
+    matrix: np.ndarray
+        4x4 homogeneous matrix in top-level assembly space.
+    files: set
+        Definition files of sub-assembly and everything in it.
+    part_paths: list
+        Occurrence paths of parts in sub-assembly, in export order.
+    assembly_paths: list
+        Occurrence paths of sub-assemblies in sub-assembly.
+    """
+
+    def __init__(self, filename: str, matrix: np.ndarray):
+        """
+        Initialise.
+
+        Args:
+            filename (str): Definition FullFileName.
+            matrix (np.ndarray): 4x4 homogeneous matrix.
+        """
+        self.filename = filename
+        self.matrix = matrix
+        self.files = {filename}
+        self.part_paths = []
+        self.assembly_paths = []
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class ExportSnapshot:
+    """
+    The last export of an assembly keyed by occurrence path.
+
+    A snapshot is built as an assembly is exported. On the next export, parts and
+    whole sub-assemblies whose definition files are unchanged are taken from the
+    previous snapshot, moved by any change in their sub-assembly's placement, and
+    only the rest are queried from Inventor. A file has changed if it is unsaved
+    in Inventor, its modification time or size differ from the last export, or it
+    could not be found on disk.
+
+    Attributes
+    ----------
+    assembly_name: str
+        Top-level assembly FullFileName.
+    fields: list
+        Sorted part fields fetched.
+    records: dict
+        Part records keyed by occurrence path.
+    part_files: dict
+        Part definition files keyed by occurrence path, None if unknown.
+    assemblies: dict
+        AssemblySnapshot keyed by occurrence path.
+    file_keys: dict
+        Modification time and size keyed by definition file.
+    definition_files: dict
+        Files of each traversed sub-assembly definition.
+    changed_files: set
+        Files changed since snapshot, set by find_changed_files.
+    changed_paths: set
+        Occurrence paths of parts that differ from the previous export.
+    reused: int
+        Number of parts taken from snapshot by next export.
+    """
+
+    def __init__(self, assembly_name: str, fields: list):
+        """
+        Initialise.
+
+        Args:
+            assembly_name (str): Top-level assembly FullFileName.
+            fields (list): Part fields fetched.
+        """
+        self.assembly_name = assembly_name
+        self.fields = sorted(fields)
+        self.records = {}
+        self.part_files = {}
+        self.assemblies = {}
+        self.file_keys = {}
+        self.definition_files = {}
+        self.changed_files = set()
+        self.changed_paths = set()
+        self.reused = 0
+        self.add_file(assembly_name)
+
+    def check_matches(self, assembly_name: str, fields: list) -> bool:
+        """
+        Check snapshot is of same assembly and fields.
+
+        Args:
+            assembly_name (str): Top-level assembly FullFileName.
+            fields (list): Part fields fetched.
+
+        Returns:
+            bool: Matches or not.
+        """
+        return assembly_name == self.assembly_name and sorted(fields) == self.fields
+
+    def find_changed_files(self, dirty_files: set):
+        """
+        Find files changed since snapshot.
+
+        Args:
+            dirty_files (set): Files with unsaved changes in Inventor.
+        """
+        self.changed_files = {
+            filename
+            for filename, key in self.file_keys.items()
+            if key is None or filename in dirty_files or get_file_key(filename) != key
+        }
+        logger.info(
+            f"{len(self.changed_files)} of {len(self.file_keys)} files changed "
+            "since last export."
+        )
+
+    def check_changed(self, files) -> bool:
+        """
+        Check if any file has changed since snapshot.
+
+        Args:
+            files: Definition files.
+
+        Returns:
+            bool: Changed or not.
+        """
+        return any(
+            filename in self.changed_files or filename not in self.file_keys
+            for filename in files
+        )
+
+    def check_top_level_changed(self) -> bool:
+        """
+        Check if top-level assembly has changed since snapshot.
+
+        Returns:
+            bool: Changed or not.
+        """
+        return self.check_changed([self.assembly_name])
+
+    def check_rigid(self, occurrence) -> bool:
+        """
+        Check sub-assembly is rigid, so its parts only move with it.
+
+        Args:
+            occurrence: Sub-assembly occurrence.
+
+        Returns:
+            bool: Rigid or not.
+        """
+        try:
+            return not occurrence.Flexible
+        except Exception as e:
+            logger.error(f"Unable to check if occurrence is flexible: {e}")
+            return False
+
+    def get_delta(self, path: tuple, filename: str, matrix: np.ndarray):
+        """
+        Get change in placement of unchanged sub-assembly.
+
+        Args:
+            path (tuple): Occurrence path of sub-assembly.
+            filename (str): Definition FullFileName.
+            matrix (np.ndarray): Current 4x4 homogeneous matrix.
+
+        Returns:
+            np.ndarray: Matrix from previous to current placement, None if
+                sub-assembly definition has changed.
+        """
+        assembly = self.assemblies.get(path)
+        if assembly is None or assembly.filename != filename:
+            return None
+        if self.check_changed([filename]):
+            return None
+        return matrix @ np.linalg.inv(assembly.matrix)
+
+    def get_part(self, path: tuple, filename: str, delta: np.ndarray) -> Part:
+        """
+        Get unchanged part from snapshot.
+
+        Args:
+            path (tuple): Occurrence path of part.
+            filename (str): Definition FullFileName.
+            delta (np.ndarray): Change in placement of parent, None if changed.
+
+        Returns:
+            Part: Part in top-level assembly space, None if changed.
+        """
+        if delta is None or path not in self.records:
+            return None
+        if self.part_files[path] != filename or self.check_changed([filename]):
+            return None
+        part = Part.from_record(self.records[path])
+        transform_part(part, delta)
+        part.occurrence_path = path
+        self.reused += 1
+        return part
+
+    def expand_assembly(self, path: tuple, delta: np.ndarray) -> list:
+        """
+        Get parts of unchanged sub-assembly from snapshot.
+
+        Args:
+            path (tuple): Occurrence path of sub-assembly.
+            delta (np.ndarray): Change in placement, None if changed.
+
+        Returns:
+            list: Parts in top-level assembly space, None if changed.
+        """
+        if delta is None:
+            return None
+        assembly = self.assemblies[path]
+        if self.check_changed(assembly.files):
+            return None
+
+        parts = []
+        for part_path in assembly.part_paths:
+            part = Part.from_record(self.records[part_path])
+            transform_part(part, delta)
+            part.occurrence_path = part_path
+            parts.append(part)
+        self.reused += len(parts)
+        return parts
+
+    def add_file(self, filename: str):
+        """
+        Record modification time and size of file.
+
+        Args:
+            filename (str): Definition FullFileName.
+        """
+        if filename is not None and filename not in self.file_keys:
+            self.file_keys[filename] = get_file_key(filename)
+
+    def get_ancestors(self, path: tuple) -> list:
+        """
+        Get snapshots of sub-assemblies containing path.
+
+        Args:
+            path (tuple): Occurrence path.
+
+        Returns:
+            list: AssemblySnapshot of each ancestor in snapshot.
+        """
+        ancestors = []
+        for depth in range(1, len(path)):
+            assembly = self.assemblies.get(path[:depth])
+            if assembly is not None:
+                ancestors.append(assembly)
+        return ancestors
+
+    def add_part(self, part: Part, filename: str = None, changed: bool = True):
+        """
+        Add exported part.
+
+        Args:
+            part (Part): Part with occurrence path.
+            filename (str): Definition FullFileName, optional.
+            changed (bool): Whether part differs from previous export.
+        """
+        path = part.occurrence_path
+        self.records[path] = part.to_record()
+        self.part_files[path] = filename
+        if changed:
+            self.changed_paths.add(path)
+        self.add_file(filename)
+        for assembly in self.get_ancestors(path):
+            assembly.part_paths.append(path)
+            if filename is not None:
+                assembly.files.add(filename)
+
+    def add_files(self, path: tuple, files: set):
+        """
+        Add definition files to sub-assembly and its ancestors.
+
+        Args:
+            path (tuple): Occurrence path of sub-assembly.
+            files (set): Definition files, None for unknown files.
+        """
+        for assembly in self.get_ancestors(path) + [self.assemblies[path]]:
+            assembly.files.update(files)
+
+    def start_assembly(self, path: tuple, filename: str, matrix: np.ndarray):
+        """
+        Add exported sub-assembly before its parts.
+
+        Args:
+            path (tuple): Occurrence path.
+            filename (str): Definition FullFileName.
+            matrix (np.ndarray): 4x4 homogeneous matrix.
+        """
+        self.add_file(filename)
+        for assembly in self.get_ancestors(path):
+            assembly.assembly_paths.append(path)
+            assembly.files.add(filename)
+        self.assemblies[path] = AssemblySnapshot(filename, matrix)
+
+    def end_assembly(self, path: tuple):
+        """
+        Finish traversed sub-assembly, remembering its files for sub-assemblies
+        expanded from the same definition.
+
+        Args:
+            path (tuple): Occurrence path.
+        """
+        assembly = self.assemblies[path]
+        self.definition_files[assembly.filename] = set(assembly.files)
+
+    def add_expanded_assembly(self, path: tuple):
+        """
+        Add files of sub-assembly expanded from SubAssemblyCache.
+
+        Parts expanded from the cache have no definition file, so the files of the
+        traversed instance are used. Unknown files are recorded as None so the
+        sub-assembly is always treated as changed.
+
+        Args:
+            path (tuple): Occurrence path.
+        """
+        filename = self.assemblies[path].filename
+        self.add_files(path, self.definition_files.get(filename, {None}))
+
+    def copy_assembly(self, previous, path: tuple, delta: np.ndarray):
+        """
+        Copy reused sub-assembly from previous snapshot, before adding its parts.
+
+        Args:
+            previous (ExportSnapshot): Previous snapshot.
+            path (tuple): Occurrence path of reused sub-assembly.
+            delta (np.ndarray): Change in placement.
+        """
+        assembly = previous.assemblies[path]
+        self.add_files(path, assembly.files)
+        for filename in assembly.files:
+            if filename is not None and filename not in self.file_keys:
+                self.file_keys[filename] = previous.file_keys.get(filename)
+
+        # Copy nested sub-assemblies, parts are added afterwards.
+        for nested_path in assembly.assembly_paths:
+            nested = previous.assemblies[nested_path]
+            for ancestor in self.get_ancestors(nested_path):
+                ancestor.assembly_paths.append(nested_path)
+            copied = AssemblySnapshot(nested.filename, delta @ nested.matrix)
+            copied.files = set(nested.files)
+            self.assemblies[nested_path] = copied
@@ -0,0 +1,650 @@
+"""
+FakeBackend is a class for an in-memory Inventor object model with simulated call latency.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import os
+import time
+from collections import Counter
+
+import numpy as np
+
+from .InventorBackend import InventorBackend
+from .OccurrenceEnumerator import PART_DOCUMENT, ASSEMBLY_DOCUMENT
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Latencies below this are busy-waited, as sleep is too coarse.
+SPIN_LATENCY = 0.002
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def wait(seconds: float):
+    """
+    Wait for simulated call latency.
+
+    Args:
+        seconds (float): Time to wait.
+    """
+    if seconds >= SPIN_LATENCY:
+        time.sleep(seconds)
+        return
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class FakeComObject:
+    """
+    An Inventor object whose attribute reads and method calls are counted and
+    delayed by the backend, like calls across COM.
+
+    Attributes
+    ----------
+    _backend: FakeBackend
+        Backend counting calls.
+    _interface: str
+        Inventor interface name, used in call counts.
+    _values: dict
+        Attribute values and methods keyed by name.
+    _lazy: dict
+        Functions creating attribute values on each read, keyed by name.
+    """
+
+    def __init__(self, backend, interface: str, values: dict = None, lazy=None):
+        """
+        Initialise.
+
+        Args:
+            backend (FakeBackend): Backend counting calls.
+            interface (str): Inventor interface name.
+            values (dict): Attribute values and methods, optional.
+            lazy (dict): Functions creating attribute values, optional.
+        """
+        self._backend = backend
+        self._interface = interface
+        self._values = {} if values is None else values
+        self._lazy = {} if lazy is None else lazy
+
+    def __getattr__(self, name: str):
+        # Only called for names not set on object.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in self._values:
+            self._backend.call(self._interface, name)
+            return self._values[name]
+        if name in self._lazy:
+            self._backend.call(self._interface, name)
+            return self._lazy[name]()
+        raise AttributeError(f"{self._interface} has no attribute {name}.")
+
+    def __setattr__(self, name: str, value):
+        # Private names are set on object, others are counted property writes.
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        self._backend.call(self._interface, name)
+        self._values[name] = value
+
+
+class FakeCollection(FakeComObject):
+    """
+    An Inventor collection, iterated one counted call per item.
+    """
+
+    def __init__(self, backend, interface: str, get_items, values=None, lazy=None):
+        """
+        Initialise.
+
+        Args:
+            backend (FakeBackend): Backend counting calls.
+            interface (str): Inventor interface name.
+            get_items: Function creating items on first use.
+            values (dict): Attribute values and methods, optional.
+            lazy (dict): Functions creating attribute values, optional.
+        """
+        super().__init__(backend, interface, values, lazy)
+        self._get_items = get_items
+        self._items = None
+        self._lazy.setdefault("Count", lambda: len(self._get_all()))
+        self._values.setdefault("Item", lambda index: self._get_all()[index - 1])
+
+    def _get_all(self) -> list:
+        if self._items is None:
+            self._items = list(self._get_items())
+        return self._items
+
+    def __iter__(self):
+        for item in self._get_all():
+            self._backend.call(self._interface, "Item")
+            yield item
+
+    def __len__(self) -> int:
+        return len(self._get_all())
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class FakeDefinition:
+    """
+    A part or assembly document of the fake object model.
+
+    Attributes
+    ----------
+    filename: str
+        Document FullFileName.
+    document_type: int
+        Inventor DocumentTypeEnum value.
+    properties: dict
+        Design Tracking Properties values keyed by property name.
+    mass: float
+        Mass in kg, None if unavailable.
+    centre_of_mass: np.ndarray
+        Centre of mass in document coordinates in cm.
+    inertia: np.ndarray
+        3x3 inertia tensor about centre of mass in document axes in kg cm^2.
+    occurrences: list
+        Name, definition filename, 4x4 matrix in cm and flexible flag of each
+        occurrence in an assembly.
+    """
+
+    def __init__(self, filename: str, document_type: int, properties: dict):
+        """
+        Initialise.
+
+        Args:
+            filename (str): Document FullFileName.
+            document_type (int): Inventor DocumentTypeEnum value.
+            properties (dict): Design Tracking Properties values.
+        """
+        self.filename = filename
+        self.document_type = document_type
+        self.properties = properties
+        self.mass = None
+        self.centre_of_mass = np.zeros(3)
+        self.inertia = np.zeros((3, 3))
+        self.occurrences = []
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class FakeBackend(InventorBackend):
+    """
+    An in-memory Inventor for testing and benchmarking without Inventor.
+
+    Documents are added with add_part, add_assembly and add_occurrence, using
+    Inventor's internal units of cm and kg cm^2. Every attribute read and method
+    call on the returned objects is counted in calls and delayed by latency, so
+    exports can be profiled as if Inventor was answering.
+
+    Attributes
+    ----------
+    latency: float
+        Simulated time in seconds taken by each call.
+    definitions: dict
+        FakeDefinition keyed by filename.
+    calls: Counter
+        Number of calls keyed by "Interface.Member".
+    app: FakeComObject
+        Application, set on connect.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Initialise with no documents.
+
+        Args:
+            latency (float): Simulated time taken by each call. Defaults to 0.
+        """
+        self.latency = latency
+        self.definitions = {}
+        self.documents = {}
+        self.component_definitions = {}
+        self.open_documents = []
+        self.calls = Counter()
+        self.app = None
+
+    # - - - - - - - - - - - - - - - -
+    # Methods for building object model.
+
+    def add_part(
+        self,
+        filename: str,
+        part_number: str = "",
+        description: str = "",
+        mass: float = None,
+        centre_of_mass=(0.0, 0.0, 0.0),
+        inertia=None,
+    ) -> FakeDefinition:
+        """
+        Add part document.
+
+        Args:
+            filename (str): Document FullFileName.
+            part_number (str): Part Number property. Defaults to blank.
+            description (str): Description property. Defaults to blank.
+            mass (float): Mass in kg, optional. Mass properties are unavailable
+                if not given.
+            centre_of_mass: Centre of mass in cm. Defaults to origin.
+            inertia: 3x3 inertia tensor about centre of mass in kg cm^2, optional.
+
+        Returns:
+            FakeDefinition: Part definition.
+        """
+        definition = FakeDefinition(
+            filename,
+            PART_DOCUMENT,
+            {"Part Number": part_number, "Description": description},
+        )
+        definition.mass = mass
+        definition.centre_of_mass = np.asarray(centre_of_mass, dtype=np.float64)
+        if inertia is not None:
+            definition.inertia = np.asarray(inertia, dtype=np.float64)
+        self.definitions[filename] = definition
+        return definition
+
+    def add_assembly(
+        self, filename: str, part_number: str = "", description: str = ""
+    ) -> FakeDefinition:
+        """
+        Add empty assembly document.
+
+        Args:
+            filename (str): Document FullFileName.
+            part_number (str): Part Number property. Defaults to blank.
+            description (str): Description property. Defaults to blank.
+
+        Returns:
+            FakeDefinition: Assembly definition.
+        """
+        definition = FakeDefinition(
+            filename,
+            ASSEMBLY_DOCUMENT,
+            {"Part Number": part_number, "Description": description},
+        )
+        self.definitions[filename] = definition
+        return definition
+
+    def add_occurrence(
+        self,
+        assembly_filename: str,
+        definition_filename: str,
+        name: str = None,
+        matrix=None,
+        flexible: bool = False,
+    ):
+        """
+        Add occurrence of document to assembly.
+
+        Args:
+            assembly_filename (str): Assembly FullFileName.
+            definition_filename (str): FullFileName of document placed.
+            name (str): Occurrence name, optional. Defaults to document name and
+                a count, e.g. "Bolt:2".
+            matrix: 4x4 matrix with translation in cm, optional. Defaults to
+                identity.
+            flexible (bool): Whether sub-assembly is flexible. Defaults to False.
+        """
+        occurrences = self.definitions[assembly_filename].occurrences
+        if name is None:
+            stem = os.path.splitext(os.path.basename(definition_filename))[0]
+            count = sum(
+                occurrence[1] == definition_filename for occurrence in occurrences
+            )
+            name = f"{stem}:{count + 1}"
+        matrix = np.eye(4) if matrix is None else np.asarray(matrix, np.float64)
+        occurrences.append((name, definition_filename, matrix, flexible))
+
+    # - - - - - - - - - - - - - - - -
+    # Methods for counting calls.
+
+    def call(self, interface: str, member: str):
+        """
+        Count call and wait for simulated latency.
+
+        Args:
+            interface (str): Inventor interface name.
+            member (str): Attribute or method name.
+        """
+        self.calls[f"{interface}.{member}"] += 1
+        if self.latency > 0:
+            wait(self.latency)
+
+    @property
+    def call_count(self) -> int:
+        """
+        Total number of calls.
+        """
+        return sum(self.calls.values())
+
+    def reset_calls(self):
+        """
+        Reset call counts.
+        """
+        self.calls.clear()
+
+    # - - - - - - - - - - - - - - - -
+    # InventorBackend methods.
+
+    def connect(self, visible: bool = True):
+        """
+        Create application.
+
+        Args:
+            visible (bool): Show Inventor window, or None to leave it unchanged.
+                Defaults to True.
+
+        Returns:
+            FakeComObject: Application.
+        """
+        if self.app is None:
+            self.app = FakeComObject(
+                self,
+                "Application",
+                {
+                    "Documents": FakeCollection(
+                        self,
+                        "Documents",
+                        lambda: self.open_documents,
+                        {"Open": self.open},
+                    ),
+                    "ApplicationEvents": FakeComObject(self, "ApplicationEvents"),
+                    "FileAccessEvents": FakeComObject(self, "FileAccessEvents"),
+                    "Quit": lambda: None,
+                },
+                {"ActiveDocument": self.get_active_document},
+            )
+        if visible is not None:
+            self.app.Visible = visible
+        return self.app
+
+    def cast(self, document, interface: str):
+        """
+        Cast document, fake documents have every interface.
+
+        Args:
+            document: Document.
+            interface (str): Interface name.
+
+        Returns:
+            Document.
+        """
+        return document
+
+    def with_events(self, source, handler_class):
+        """
+        Create event handler, fake objects raise no events.
+
+        Args:
+            source: Event source.
+            handler_class: Handler class.
+
+        Returns:
+            Handler instance.
+        """
+        return handler_class()
+
+    # - - - - - - - - - - - - - - - -
+    # Methods for creating objects.
+
+    def open(self, filename: str, visible: bool = True):
+        """
+        Open document, as Documents.Open.
+
+        Args:
+            filename (str): Document FullFileName.
+            visible (bool): Open document in a window.
+
+        Returns:
+            FakeComObject: Document.
+        """
+        if filename not in self.definitions:
+            raise FileNotFoundError(f"No fake document {filename}.")
+        document = self.get_document(filename)
+        if document not in self.open_documents:
+            self.open_documents.append(document)
+        return document
+
+    def close(self, document):
+        """
+        Close document, as Document.Close.
+
+        Args:
+            document: Document.
+        """
+        if document in self.open_documents:
+            self.open_documents.remove(document)
+
+    def get_active_document(self):
+        """
+        Get most recently opened document.
+
+        Returns:
+            FakeComObject: Document, None if no documents open.
+        """
+        return self.open_documents[-1] if self.open_documents else None
+
+    def get_document(self, filename: str) -> FakeComObject:
+        """
+        Get document, one object per file.
+
+        Args:
+            filename (str): Document FullFileName.
+
+        Returns:
+            FakeComObject: Document.
+        """
+        if filename in self.documents:
+            return self.documents[filename]
+
+        definition = self.definitions[filename]
+        properties = FakeComObject(
+            self,
+            "PropertySet",
+            {
+                "Item": lambda name: FakeComObject(
+                    self, "Property", {"Value": definition.properties.get(name, "")}
+                )
+            },
+        )
+        document = FakeComObject(
+            self,
+            "Document",
+            {
+                "FullFileName": filename,
+                "DisplayName": os.path.basename(filename),
+                "DocumentType": definition.document_type,
+                "Dirty": False,
+                "PropertySets": FakeComObject(
+                    self, "PropertySets", {"Item": lambda name: properties}
+                ),
+            },
+            {"ComponentDefinition": lambda: self.get_component_definition(filename)},
+        )
+        document._values["Close"] = lambda skip_save=False: self.close(document)
+        self.documents[filename] = document
+        return document
+
+    def get_component_definition(self, filename: str) -> FakeComObject:
+        """
+        Get component definition of document, in its own coordinates.
+
+        Args:
+            filename (str): Document FullFileName.
+
+        Returns:
+            FakeComObject: Component definition.
+        """
+        if filename not in self.component_definitions:
+            self.component_definitions[filename] = FakeComObject(
+                self,
+                "ComponentDefinition",
+                {"Document": self.get_document(filename)},
+                {
+                    "Occurrences": lambda: self.create_occurrences(filename, None),
+                    "MassProperties": lambda: self.create_mass_properties(
+                        self.definitions[filename], np.eye(4)
+                    ),
+                },
+            )
+        return self.component_definitions[filename]
+
+    def create_occurrences(self, filename: str, parent) -> FakeCollection:
+        """
+        Create occurrences of assembly.
+
+        Args:
+            filename (str): Assembly FullFileName.
+            parent: Occurrence of assembly, None for top-level assembly.
+
+        Returns:
+            FakeCollection: Occurrences.
+        """
+        occurrences = self.definitions[filename].occurrences
+        collection = FakeCollection(
+            self,
+            "ComponentOccurrences",
+            lambda: [
+                self.create_occurrence(occurrence, parent) for occurrence in occurrences
+            ],
+        )
+        collection._lazy["AllLeafOccurrences"] = lambda: FakeCollection(
+            self, "ComponentOccurrencesEnumerator", lambda: self.get_leaves(collection)
+        )
+        return collection
+
+    def get_leaves(self, occurrences) -> list:
+        """
+        Get part occurrences below occurrences, in traversal order.
+
+        Args:
+            occurrences (FakeCollection): Occurrences.
+
+        Returns:
+            list: Leaf occurrences.
+        """
+        leaves = []
+        stack = list(reversed(occurrences._get_all()))
+        while stack:
+            occurrence = stack.pop()
+            children = occurrence._lazy.get("SubOccurrences")
+            if occurrence._values["DefinitionDocumentType"] == PART_DOCUMENT:
+                leaves.append(occurrence)
+            elif children is not None:
+                stack.extend(reversed(children()._get_all()))
+        return leaves
+
+    def create_occurrence(self, occurrence: tuple, parent) -> FakeComObject:
+        """
+        Create occurrence in top-level assembly space.
+
+        Args:
+            occurrence (tuple): Name, definition filename, matrix and flexible
+                flag.
+            parent: Occurrence of assembly, None for top-level assembly.
+
+        Returns:
+            FakeComObject: Occurrence.
+        """
+        name, filename, matrix, flexible = occurrence
+        definition = self.definitions[filename]
+        world = matrix if parent is None else parent._world @ matrix
+
+        result = FakeComObject(
+            self,
+            "ComponentOccurrence",
+            {
+                "Name": name,
+                "Definition": self.get_component_definition(filename),
+                "DefinitionDocumentType": definition.document_type,
+                "Flexible": flexible,
+            },
+            {
+                "Transformation": lambda: FakeComObject(
+                    self,
+                    "Matrix",
+                    {
+                        "Cell": lambda row, column: float(world[row - 1, column - 1]),
+                        "GetMatrixData": lambda data: tuple(world.ravel().tolist()),
+                    },
+                ),
+                "OccurrencePath": lambda: FakeCollection(
+                    self, "ComponentOccurrencesEnumerator", lambda: result._path
+                ),
+                "MassProperties": lambda: self.create_mass_properties(
+                    definition, world
+                ),
+            },
+        )
+        result._world = world
+        result._path = ([] if parent is None else parent._path) + [result]
+        if definition.document_type == ASSEMBLY_DOCUMENT:
+            result._lazy["SubOccurrences"] = lambda: self.create_occurrences(
+                filename, result
+            )
+        else:
+            result._lazy["SubOccurrences"] = lambda: FakeCollection(
+                self, "ComponentOccurrencesEnumerator", list
+            )
+        return result
+
+    def create_mass_properties(self, definition: FakeDefinition, world: np.ndarray):
+        """
+        Create mass properties of part placed in top-level assembly space.
+
+        Args:
+            definition (FakeDefinition): Part definition.
+            world (np.ndarray): 4x4 matrix of placement in cm.
+
+        Returns:
+            FakeComObject: Mass properties.
+        """
+        if definition.mass is None:
+            raise RuntimeError(
+                f"Mass properties unavailable for {definition.filename}."
+            )
+
+        # Move centre of mass and rotate inertia into assembly space.
+        rotation = world[:3, :3]
+        centre = rotation @ definition.centre_of_mass + world[:3, 3]
+        tensor = rotation @ definition.inertia @ rotation.T
+        moments = (
+            tensor[0, 0],
+            tensor[1, 1],
+            tensor[2, 2],
+            -tensor[0, 1],
+            -tensor[1, 2],
+            -tensor[0, 2],
+        )
+        return FakeComObject(
+            self,
+            "MassProperties",
+            {
+                "Mass": definition.mass,
+                "CenterOfMass": FakeComObject(
+                    self,
+                    "Point",
+                    {
+                        "X": float(centre[0]),
+                        "Y": float(centre[1]),
+                        "Z": float(centre[2]),
+                    },
+                ),
+                "XYZMoments": lambda: tuple(float(value) for value in moments),
+            },
+        )
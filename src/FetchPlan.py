@@ -0,0 +1,72 @@
+"""
+FetchPlan is a class describing which part fields to fetch from Inventor.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+
+from .MassPropertiesReader import MassPropertiesReader
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class FetchPlan:
+    """
+    A plan of part fields to fetch, built from the selected options.
+
+    Attributes
+    ----------
+    fields: set
+        Fields to fetch, from FIELDS.
+    accuracy: str
+        Accuracy level of mass properties, from ACCURACY_LEVELS of
+        MassPropertiesReader. None keeps each document's level.
+    mass_reader: MassPropertiesReader
+        Reader of mass properties in plan, shared by every part fetched with
+        the plan so its fetches are counted per export.
+    """
+
+    FIELDS = ["part_number", "part_name", "mass", "centre_of_mass", "inertia"]
+
+    def __init__(self, fields: list = None, accuracy: str = None):
+        """
+        Initialise.
+
+        Args:
+            fields (list): Fields to fetch, optional. Defaults to all fields.
+            accuracy (str): Accuracy level of mass properties, optional.
+        """
+        self.fields = set(self.FIELDS if fields is None else fields)
+        self.accuracy = accuracy
+
+        # Check valid fields.
+        unknown_fields = self.fields.difference(self.FIELDS)
+        if unknown_fields:
+            raise ValueError(f"Unknown fields to fetch: {sorted(unknown_fields)}")
+        self.mass_reader = MassPropertiesReader.from_fetch_plan(self)
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.fields
+
+    @classmethod
+    def from_column_plan(cls, column_plan, accuracy: str = None):
+        """
+        Create fetch plan of the fields needed for columns.
+
+        Args:
+            column_plan (ColumnPlan): Columns to export.
+            accuracy (str): Accuracy level of mass properties, optional.
+
+        Returns:
+            FetchPlan: Fetch plan.
+        """
+        logger.info(f"Fetching part fields: {sorted(column_plan.required_fields)}")
+        return cls(column_plan.required_fields, accuracy)
@@ -0,0 +1,89 @@
+"""
+HtmlReportWriter is a module for streaming parts lists as HTML.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+from html import escape
+
+from .ColumnPlan import ColumnPlan
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+# Number of rows joined into each chunk.
+CHUNK_ROWS = 500
+
+HTML_HEADER = """<html>
+            <head>
+            <title>PARTS LIST</title>
+            </head>
+            <body>
+            """
+
+HTML_FOOTER = """
+            </body>
+            </html>
+        """
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def iter_html_parts_list(parts_list, column_plan: ColumnPlan, summary=None):
+    """
+    Generate HTML parts list in chunks.
+
+    Args:
+        parts_list: PartTable, or iterable of parts.
+        column_plan (ColumnPlan): Columns to write.
+        summary (MassSummary): Summary shown after table, optional.
+
+    Yields:
+        str: Chunk of HTML content.
+    """
+    # Create table heading.
+    heading = "".join(
+        f"<th>{escape(str(name))}</th>" for name in column_plan.display_names
+    )
+    yield f"{HTML_HEADER}<table><tr>{heading}</tr>"
+
+    # Add table content.
+    rows = []
+    for texts in column_plan.iter_formatted_rows(parts_list):
+        cells = "</td><td>".join(escape(text) for text in texts)
+        rows.append(f"<tr><td>{cells}</td></tr>")
+        if len(rows) >= CHUNK_ROWS:
+            yield "".join(rows)
+            rows = []
+    if rows:
+        yield "".join(rows)
+
+    # Add summary after table.
+    summary_html = "" if summary is None else summary.to_html()
+    yield f"</table>{summary_html}{HTML_FOOTER}"
+
+
+def write_html_parts_list(f, parts_list, column_plan: ColumnPlan, summary=None) -> int:
+    """
+    Write HTML parts list to file as it is generated.
+
+    Args:
+        f: File open for writing.
+        parts_list: PartTable, or iterable of parts.
+        column_plan (ColumnPlan): Columns to write.
+        summary (MassSummary): Summary shown after table, optional.
+
+    Returns:
+        int: Number of characters written.
+    """
+    written = 0
+    for chunk in iter_html_parts_list(parts_list, column_plan, summary):
+        written += f.write(chunk)
+    return written
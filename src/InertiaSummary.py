@@ -0,0 +1,134 @@
+"""
+InertiaSummary is a class for the inertia tensor of a parts list about its centre of mass.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+from html import escape
+
+import numpy as np
+
+from .PartTable import PartTable
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+AXES = ["x_axis", "y_axis", "z_axis"]
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class InertiaSummary:
+    """
+    Inertia tensor of a parts list about its overall centre of mass.
+
+    Each part's principal moments and axes are rotated into assembly axes and moved
+    to the overall centre of mass with the parallel axis theorem, as one batched
+    reduction over all parts. Parts with a mass and centre of mass but no inertia
+    are included as point masses.
+
+    Attributes
+    ----------
+    included_parts: int
+        Number of parts with mass and centre of mass.
+    missing_inertia: int
+        Number of included parts without principal moments.
+    centre_of_mass: list
+        Overall centre of mass in mm, None if no included mass.
+    tensor: list
+        3x3 inertia tensor about centre of mass in kg mm^2, None if no included mass.
+    principal_moments: list
+        Principal moments of tensor in ascending order.
+    principal_axes: list
+        Principal axes of tensor as rows, matching principal_moments.
+    """
+
+    def __init__(self, table: PartTable):
+        """
+        Initialise.
+
+        Args:
+            table (PartTable): Parts list.
+        """
+        mass = table.get_column("mass")
+        points = np.column_stack([table.get_column(axis) for axis in AXES])
+        moments = table.get_column("principal_moments")
+        axes = table.get_column("principal_axes")
+
+        # Use parts with mass and centre of mass.
+        included = ~(np.isnan(mass) | np.isnan(points).any(axis=1))
+        mass = mass[included]
+        points = points[included]
+        has_inertia = ~np.isnan(moments[included]).any(axis=1)
+        self.included_parts = int(np.count_nonzero(included))
+        self.missing_inertia = self.included_parts - int(np.count_nonzero(has_inertia))
+
+        self.centre_of_mass = None
+        self.tensor = None
+        self.principal_moments = None
+        self.principal_axes = None
+        total_mass = mass.sum()
+        if total_mass <= 0:
+            return
+        centre = mass @ points / total_mass
+
+        # Sum part tensors about their own centres, A^T diag(I) A in assembly axes.
+        part_axes = axes[included][has_inertia]
+        part_moments = moments[included][has_inertia]
+        tensor = np.einsum("nji,nj,njk->ik", part_axes, part_moments, part_axes)
+
+        # Move each part to overall centre of mass, m (|d|^2 E - d d^T).
+        offsets = points - centre
+        tensor += (mass @ (offsets * offsets).sum(axis=1)) * np.eye(3)
+        tensor -= np.einsum("n,ni,nj->ij", mass, offsets, offsets)
+
+        principal_moments, principal_axes = np.linalg.eigh(tensor)
+        self.centre_of_mass = centre.tolist()
+        self.tensor = tensor.tolist()
+        self.principal_moments = principal_moments.tolist()
+        self.principal_axes = principal_axes.T.tolist()
+
+    def get_rows(self) -> list:
+        """
+        Get principal moments as label and value pairs.
+
+        Returns:
+            list: Label and value for each summary row.
+        """
+        rows = [("Parts without inertia", self.missing_inertia)]
+        if self.principal_moments is not None:
+            for index, moment in enumerate(self.principal_moments, start=1):
+                rows.append((f"Principal moment {index} (kg mm^2)", moment))
+        return rows
+
+    def to_html(self) -> str:
+        """
+        Get inertia tensor as HTML table.
+
+        Returns:
+            str: HTML content.
+        """
+        if self.tensor is None:
+            return "<h3>Inertia</h3><p>No parts with mass and centre of mass.</p>"
+
+        heading = "<tr><th>kg mm^2</th><th>X</th><th>Y</th><th>Z</th></tr>"
+        rows = "".join(
+            f"<tr><th>{label}</th>"
+            + "".join(f"<td>{value}</td>" for value in row)
+            + "</tr>"
+            for label, row in zip("XYZ", self.tensor)
+        )
+        principal = "".join(f"<td>{value}</td>" for value in self.principal_moments)
+        missing = escape(f"Parts without inertia: {self.missing_inertia}")
+        return (
+            "<h3>Inertia Tensor About Centre Of Mass</h3>"
+            f"<table>{heading}{rows}<tr><th>Principal</th>{principal}</tr></table>"
+            f"<p>{missing}</p>"
+        )
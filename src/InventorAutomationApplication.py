@@ -6,46 +6,110 @@ Created on Monday 9th June 2025.
 
 """
 
-from tkinter import Tk, Text, END, messagebox, Toplevel
+from tkinter import Tk, Text, END, messagebox, Toplevel, BooleanVar
 from tkinter.filedialog import askopenfilename, asksaveasfile
-import win32com.client
 import logging.config
 import time
 from datetime import datetime
 import json
 import os
+import numpy as np
 import pandas as pd
+from concurrent.futures import Future
 
 from .MainWindow import MainWindow, CheckButtonFrame
 from .Part import Part
+from .PropertyCache import PropertyCache
+from .FetchPlan import FetchPlan
+from .OccurrenceEnumerator import (
+    OccurrenceEnumerator,
+    PART_DOCUMENT,
+    ASSEMBLY_DOCUMENT,
+)
+from .SubAssemblyCache import SubAssemblyCache, get_transformation_matrix
 from .ProgressBarWindow import ProgressBarWindow
+from .ComWorker import ComWorker
+from .InventorBackend import InventorBackend, get_default_backend, log_call_count
+from .ExportProgress import ExportProgress
+from .ExportJournal import ExportJournal
+from .DocumentTracker import DocumentTracker, ApplicationEventsHandler
+from .HtmlReportWriter import write_html_parts_list
+from .ColumnPlan import ColumnPlan, Column
+from .PartTable import PartTable
+from .MassSummary import MassSummary
+from .PartCache import PartCache
+from .ExportSnapshot import ExportSnapshot, get_dirty_files, check_moved
+from .MassRefiner import MassRefiner, REFINED_FIELDS
+from .PartStream import PartStream
 
 # - - - - - - - - - - - - - - - - - - - - -
 
 global logger
 logger = logging.getLogger()
 
+# Part cache kept between runs.
+PART_CACHE_FILENAME = "cache/part_cache.sqlite"
+
+# Time between batches of parts shown while exporting in ms.
+STREAM_INTERVAL = 100
+
 # - - - - - - - - - - - - - - - - - - - - -
 
 
 class InventorAutomationApplication:
-    def __init__(self):
+    def __init__(
+        self,
+        log_path: str = None,
+        part_cache_filename: str = None,
+        backend: InventorBackend = None,
+    ):
         """
         Class for managing automation of Inventor.
 
+        Args:
+            log_path (str): Log directory for current run, optional. Exports are
+                only journalled and resumable when provided.
+            part_cache_filename (str): Part cache database, optional. Part
+                properties are only kept between runs when provided.
+            backend (InventorBackend): Inventor backend, optional. Defaults to COM.
+
         Attributes:
-        app : win32com.client.Dispatch
+        app :
             Inventor Application
+        backend : InventorBackend
+            Backend for connecting to Inventor, opening documents and events.
         root :
             Window for tkinter UI.
+        com_worker : ComWorker
+            Worker thread for all Inventor access.
         """
         self.app = None  # Inventor Application
+        self.log_path = log_path  # Log directory for export journals.
         self.root = None  # Tkinter window.
-        self.recent_html_preview = None  # HTML preview.
+        self.recent_parts_list = None  # Most recent parts list.
+        self.recent_selected_options = None  # Options for recent parts list.
+        self.column_plans = {}  # Column plans keyed by selected options.
+        self.recent_summary = None  # Summary of recent parts list.
+        self.export_snapshot = None  # Last export, for re-exporting changes only.
         self.assembly_doc = None  # Assembly doc.
+        self.memoize_sub_assemblies = True  # Expand repeated sub-assemblies once.
+        self.enumeration_strategy = "iterative"  # Occurrence enumeration strategy.
+        self.preview_accuracy = "low"  # Mass accuracy of preview, None for one pass.
+        self.refined_accuracy = "high"  # Mass accuracy rows are refined to.
+        self.refiner = None  # Refinement of recent parts list in progress.
+        self.export_future = None  # Export in progress.
+
+        # Part cache is opened on first export, from worker.
+        self.part_cache = None
+        if part_cache_filename:
+            self.part_cache = PartCache(part_cache_filename)
+
+        # Start worker for Inventor access.
+        self.backend = get_default_backend() if backend is None else backend
+        self.com_worker = ComWorker(backend=self.backend)
 
         # Connect to Inventor application.
-        ret = self.connect_to_inventor()
+        ret = self.com_worker.submit(self.connect_to_inventor).result()
         if not ret:
             logger.error("Failed to connect to Inventor application.")
         else:
@@ -57,14 +121,32 @@ class InventorAutomationApplication:
         # Set flag for updating file name.
         self.update_file_name_flag = True
 
+        # Track active document changes from Inventor events.
+        self.document_tracker = DocumentTracker()
+        self.application_events = None
+
     def run(self):
         """
         Running Inventor Automation Application.
         """
-        # Start update file loop.
+        # Track file name from events, polling if unavailable.
+        ret = self.com_worker.submit(
+            self.add_application_events_handler, ApplicationEventsHandler
+        ).result()
         self.update_file_name()
+        if ret:
+            self.poll_document_events()
+        else:
+            logger.warning("Document events unavailable, polling active document.")
+            self.poll_file_name()
+
         # Run user interface.
         self.root.mainloop()
+        # Stop refinement, close part cache and stop worker.
+        self.cancel_refinement()
+        if self.part_cache is not None:
+            self.com_worker.submit(self.part_cache.close).result()
+        self.com_worker.stop()
 
     # - - - - - - - - - - - - - - - -
     # Methods for managing Inventor application connection
@@ -77,9 +159,7 @@ class InventorAutomationApplication:
             bool: True if connection is successful, False otherwise.
         """
         try:
-            self.app = win32com.client.Dispatch("Inventor.Application")
-            self.app.Visible = True
-
+            self.app = self.backend.connect()
             return True
         except Exception as e:
             logger.error(f"Error connecting to Inventor: {e}")
@@ -111,11 +191,33 @@ class InventorAutomationApplication:
         try:
             # Set file access events.
             file_access_events = self.app.FileAccessEvents
-            win32com.client.WithEvents(file_access_events, file_access_handler)
+            self.backend.with_events(file_access_events, file_access_handler)
             return True
         except Exception as e:
             logger.error(f"Error adding file access handler: {e}")
 
+    def add_application_events_handler(self, application_events_handler) -> bool:
+        """
+        Add handler for application events, run on worker.
+
+        Args:
+            application_events_handler: Handler class for application events.
+
+        Returns:
+            bool: True if added successfully, False otherwise.
+        """
+        try:
+            # Set application events.
+            application_events = self.app.ApplicationEvents
+            self.application_events = self.backend.with_events(
+                application_events, application_events_handler
+            )
+            self.application_events.tracker = self.document_tracker
+            return True
+        except Exception as e:
+            logger.error(f"Error adding application events handler: {e}")
+            return False
+
     # - - - - - - - - - - - - - - - -
     # Methods for managing user interface.
 
@@ -151,19 +253,25 @@ class InventorAutomationApplication:
 
         Args:
             name (str): Progress bar name/
+
+        Returns:
+            ExportProgress: Progress shown by progress bar.
         """
         # Create new window.
         self.subwindow = Toplevel(self.root, takefocus=True)
         self.subwindow.title(name)
-        self.subwindow.geometry("300x150")
+        self.subwindow.geometry("300x210")
         self.subwindow.resizable(False, False)
 
         # Create progress bar.
         self.progress_bar = ProgressBarWindow(self.subwindow, name)
         self.progress_bar.pack()
 
-        # Update subwindow.
-        self.subwindow.update()
+        # Track progress, cancelling if window closed.
+        progress = ExportProgress()
+        self.progress_bar.track(progress)
+        self.subwindow.protocol("WM_DELETE_WINDOW", progress.cancel)
+        return progress
 
     def get_option_variables(self, checkbutton_frame: CheckButtonFrame) -> list:
         """
@@ -181,27 +289,49 @@ class InventorAutomationApplication:
                 selected_variables.append(variable)
         return selected_variables
 
+    def poll_document_events(self, interval: int = 100):
+        """
+        Update file name once document events have settled.
+
+        Args:
+            interval (int): Time between checks in ms. Defaults to 100.
+        """
+        # Leave settled events pending while file name updates are disabled.
+        if self.update_file_name_flag and self.document_tracker.check():
+            self.update_file_name()
+        self.root.after(interval, self.poll_document_events, interval)
+
+    def poll_file_name(self):
+        """
+        Update file name every second, used when document events are unavailable.
+        """
+        self.update_file_name()
+        self.root.after(1000, self.poll_file_name)
+
     def update_file_name(self):
         """
         Updating file name.
         """
-        # Flag for stopping.
+        # Skip while selecting file.
         if not self.update_file_name_flag:
             return
 
-        # Check for active document.
-        if not self.check_active_document():
-            document_name = "None"
-        else:
-            # Get active document name.
-            document_name = self.app.ActiveDocument.FullFileName
+        # Check active document on worker.
+        future = self.com_worker.submit(self.sync_active_document)
+        self.poll_future(future, self.show_file_name)
 
-            # Select document.
-            if (
-                self.assembly_doc is None
-                or document_name != self.assembly_doc.FullFileName
-            ):
-                self.select_file(document_name, suppress_message=True)
+    def show_file_name(self, future: Future):
+        """
+        Show active document name.
+
+        Args:
+            future (Future): Future for active document name.
+        """
+        try:
+            document_name = future.result()
+        except Exception as e:
+            logger.error(f"Error checking active document: {e}")
+            document_name = "None"
 
         # Update file name widget.
         text_var = self.main_window.left_side_frame.file_label
@@ -210,8 +340,34 @@ class InventorAutomationApplication:
         text_var.insert(END, document_name.split("\\")[-1])
         text_var.configure(state="disabled")
 
-        # Repeat every second.
-        self.root.after(1000, self.update_file_name)
+    def poll_future(self, future: Future, callback, interval: int = 50):
+        """
+        Call callback on UI thread once future is done.
+
+        Args:
+            future (Future): Future to poll.
+            callback: Function taking finished future.
+            interval (int): Time between checks in ms. Defaults to 50.
+        """
+        if future.done():
+            callback(future)
+        else:
+            self.root.after(interval, self.poll_future, future, callback, interval)
+
+    def wait_for_result(self, future: Future):
+        """
+        Wait for future while keeping UI responsive.
+
+        Args:
+            future (Future): Future to wait for.
+
+        Returns:
+            Result of future.
+        """
+        done = BooleanVar(self.root)
+        self.poll_future(future, lambda future: done.set(True))
+        self.root.wait_variable(done)
+        return future.result()
 
     # - - - - - - - - - - - - - - - -
     # Methods for using Inventor.
@@ -232,6 +388,10 @@ class InventorAutomationApplication:
         Returns:
             bool: Successful or not.
         """
+        # Keep assembly of export in progress.
+        if self.check_export_running():
+            return False, None
+
         # Disable update file name.
         self.update_file_name_flag = False
 
@@ -247,33 +407,62 @@ class InventorAutomationApplication:
             )
 
         # Open file.
-        try:
-            # Open document.
-            self.doc = self.app.Documents.Open(filename, True)
-            logger.info(f"Selected document: {filename}")
-            if self.doc.DocumentType == 12291:
-                self.assembly_doc = win32com.client.CastTo(self.doc, "AssemblyDocument")
-            else:
-                self.assembly_doc = win32com.client.CastTo(self.doc, "PartDocument")
+        ret = self.wait_for_result(self.com_worker.submit(self.open_document, filename))
 
-            # Update text variable.
-            if text_var:
-                text_var.configure(state="normal")
-                text_var.delete("1.0", END)
-                text_var.insert(END, filename.split("/")[-1])
-                text_var.configure(state="disabled")
+        # Update text variable.
+        if ret and text_var:
+            text_var.configure(state="normal")
+            text_var.delete("1.0", END)
+            text_var.insert(END, filename.split("/")[-1])
+            text_var.configure(state="disabled")
 
-            # Re-enable update file name flag.
-            self.update_file_name_flag = True
+        # Re-enable update file name flag.
+        self.update_file_name_flag = True
 
+        if ret:
             return True, filename
+        else:
+            return False, None
+
+    def open_document(self, filename: str) -> bool:
+        """
+        Open document in Inventor, run on worker.
+
+        Args:
+            filename (str): Filename.
+
+        Returns:
+            bool: Successful or not.
+        """
+        try:
+            # Open document.
+            self.doc, self.assembly_doc = self.backend.open_document(
+                self.app, filename, True
+            )
+            logger.info(f"Selected document: {filename}")
+            return True
         except Exception as e:
             logger.error(f"Error selecting document '{filename}': {e}")
-            # Re-enable update file name flag.
-            self.update_file_name_flag = True
-            self.update_file_name()
+            return False
 
-            return False, None
+    def sync_active_document(self) -> str:
+        """
+        Open active document if changed, run on worker.
+
+        Returns:
+            str: Active document name, "None" if no active document.
+        """
+        # Check for active document.
+        if not self.check_active_document():
+            return "None"
+
+        # Get active document name.
+        document_name = self.app.ActiveDocument.FullFileName
+
+        # Select document.
+        if self.assembly_doc is None or document_name != self.assembly_doc.FullFileName:
+            self.open_document(document_name)
+        return document_name
 
     def export_parts_list(
         self, file_text: Text, checkbox_frame: CheckButtonFrame
@@ -288,6 +477,10 @@ class InventorAutomationApplication:
         Return:
             bool: Successful or not.
         """
+        # Only run one export at a time.
+        if self.check_export_running():
+            return False
+
         # Check valid file open.
         if file_text.get("1.0", "1.4") == "None":
             messagebox.showerror(
@@ -307,19 +500,265 @@ class InventorAutomationApplication:
             )
             return False
 
+        # Stop refining last export, its rows may be replaced.
+        self.cancel_refinement()
+
         # Display progress bar.
-        self.display_progress_bar("Exporting parts list...")
+        progress = self.display_progress_bar("Exporting parts list...")
+
+        # Get parts list on worker, showing parts in preview as they are found.
+        stream = PartStream()
+        future = self.com_worker.submit(
+            self.collect_parts, selected_options, progress, stream.parts_list
+        )
+        self.export_future = future
+        self.main_window.left_side_frame.set_buttons_enabled(False)
+        self.poll_export(future, stream, selected_options, progress)
+        return True
+
+    def check_export_running(self) -> bool:
+        """
+        Check if an export is in progress.
+
+        Returns:
+            bool: Export future is pending.
+        """
+        if self.export_future is None:
+            return False
+        logger.info("Export in progress, ignoring request.")
+        return True
+
+    def poll_export(
+        self,
+        future: Future,
+        stream: PartStream,
+        selected_options: list,
+        progress: ExportProgress,
+        interval: int = STREAM_INTERVAL,
+    ):
+        """
+        Show parts found so far in preview until export is done.
+
+        Args:
+            future (Future): Future for parts table.
+            stream (PartStream): Parts found by export.
+            selected_options (list): Options to export.
+            progress (ExportProgress): Progress of export.
+            interval (int): Time between batches in ms. Defaults to
+                STREAM_INTERVAL.
+        """
+        if future.done():
+            self.finish_export(future, selected_options, progress, stream)
+            return
+
+        if stream.take():
+            self.show_stream(stream, selected_options)
+        self.root.after(
+            interval,
+            self.poll_export,
+            future,
+            stream,
+            selected_options,
+            progress,
+            interval,
+        )
+
+    def show_stream(self, stream: PartStream, selected_options: list):
+        """
+        Show parts found so far and their summary in preview.
+
+        Args:
+            stream (PartStream): Parts found by export.
+            selected_options (list): Options to export.
+        """
+        column_plan = self.get_column_plan(selected_options)
+        summary = MassSummary(stream.table, "inertia" in column_plan.required_fields)
+        status = f"Exporting parts list, {len(stream)} parts found so far..."
+
+        # Open preview of stream on first batch.
+        right_side_frame = self.main_window.right_side_frame
+        view = right_side_frame.view
+        if view is None or view.table is not stream.table:
+            right_side_frame.show_parts(stream.table, column_plan, summary, status)
+        else:
+            right_side_frame.update_rows(summary, status)
+
+    def collect_parts(
+        self,
+        selected_options: list,
+        progress: ExportProgress,
+        all_parts: list = None,
+    ) -> PartTable:
+        """
+        Get parts list of current assembly file, run on worker.
+
+        Args:
+            selected_options (list): Options to export.
+            progress (ExportProgress): Progress of export.
+            all_parts (list): List parts are appended to as they are found,
+                optional.
 
-        # Get parts list of current assembly file.
+        Returns:
+            PartTable: Parts list.
+        """
         occurrences = self.assembly_doc.ComponentDefinition.Occurrences
-        all_parts = []
-        self.get_part_occurrences(occurrences, all_parts, self.progress_bar)
+        if all_parts is None:
+            all_parts = []
+        property_cache = PropertyCache()
+        sub_assembly_cache = SubAssemblyCache() if self.memoize_sub_assemblies else None
+        enumerator = OccurrenceEnumerator(self.enumeration_strategy)
+        fetch_plan = FetchPlan.from_column_plan(
+            self.get_column_plan(selected_options), self.preview_accuracy
+        )
+
+        # Open journal, resuming previous export if incomplete.
+        journal = None
+        if self.log_path:
+            journal = ExportJournal.open(
+                self.log_path, self.assembly_doc.FullFileName, fetch_plan.fields
+            )
+
+        # Compare with last export of same assembly to skip unchanged occurrences.
+        assembly_name = self.assembly_doc.FullFileName
+        previous = self.export_snapshot
+        if previous is not None and not previous.check_matches(
+            assembly_name, fetch_plan.fields
+        ):
+            previous = None
+        if previous is not None:
+            previous.find_changed_files(get_dirty_files(self.app))
+        snapshot = ExportSnapshot(assembly_name, fetch_plan.fields)
+
+        start_calls = self.backend.call_count
+        start_time = time.perf_counter()
+        try:
+            self.get_part_occurrences(
+                occurrences,
+                all_parts,
+                progress,
+                property_cache,
+                sub_assembly_cache,
+                enumerator,
+                fetch_plan,
+                journal,
+                self.part_cache,
+                previous,
+                snapshot,
+            )
+        except Exception:
+            # Leave journal incomplete so export can be resumed.
+            if journal is not None:
+                journal.close()
+            raise
+
+        # Only complete journal if all occurrences processed.
+        if journal is not None:
+            if progress.cancelled:
+                journal.close()
+            else:
+                journal.complete()
+        logger.info(
+            f"Traversed {enumerator.visited} occurrences using {enumerator.strategy} "
+            f"enumeration in {time.perf_counter() - start_time:.2f}s."
+        )
+        log_call_count(self.backend, start_calls, len(all_parts))
+        fetch_plan.mass_reader.log_fetches()
+        property_cache.log_statistics()
+        if sub_assembly_cache is not None:
+            sub_assembly_cache.log_statistics()
+        if self.part_cache is not None:
+            self.part_cache.flush()
+            self.part_cache.log_statistics()
+
+        # Keep complete export for next time.
+        if progress.cancelled:
+            return PartTable.from_parts(all_parts)
+        self.export_snapshot = snapshot
+        if previous is not None:
+            logger.info(f"Reused {previous.reused} parts from last export.")
+        return self.create_part_table(all_parts, previous, snapshot)
+
+    def create_part_table(
+        self, parts_list: list, previous: ExportSnapshot, snapshot: ExportSnapshot
+    ) -> PartTable:
+        """
+        Create parts table, patching the last export when it has the same rows.
+
+        Args:
+            parts_list (list): List of parts.
+            previous (ExportSnapshot): Previous export, optional.
+            snapshot (ExportSnapshot): Snapshot of this export.
+
+        Returns:
+            PartTable: Parts list.
+        """
+        table = self.recent_parts_list
+        paths = [part.occurrence_path for part in parts_list]
+        if previous is None or table is None or table.occurrence_paths != paths:
+            return PartTable.from_parts(parts_list)
+
+        # Only replace changed rows, copying so the shown table is unchanged.
+        table = table.copy()
+        indices = [
+            index for index, path in enumerate(paths) if path in snapshot.changed_paths
+        ]
+        table.set_rows(indices, [parts_list[index] for index in indices])
+        logger.info(f"Patched {len(indices)} of {len(table)} rows of last export.")
+        return table
+
+    def finish_export(
+        self,
+        future: Future,
+        selected_options: list,
+        progress: ExportProgress,
+        stream: PartStream = None,
+    ):
+        """
+        Show exported parts list once worker is done.
 
-        # Close progress bar.
+        Args:
+            future (Future): Future for parts table.
+            selected_options (list): Options to export.
+            progress (ExportProgress): Progress of export.
+            stream (PartStream): Parts shown while exporting, optional.
+        """
+        # Close progress bar and allow next export.
         self.subwindow.destroy()
+        self.export_future = None
+        self.main_window.left_side_frame.set_buttons_enabled(True)
+
+        # Check export finished.
+        try:
+            all_parts = future.result()
+        except Exception as e:
+            logger.error(f"Error exporting parts list: {e}")
+            self.restore_preview()
+            messagebox.showerror(
+                "Export Failed", f"Unable to export the parts list, {e}"
+            )
+            return
+        if progress.cancelled:
+            self.restore_preview()
+            message = "Parts list export was cancelled."
+            if self.log_path:
+                message += " Export again to resume from where it stopped."
+            messagebox.showinfo("Export Cancelled", message)
+            return
 
         # Store parts list for later use.
         self.recent_parts_list = all_parts
+        self.recent_selected_options = selected_options
+
+        # Summarise whole parts list.
+        start_time = time.perf_counter()
+        required_fields = self.get_column_plan(selected_options).required_fields
+        self.recent_summary = MassSummary(
+            self.recent_parts_list, "inertia" in required_fields
+        )
+        logger.info(
+            f"Summarised {self.recent_summary.part_count} parts in "
+            f"{(time.perf_counter() - start_time) * 1000:.1f}ms."
+        )
 
         # Create pandas df.
         self.dataframe = self.create_dataframe(self.recent_parts_list, selected_options)
@@ -327,22 +766,195 @@ class InventorAutomationApplication:
         # Copy to clipboard.
         self.dataframe.to_clipboard(index=False, excel=True)
 
-        # Generate HTML content.
-        self.recent_html_preview = self.create_html_parts_list(
-            self.recent_parts_list, selected_options
-        )
+        # Display parts list, rows are formatted as they are scrolled into view.
+        right_side_frame = self.main_window.right_side_frame
+        if stream is not None and stream.batches:
+            # Replace streamed rows, keeping sort order and page.
+            logger.info(f"Streamed {len(stream)} parts in {stream.batches} batches.")
+            right_side_frame.update_rows(
+                self.recent_summary, table=self.recent_parts_list
+            )
+        else:
+            right_side_frame.show_parts(
+                self.recent_parts_list,
+                self.get_column_plan(selected_options),
+                self.recent_summary,
+            )
 
-        # Display HTML content.
-        self.main_window.right_side_frame.update_html_preview(self.recent_html_preview)
+        # Refine mass properties in background.
+        self.start_refinement(selected_options)
 
         # Information box about clipboard.
-        messagebox.showinfo(
-            "Copied To Clipboard",
-            "Parts list is copied to clipboard so can be directly pasted into excel.",
+        message = (
+            "Parts list is copied to clipboard so can be directly pasted into excel."
+        )
+        if self.refiner is not None:
+            message += " It is copied again once mass properties are refined."
+        messagebox.showinfo("Copied To Clipboard", message)
+
+    def restore_preview(self):
+        """
+        Show recent parts list in place of parts streamed by an unfinished export.
+        """
+        right_side_frame = self.main_window.right_side_frame
+        if self.recent_parts_list is None:
+            right_side_frame.clear()
+            return
+        right_side_frame.show_parts(
+            self.recent_parts_list,
+            self.get_column_plan(self.recent_selected_options),
+            self.recent_summary,
+        )
+
+    def start_refinement(self, selected_options: list):
+        """
+        Recompute mass properties of recent parts list at refined accuracy.
+
+        Args:
+            selected_options (list): Options of recent parts list.
+        """
+        if self.preview_accuracy is None:
+            return
+        refiner = MassRefiner(
+            self.recent_parts_list,
+            FetchPlan.from_column_plan(self.get_column_plan(selected_options)),
+            self.refined_accuracy,
+        )
+        if not refiner.check_needed():
+            return
+
+        # Refine on worker, applying rows on UI thread as they arrive.
+        self.refiner = refiner
+        future = self.com_worker.submit(self.refine_parts, refiner, self.assembly_doc)
+        self.poll_refinement(future, refiner, selected_options)
+
+    def refine_parts(self, refiner: MassRefiner, assembly_doc):
+        """
+        Traverse assembly again at refined accuracy, run on worker.
+
+        Args:
+            refiner (MassRefiner): Refinement to add parts to.
+            assembly_doc: Assembly document of parts list.
+        """
+        if refiner.progress.cancelled:
+            return
+        sub_assembly_cache = SubAssemblyCache() if self.memoize_sub_assemblies else None
+        start_time = time.perf_counter()
+        self.get_part_occurrences(
+            assembly_doc.ComponentDefinition.Occurrences,
+            refiner.parts_list,
+            refiner.progress,
+            PropertyCache(),
+            sub_assembly_cache,
+            OccurrenceEnumerator(self.enumeration_strategy),
+            refiner.fetch_plan,
+            part_cache=self.part_cache,
+            record_paths=True,
+        )
+        logger.info(
+            f"Refined {len(refiner.parts_list)} parts in "
+            f"{time.perf_counter() - start_time:.2f}s."
+        )
+        refiner.fetch_plan.mass_reader.log_fetches()
+        if self.part_cache is not None:
+            self.part_cache.flush()
+
+    def poll_refinement(
+        self,
+        future: Future,
+        refiner: MassRefiner,
+        selected_options: list,
+        interval: int = 250,
+    ):
+        """
+        Apply refined rows to preview until refinement is done.
+
+        Args:
+            future (Future): Future for refinement.
+            refiner (MassRefiner): Refinement of recent parts list.
+            selected_options (list): Options of recent parts list.
+            interval (int): Time between updates in ms. Defaults to 250.
+        """
+        # Stop if refinement was replaced by a new export.
+        if refiner is not self.refiner:
+            return
+
+        if not future.done():
+            if refiner.apply():
+                self.show_refinement(
+                    selected_options,
+                    f"Refining mass properties to {self.refined_accuracy} "
+                    f"accuracy, {refiner.applied} of {len(refiner.table)} rows...",
+                )
+            self.root.after(
+                interval,
+                self.poll_refinement,
+                future,
+                refiner,
+                selected_options,
+                interval,
+            )
+            return
+
+        # Apply remaining rows.
+        self.refiner = None
+        try:
+            future.result()
+            complete = refiner.finish()
+        except Exception as e:
+            logger.error(f"Error refining mass properties: {e}")
+            refiner.apply()
+            complete = False
+        if complete:
+            status = f"Mass properties refined to {self.refined_accuracy} accuracy."
+        else:
+            status = (
+                f"Refined {refiner.applied} of {len(refiner.table)} rows, "
+                f"others are at {self.preview_accuracy} accuracy."
+            )
+        self.show_refinement(selected_options, f"{status} Copied to clipboard.")
+
+        # Replace preview values copied to clipboard with refined ones.
+        self.dataframe = self.create_dataframe(self.recent_parts_list, selected_options)
+        self.dataframe.to_clipboard(index=False, excel=True)
+
+    def show_refinement(self, selected_options: list, status: str):
+        """
+        Show refined rows and summary in preview.
+
+        Args:
+            selected_options (list): Options of recent parts list.
+            status (str): Refinement status shown below summary.
+        """
+        required_fields = self.get_column_plan(selected_options).required_fields
+        self.recent_summary = MassSummary(
+            self.recent_parts_list, "inertia" in required_fields
         )
+        self.main_window.right_side_frame.update_rows(self.recent_summary, status)
+
+    def cancel_refinement(self):
+        """
+        Stop refinement of recent parts list, keeping rows already refined.
+        """
+        if self.refiner is None:
+            return
+        self.refiner.progress.cancel()
+        self.refiner = None
 
     def get_part_occurrences(
-        self, occurrences, parts_list: list, progress_bar: ProgressBarWindow = None
+        self,
+        occurrences,
+        parts_list: list,
+        progress: ExportProgress = None,
+        property_cache: PropertyCache = None,
+        sub_assembly_cache: SubAssemblyCache = None,
+        enumerator: OccurrenceEnumerator = None,
+        fetch_plan: FetchPlan = None,
+        journal: ExportJournal = None,
+        part_cache: PartCache = None,
+        previous: ExportSnapshot = None,
+        snapshot: ExportSnapshot = None,
+        record_paths: bool = False,
     ):
         """
         Get part occurrences.
@@ -350,94 +962,239 @@ class InventorAutomationApplication:
         Args:
             occurrences: Occurrences
             parts_list (list): List containing all parts.
+            progress (ExportProgress): Progress to update, optional.
+            property_cache (PropertyCache): Cache for document properties, optional.
+            sub_assembly_cache (SubAssemblyCache): Cache for sub-assemblies, optional.
+            enumerator (OccurrenceEnumerator): Enumerator for occurrences, optional.
+            fetch_plan (FetchPlan): Part fields to fetch, optional.
+            journal (ExportJournal): Journal to record and resume from, optional.
+            part_cache (PartCache): Cache of parts kept between runs, optional.
+            previous (ExportSnapshot): Previous export to reuse, optional.
+            snapshot (ExportSnapshot): Snapshot to build for next export, optional.
+            record_paths (bool): Set occurrence path of parts without a journal
+                or snapshot. Defaults to False.
         """
-        # Set maximum for progress bar.
-        if progress_bar:
-            max_length = len(occurrences)
-            self.progress_bar.set_length(max_length)
+        if property_cache is None:
+            property_cache = PropertyCache()
+        if enumerator is None:
+            enumerator = OccurrenceEnumerator(self.enumeration_strategy)
+
+        # Count leaf occurrences for progress, counting top-level if unavailable.
+        count_leaves = False
+        if progress:
+            leaf_count = self.count_leaf_occurrences(occurrences)
+            count_leaves = leaf_count is not None
+            progress.set_length(leaf_count if count_leaves else len(occurrences))
+
+        # Top-level occurrences are placed by top-level assembly.
+        top_level_delta = None
+        if previous is not None and not previous.check_top_level_changed():
+            top_level_delta = np.eye(4)
+
+        for entry in enumerator.walk(occurrences):
+            occ = entry.occurrence
+
+            # Stop if cancelled.
+            if progress and progress.cancelled:
+                logger.info("Stopped getting part occurrences, export cancelled.")
+                return
+
+            # Report parts found so far.
+            if count_leaves:
+                progress.set_progress(len(parts_list))
+
+            # Occurrence paths are only needed for journal, snapshot and refinement.
+            if journal is not None or snapshot is not None or record_paths:
+                path = entry.path
+            else:
+                path = None
+
+            # Store traversed sub-assembly.
+            if entry.end:
+                if sub_assembly_cache is not None:
+                    start = entry.start
+                    sub_assembly_cache.store(occ, parts_list[start:], path)
+                if snapshot is not None:
+                    snapshot.end_assembly(path)
+                continue
 
-        for occ in occurrences:
             # Check valid occurence.
             if not self.check_valid_occurrence_definition(occ):
+                entry.descend = False
                 continue
 
-            # Add to progress bar.
-            if progress_bar:
-                progress_bar.add_to_progress_bar()
+            # Add top-level occurrence to progress bar if leaves not counted.
+            if progress and not count_leaves and entry.depth == 0:
+                progress.add_to_progress_bar()
+
+            # Only describe task at a fixed rate.
+            describe_task = progress is not None and progress.check_task_due()
 
             # Handle occurrence.
-            doc_type = occ.DefinitionDocumentType
-            if doc_type == 12290:
+            if entry.doc_type == PART_DOCUMENT:
                 # Update current task.
-                if progress_bar:
-                    progress_bar.update_task(
+                if describe_task:
+                    progress.update_task(
                         f"Getting part details ({occ.Definition.Document.DisplayName})..."
                     )
-                # Get part.
-                part = Part(occ)
+                filename = None
+                if snapshot is not None:
+                    filename = occ.Definition.Document.FullFileName
+
+                # Get part, from previous export if unchanged.
+                part = None
+                changed = True
+                if previous is not None:
+                    delta = self.get_parent_delta(entry, top_level_delta)
+                    part = previous.get_part(path, filename, delta)
+                    if part is not None:
+                        changed = check_moved(delta)
+
+                # Otherwise from journal if already processed.
+                if part is None and journal is not None and path in journal.records:
+                    part = Part.from_record(journal.records[path])
+                    part.occurrence_path = path
+                elif part is None:
+                    if part_cache is not None:
+                        part = part_cache.get_part(occ, property_cache, fetch_plan)
+                    else:
+                        part = Part(
+                            occ, property_cache=property_cache, fetch_plan=fetch_plan
+                        )
+                    part.occurrence_path = path
+                if journal is not None and path not in journal.records:
+                    journal.append(path, part.to_record())
                 parts_list.append(part)
-            elif doc_type == 12291:
+                if snapshot is not None:
+                    snapshot.add_part(part, filename, changed)
+            elif entry.doc_type == ASSEMBLY_DOCUMENT:
                 # Update current task.
-                if progress_bar:
-                    progress_bar.update_task(
+                if describe_task:
+                    progress.update_task(
                         f"Getting occurrences ({occ.Definition.Document.DisplayName})..."
                     )
-                # Get occurrencess.
-                self.get_part_occurrences(occ.SubOccurrences, parts_list)
+                entry.delta = None
+                if snapshot is not None:
+                    filename = occ.Definition.Document.FullFileName
+                    matrix = get_transformation_matrix(occ)
+                    snapshot.start_assembly(path, filename, matrix)
+
+                    # Reuse unchanged sub-assembly from previous export.
+                    if previous is not None and previous.check_rigid(occ):
+                        entry.delta = previous.get_delta(path, filename, matrix)
+                        reused_parts = previous.expand_assembly(path, entry.delta)
+                        if reused_parts is not None:
+                            snapshot.copy_assembly(previous, path, entry.delta)
+                            changed = check_moved(entry.delta)
+                            for part in reused_parts:
+                                snapshot.add_part(
+                                    part,
+                                    previous.part_files[part.occurrence_path],
+                                    changed,
+                                )
+                            parts_list.extend(reused_parts)
+                            entry.descend = False
+                            self.append_to_journal(journal, reused_parts)
+                            continue
+
+                # Expand repeated sub-assembly from cache.
+                if sub_assembly_cache is not None:
+                    cached_parts = sub_assembly_cache.expand(occ, path)
+                    if cached_parts is not None:
+                        parts_list.extend(cached_parts)
+                        entry.descend = False
+                        if snapshot is not None:
+                            for part in cached_parts:
+                                snapshot.add_part(part)
+                            snapshot.add_expanded_assembly(path)
+                        self.append_to_journal(journal, cached_parts)
+                        continue
+
+                # Get occurrences when walked.
+                entry.start = len(parts_list)
+
+    def count_leaf_occurrences(self, occurrences) -> int:
+        """
+        Count leaf occurrences of assembly in one call.
 
-    def create_html_parts_list(self, parts_list: list, selected_options: list):
+        Args:
+            occurrences: Top-level occurrences.
+
+        Returns:
+            int: Number of leaf occurrences, None if unavailable.
+        """
+        try:
+            return occurrences.AllLeafOccurrences.Count
+        except Exception as e:
+            logger.error(f"Unable to count leaf occurrences: {e}")
+            return None
+
+    def get_parent_delta(self, entry, top_level_delta):
+        """
+        Get change in placement of parent of occurrence since previous export.
+
+        Args:
+            entry (OccurrenceEntry): Occurrence entry.
+            top_level_delta (np.ndarray): Change for top-level occurrences.
+
+        Returns:
+            np.ndarray: 4x4 homogeneous matrix, None if parent has changed.
+        """
+        if entry.parent is not None:
+            return getattr(entry.parent, "delta", None)
+        if entry.depth == 0:
+            return top_level_delta
+        return None
+
+    def append_to_journal(self, journal: ExportJournal, parts_list: list):
         """
-        Create HTML parts list.
+        Record parts not already in journal.
+
+        Args:
+            journal (ExportJournal): Journal, optional.
+            parts_list (list): Parts with occurrence paths.
+        """
+        if journal is None:
+            return
+        for part in parts_list:
+            if part.occurrence_path not in journal.records:
+                journal.append(part.occurrence_path, part.to_record())
+
+    def get_column_plan(self, selected_options: list) -> ColumnPlan:
+        """
+        Get column plan for selected options, compiling it once.
 
         Args:
-            parts_list (list): Parts list.
             selected_options (list): Options to export.
 
         Return:
-            str: HTML content.
-        """
-        # Get full info about options.
-        full_option_info = []
-        for selected in selected_options:
-            for i, option in enumerate(self.options_config["options"]):
-                if option["option_name"] == selected:
-                    full_option_info.append(self.options_config["options"][i])
-
-        # Create table heading.
-        table_content = "<table><tr>"
-        for option in full_option_info:
-            for display_name in option["display_name"]:
-                table_content += f"<th>{display_name}</th>"
-        table_content += "</tr>"
-
-        # Add table content.
-        for part in parts_list:
-            table_content += "<tr>"
-            for option in full_option_info:
-                for attribute in option["attribute_name"]:
-                    value = eval(f"part.{attribute}")
-                    table_content += f"<td>{value}</td>"
-            table_content += "</tr>"
-        table_content += "</table>"
-
-        # HTML content.
-        html_template = f"""<html>
-            <head>
-            <title>PARTS LIST</title>
-            </head>
-            <body>
-            {table_content}
-            </body>
-            </html>
-        """
-        return html_template
+            ColumnPlan: Column plan.
+        """
+        key = tuple(selected_options)
+        if key not in self.column_plans:
+            column_plan = ColumnPlan.from_options(self.options_config, selected_options)
+
+            # Record accuracy of each row when mass properties are refined.
+            if self.preview_accuracy is not None and (
+                column_plan.required_fields.intersection(REFINED_FIELDS)
+            ):
+                column_plan = ColumnPlan(
+                    column_plan.columns + [Column("Accuracy", "accuracy")],
+                    column_plan.required_fields,
+                )
+            self.column_plans[key] = column_plan
+        return self.column_plans[key]
 
     def save_parts_list(self):
         """
         Save parts list to computer.
         """
+        # Wait for export in progress.
+        if self.check_export_running():
+            return False
+
         # Check if parts list to save.
-        if self.recent_html_preview is None:
+        if self.recent_parts_list is None:
             messagebox.showerror(
                 "Invalid Parts List",
                 "Please export a parts list to save.",
@@ -449,7 +1206,12 @@ class InventorAutomationApplication:
         f = asksaveasfile("w", filetypes=filetype, defaultextension=filetype)
         if f is None:
             return
-        f.write(self.recent_html_preview)
+
+        # Write parts list as it is generated.
+        column_plan = self.get_column_plan(self.recent_selected_options)
+        write_html_parts_list(
+            f, self.recent_parts_list, column_plan, self.recent_summary
+        )
         f.close()
 
         # Display save location.
@@ -459,40 +1221,17 @@ class InventorAutomationApplication:
         )
 
     def create_dataframe(
-        self, parts_list: list, selected_options: list
+        self, parts_list: PartTable, selected_options: list
     ) -> pd.DataFrame:
         """
         Create pandas dataframe from parts list.
 
         Args:
-            parts_list (list): List of parts.
+            parts_list (PartTable): Parts list.
             selected_options (list): List of selected options.
         """
-        # Get full info about options.
-        full_option_info = []
-        for selected in selected_options:
-            for i, option in enumerate(self.options_config["options"]):
-                if option["option_name"] == selected:
-                    full_option_info.append(self.options_config["options"][i])
-
-        # Get columns.
-        columns = []
-        for option in full_option_info:
-            for display_name in option["display_name"]:
-                columns.append(display_name)
-
-        # Add each part to dataframe.
-        rows = []
-        for part in parts_list:
-            new_row = {}
-            for option in full_option_info:
-                for i, display_name in enumerate(option["display_name"]):
-                    new_row[display_name] = eval(f'part.{option["attribute_name"][i]}')
-            rows.append(new_row)
-
-        # Create dataframe.
-        dataframe = pd.DataFrame(rows, columns=columns)
-        return dataframe
+        column_plan = self.get_column_plan(selected_options)
+        return parts_list.to_dataframe(column_plan)
 
     def check_active_document(self) -> bool:
         """
@@ -546,5 +1285,5 @@ if __name__ == "__main__":
         logging.config.dictConfig(config_dict)
 
     # Create an instance of Inventor Automation Application.
-    application = InventorAutomationApplication()
+    application = InventorAutomationApplication(log_path, PART_CACHE_FILENAME)
     application.run()
@@ -0,0 +1,155 @@
+"""
+InventorBackend is a class for the interface between the application and Inventor.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Inventor interfaces documents are cast to, keyed by DocumentTypeEnum value.
+DOCUMENT_INTERFACES = {12290: "PartDocument", 12291: "AssemblyDocument"}
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def get_default_backend(binding: str = "late"):
+    """
+    Get backend for a running Inventor.
+
+    ComBackend is imported here so the rest of the application can be imported
+    where win32com is not installed.
+
+    Args:
+        binding (str): "early", "cached" or "late" COM binding. Defaults to late.
+
+    Returns:
+        InventorBackend: COM backend.
+    """
+    from .ComBackend import ComBackend
+
+    return ComBackend(binding)
+
+
+def log_call_count(backend, start_count: int, part_count: int):
+    """
+    Log Inventor calls made by an export, if the backend counts them.
+
+    Args:
+        backend (InventorBackend): Backend exported through.
+        start_count (int): Call count before export, None if not counted.
+        part_count (int): Number of parts exported.
+    """
+    if start_count is None:
+        return
+    calls = backend.call_count - start_count
+    logger.info(
+        f"Export made {calls} Inventor calls, {calls / max(part_count, 1):.1f} "
+        f"per part."
+    )
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class InventorBackend:
+    """
+    Everything the application needs from the Inventor runtime.
+
+    A backend connects to the Inventor application, opens and casts documents,
+    attaches event handlers and prepares threads that use Inventor. Occurrences,
+    property sets and mass properties are then read through the objects it
+    returns, using the attributes of the Inventor API: Definition, Document,
+    PropertySets, MassProperties, Transformation, SubOccurrences,
+    AllLeafOccurrences and OccurrencePath.
+
+    Attributes
+    ----------
+    name: str
+        Backend name used in logs and benchmark results.
+    """
+
+    name = "base"
+
+    @property
+    def call_count(self):
+        """
+        Number of Inventor calls made, None if the backend does not count them.
+        """
+        return None
+
+    def initialise_thread(self):
+        """
+        Prepare current thread for Inventor access.
+        """
+
+    def uninitialise_thread(self):
+        """
+        Release current thread from Inventor access.
+        """
+
+    def pump_messages(self):
+        """
+        Deliver waiting Inventor events on current thread.
+        """
+
+    def connect(self, visible: bool = True):
+        """
+        Connect to Inventor application.
+
+        Args:
+            visible (bool): Show Inventor window, or None to leave it unchanged.
+                Defaults to True.
+
+        Returns:
+            Inventor Application.
+        """
+        raise NotImplementedError
+
+    def cast(self, document, interface: str):
+        """
+        Cast document to Inventor interface.
+
+        Args:
+            document: Document.
+            interface (str): Interface name, e.g. "AssemblyDocument".
+
+        Returns:
+            Document with interface.
+        """
+        raise NotImplementedError
+
+    def with_events(self, source, handler_class):
+        """
+        Attach event handler to event source.
+
+        Args:
+            source: Inventor event source, e.g. ApplicationEvents.
+            handler_class: Handler class.
+
+        Returns:
+            Handler instance receiving events.
+        """
+        raise NotImplementedError
+
+    def open_document(self, app, filename: str, visible: bool = True) -> tuple:
+        """
+        Open document and cast it to its document interface.
+
+        Args:
+            app: Inventor Application.
+            filename (str): Document filename.
+            visible (bool): Open document in a window. Defaults to True.
+
+        Returns:
+            tuple: Document and cast document.
+        """
+        document = app.Documents.Open(filename, visible)
+        interface = DOCUMENT_INTERFACES.get(document.DocumentType, "PartDocument")
+        return document, self.cast(document, interface)
@@ -6,7 +6,6 @@ Created on Friday 30th May 2025.
 
 """
 
-import win32com.client
 import logging.config
 import os
 from datetime import datetime
@@ -16,26 +15,63 @@ from tkinter.filedialog import askopenfilename, askdirectory
 import time
 
 from .Part import Part
+from .InventorBackend import InventorBackend, get_default_backend, log_call_count
+from .PropertyCache import PropertyCache
+from .FetchPlan import FetchPlan
+from .SubAssemblyCache import SubAssemblyCache
+from .PartCache import PartCache
+from .HtmlReportWriter import write_html_parts_list
+from .ColumnPlan import ColumnPlan, Column, NUMBER_COLUMN
+from .PartTable import PartTable
+from .MassSummary import MassSummary
+from .OccurrenceEnumerator import (
+    OccurrenceEnumerator,
+    PART_DOCUMENT,
+    ASSEMBLY_DOCUMENT,
+)
 
 # - - - - - - - - - - - - - - - - - - - - -
 
 global logger
 logger = logging.getLogger()
 
+# Columns for exported parts list.
+EXPORT_COLUMNS = ColumnPlan(
+    [
+        Column("P/N", "part_number"),
+        Column("Part Name", "part_name"),
+        Column("Mass (kg)", "mass", column_type=NUMBER_COLUMN, precision=3),
+        Column("X-axis (mm)", "x_axis", column_type=NUMBER_COLUMN, precision=2),
+        Column("X-axis mass", "x_axis_mass", column_type=NUMBER_COLUMN, precision=2),
+        Column("Y-axis (mm)", "y_axis", column_type=NUMBER_COLUMN, precision=2),
+        Column("Y-axis mass", "y_axis_mass", column_type=NUMBER_COLUMN, precision=2),
+        Column("Z-axis (mm)", "z_axis", column_type=NUMBER_COLUMN, precision=2),
+        Column("Z-axis mass", "z_axis_mass", column_type=NUMBER_COLUMN, precision=2),
+    ]
+)
+
 # - - - - - - - - - - - - - - - - - - - - -
 
 
 class InventorManager:
-    def __init__(self):
+    def __init__(self, visible: bool = True, backend: InventorBackend = None):
         """
         A class for managing connection to Inventor application.
 
+        Args:
+            visible (bool): Show Inventor window. Defaults to True.
+            backend (InventorBackend): Inventor backend, optional. Defaults to COM.
+
         Attributes
         ----------
-        app : win32com.client.Dispatch
+        app :
             Inventor Application
+        backend : InventorBackend
+            Backend for connecting to Inventor and opening documents.
         """
         self.app = None  # Inventor Application
+        self.visible = visible
+        self.backend = get_default_backend() if backend is None else backend
 
         # Connect to Inventor application.
         ret = self.connect_to_inventor()
@@ -55,8 +91,7 @@ class InventorManager:
             bool: True if connection is successful, False otherwise.
         """
         try:
-            self.app = win32com.client.Dispatch("Inventor.Application")
-            self.app.Visible = True
+            self.app = self.backend.connect(self.visible)
             return True
         except Exception as e:
             logger.error(f"Error connecting to Inventor: {e}")
@@ -100,25 +135,52 @@ class InventorManager:
         else:
             try:
                 # Open document.
-                self.doc = self.app.Documents.Open(filename, False)
+                self.doc, self.assembly_doc = self.backend.open_document(
+                    self.app, filename, False
+                )
                 logger.info(f"Selected document: {filename}")
-                if self.doc.DocumentType == 12291:
-                    self.assembly_doc = win32com.client.CastTo(
-                        self.doc, "AssemblyDocument"
-                    )
-                else:
-                    self.assembly_doc = win32com.client.CastTo(self.doc, "PartDocument")
                 return True
             except Exception as e:
                 logger.error(f"Error selecting document '{filename}': {e}")
                 return False
 
-    def get_parts_list(self, document: str = None) -> dict:
+    def close_document(self):
+        """
+        Close selected document without saving.
+        """
+        try:
+            if getattr(self, "doc", None) is not None:
+                self.doc.Close(True)
+                logger.info("Closed selected document.")
+        except Exception as e:
+            logger.error(f"Error closing document: {e}")
+        self.doc = None
+        self.assembly_doc = None
+
+    def get_parts_list(
+        self,
+        document: str = None,
+        memoize_sub_assemblies: bool = True,
+        enumeration_strategy: str = "iterative",
+        fetch_plan: FetchPlan = None,
+        property_cache: PropertyCache = None,
+        sub_assembly_cache: SubAssemblyCache = None,
+        part_cache: PartCache = None,
+    ) -> dict:
         """
         Get parts list for assembly document.
 
+        Caches can be passed in to share them between assemblies exported in the
+        same session.
+
         Args:
             document (str): Document, optional
+            memoize_sub_assemblies (bool): Expand repeated sub-assemblies from cache.
+            enumeration_strategy (str): "iterative" or "all_leaf" enumeration.
+            fetch_plan (FetchPlan): Part fields to fetch, optional.
+            property_cache (PropertyCache): Cache for document properties, optional.
+            sub_assembly_cache (SubAssemblyCache): Cache for sub-assemblies, optional.
+            part_cache (PartCache): Cache of part properties on disk, optional.
 
         Returns:
             dict: Parts list with number of occurrences.
@@ -126,33 +188,94 @@ class InventorManager:
         title = "Select an assembly file"
 
         # Opening document.
-        if not document:
-            self.select_document(title=title)
-        else:
-            self.select_document(document, title=title)
+        if not self.select_document(document, title=title):
+            raise RuntimeError(f"Unable to open assembly document {document}.")
 
         # Get occurrences.
         occurrences = self.assembly_doc.ComponentDefinition.Occurrences
         all_parts = []
-        self.get_part_occurrences(occurrences, all_parts)
+        if property_cache is None:
+            property_cache = PropertyCache()
+        if sub_assembly_cache is None and memoize_sub_assemblies:
+            sub_assembly_cache = SubAssemblyCache()
+        enumerator = OccurrenceEnumerator(enumeration_strategy)
+        if fetch_plan is None:
+            fetch_plan = FetchPlan()
+        start_calls = self.backend.call_count
+        start_time = time.perf_counter()
+        self.get_part_occurrences(
+            occurrences,
+            all_parts,
+            property_cache,
+            sub_assembly_cache,
+            enumerator,
+            fetch_plan,
+            part_cache,
+        )
+        logger.info(
+            f"Traversed {enumerator.visited} occurrences using {enumerator.strategy} "
+            f"enumeration in {time.perf_counter() - start_time:.2f}s."
+        )
+        log_call_count(self.backend, start_calls, len(all_parts))
+        fetch_plan.mass_reader.log_fetches()
+        property_cache.log_statistics()
+        if sub_assembly_cache is not None:
+            sub_assembly_cache.log_statistics()
 
         return all_parts
 
-    def get_part_occurrences(self, occurrences, parts_list: list):
+    def get_part_occurrences(
+        self,
+        occurrences,
+        parts_list: list,
+        property_cache: PropertyCache = None,
+        sub_assembly_cache: SubAssemblyCache = None,
+        enumerator: OccurrenceEnumerator = None,
+        fetch_plan: FetchPlan = None,
+        part_cache: PartCache = None,
+    ):
         """
         Get part occurrences.
 
         Args:
             occurrences: Occurrences
             parts_list (list): List containing all parts.
+            property_cache (PropertyCache): Cache for document properties, optional.
+            sub_assembly_cache (SubAssemblyCache): Cache for sub-assemblies, optional.
+            enumerator (OccurrenceEnumerator): Enumerator for occurrences, optional.
+            fetch_plan (FetchPlan): Part fields to fetch, optional.
+            part_cache (PartCache): Cache of part properties on disk, optional.
         """
-        for occ in occurrences:
-            doc_type = occ.DefinitionDocumentType
-            if doc_type == 12290:
-                part = Part(occ)
+        if property_cache is None:
+            property_cache = PropertyCache()
+        if enumerator is None:
+            enumerator = OccurrenceEnumerator()
+
+        for entry in enumerator.walk(occurrences):
+            occ = entry.occurrence
+            if entry.end:
+                # Store traversed sub-assembly.
+                if sub_assembly_cache is not None:
+                    start = entry.start
+                    sub_assembly_cache.store(occ, parts_list[start:])
+            elif entry.doc_type == PART_DOCUMENT:
+                if part_cache is not None:
+                    part = part_cache.get_part(occ, property_cache, fetch_plan)
+                else:
+                    part = Part(
+                        occ, property_cache=property_cache, fetch_plan=fetch_plan
+                    )
                 parts_list.append(part)
-            elif doc_type == 12291:
-                self.get_part_occurrences(occ.SubOccurrences, parts_list)
+            elif entry.doc_type == ASSEMBLY_DOCUMENT:
+                # Expand repeated sub-assembly from cache.
+                if sub_assembly_cache is not None:
+                    cached_parts = sub_assembly_cache.expand(occ)
+                    if cached_parts is not None:
+                        parts_list.extend(cached_parts)
+                        entry.descend = False
+                        continue
+
+                entry.start = len(parts_list)
 
     def get_part_details(self, part: Part):
         """
@@ -218,29 +341,15 @@ class InventorManager:
             Tk().withdraw()
             directory = askdirectory(title="Select folder to save results")
 
+        # Summarise parts list.
+        table = PartTable.from_parts(parts_list)
+        summary = MassSummary(table)
+
         # Open file.
         current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        f = open(directory + f"/PARTS_LIST_{current_time}.html", "w")
-
-        # Create table.
-        table_content = "<table><tr><th>P/N</th><th>Part Name</th><th>Mass (kg)</th><th>X-axis (mm)</th><th>X-axis mass</th><th>Y-axis (mm)</th><th>Y-axis mass</th><th>Z-axis (mm)</th><th>Z-axis mass</th></tr>"
-        for part in parts_list:
-            table_content += f"<tr><td>{part.part_number}</td><td>{part.part_name}</td><td>{part.mass}</td><td>{part.x_axis}</td><td>{part.x_axis_mass}</td><td>{part.y_axis}</td><td>{part.y_axis_mass}</td><td>{part.z_axis}</td><td>{part.z_axis_mass}</td></tr>"
-        table_content += "</table>"
-
-        # HTML content.
-        html_template = f"""<html>
-            <head>
-            <title>PARTS LIST</title>
-            </head>
-            <body>
-            {table_content}
-            </body>
-            </html>
-        """
-        # Writing and closing.
-        f.write(html_template)
-        f.close()
+        with open(directory + f"/PARTS_LIST_{current_time}.html", "w") as f:
+            # Write table as it is generated.
+            write_html_parts_list(f, table, EXPORT_COLUMNS, summary)
 
         return True
 
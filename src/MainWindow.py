@@ -6,17 +6,39 @@ Created on Monday 9th June 2025.
 
 """
 
-from tkinter import Frame, Label, Button, Text, WORD, END, IntVar, Checkbutton
+from tkinter import (
+    Frame,
+    Label,
+    Button,
+    Text,
+    WORD,
+    END,
+    IntVar,
+    Checkbutton,
+    Scrollbar,
+    VERTICAL,
+    FLAT,
+    NORMAL,
+    DISABLED,
+)
+from tkinter import ttk
 import tkinter.font as tkFont
-from tkhtmlview import HTMLLabel
-import re
 import logging.config
 
+from .PartTableView import PartTableView, format_summary
+
 # - - - - - - - - - - - - - - - - - - - - -
 
 global logger
 logger = logging.getLogger()
 
+# Number of rows shown in parts preview at once. Together with the title,
+# headings and summary this fits the 540 pixel high main window.
+PAGE_ROWS = 16
+
+# Number of summary lines shown below preview, scrolling for the rest.
+SUMMARY_LINES = 6
+
 # - - - - - - - - - - - - - - - - - - - - -
 
 
@@ -75,12 +97,12 @@ class LeftSideFrame(Frame):
         self.file_label.configure(state="disabled")
 
         # Add select file button.
-        select_file_button = Button(
+        self.select_file_button = Button(
             self,
             text="Select File",
             command=lambda: commands["select_file"](text_var=self.file_label),
         )
-        select_file_button.grid(row=1, column=2, padx=5, pady=10)
+        self.select_file_button.grid(row=1, column=2, padx=5, pady=10)
 
         # Create check button frame.
         options = [option["option_name"] for option in options_config["options"]]
@@ -90,20 +112,35 @@ class LeftSideFrame(Frame):
         checkbutton_frame.grid(row=2, column=0, columnspan=2, pady=10)
 
         # Add export parts list.
-        export_parts_list_button = Button(
+        self.export_parts_list_button = Button(
             self,
             text="Export Parts List",
             command=lambda: commands["export_parts_list"](
                 file_text=self.file_label, checkbox_frame=checkbutton_frame
             ),
         )
-        export_parts_list_button.grid(row=2, column=2, pady=10)
+        self.export_parts_list_button.grid(row=2, column=2, pady=10)
 
         # Save parts list.
-        save_part_list_button = Button(
+        self.save_parts_list_button = Button(
             self, text="Save Parts List", command=commands["save_parts_list"], width=40
         )
-        save_part_list_button.grid(row=3, column=0, columnspan=3, pady=10)
+        self.save_parts_list_button.grid(row=3, column=0, columnspan=3, pady=10)
+
+    def set_buttons_enabled(self, enabled: bool):
+        """
+        Enable or disable buttons that select, export or save a parts list.
+
+        Args:
+            enabled (bool): Whether buttons can be clicked.
+        """
+        state = "normal" if enabled else "disabled"
+        for button in [
+            self.select_file_button,
+            self.export_parts_list_button,
+            self.save_parts_list_button,
+        ]:
+            button.configure(state=state)
 
 
 # - - - - - - - - - - - - - - - - - - - - -
@@ -112,7 +149,10 @@ class LeftSideFrame(Frame):
 class RightSideFrame(Frame):
     def __init__(self, window):
         """
-        Right side frame for HTML preview.
+        Right side frame for parts preview.
+
+        Only the visible page of rows is kept in the tree, and scrolling fetches
+        the next page from the parts list, so large parts lists open instantly.
 
         Args:
             window: Parent window.
@@ -124,52 +164,188 @@ class RightSideFrame(Frame):
         normal_font = tkFont.Font(family="Ubuntu", size=10)
 
         # Create title label.
-        title_label = Label(self, text="HTML Preview:", font=normal_font)
-        title_label.grid(row=0, column=0, pady=10)
-
-        # Create HTML preview.
-        self.html_preview = HTMLLabel(
-            self, html="", background="#FFFFFF", width=80, height=28
+        title_label = Label(self, text="Parts Preview:", font=normal_font)
+        title_label.grid(row=0, column=0, columnspan=2, pady=10)
+
+        # Create preview tree and scrollbar over whole parts list.
+        self.preview = ttk.Treeview(self, show="headings", height=PAGE_ROWS)
+        self.preview.grid(row=1, column=0, padx=(20, 0), sticky="nsew")
+        self.scrollbar = Scrollbar(self, orient=VERTICAL, command=self.scroll)
+        self.scrollbar.grid(row=1, column=1, padx=(0, 20), sticky="ns")
+        self.preview.bind("<MouseWheel>", self.on_mouse_wheel)
+
+        # Create read-only summary text and scrollbar, as the summary can be
+        # longer than the space below the preview. Text stretches to preview
+        # width rather than widening the frame.
+        self.summary_text = Text(
+            self,
+            font=normal_font,
+            width=1,
+            height=SUMMARY_LINES,
+            wrap=WORD,
+            relief=FLAT,
+            background=self.cget("background"),
+            state=DISABLED,
+        )
+        self.summary_text.grid(row=2, column=0, padx=(20, 0), pady=(10, 0), sticky="ew")
+        summary_scrollbar = Scrollbar(
+            self, orient=VERTICAL, command=self.summary_text.yview
         )
-        self.html_preview.grid(row=1, column=0, padx=20)
+        summary_scrollbar.grid(row=2, column=1, padx=(0, 20), pady=(10, 0), sticky="ns")
+        self.summary_text.configure(yscrollcommand=summary_scrollbar.set)
+
+        self.view = None
+        self.offset = 0
 
-    def round_numbers_in_html(self, html, decimals=3):
+    def show_parts(self, table, column_plan, summary=None, status: str = None):
         """
-        Round numbers in html file.
+        Show parts list in preview.
 
         Args:
-            html: HTML file.
-            decimals (int, optional): Number of decimals to round. Defaults to 3.
+            table (PartTable): Parts list.
+            column_plan (ColumnPlan): Columns to show.
+            summary (MassSummary): Summary shown below preview, optional.
+            status (str): Status shown above summary, optional.
         """
+        self.view = PartTableView(table, column_plan)
+        self.offset = 0
 
-        def round_match(match):
-            num_str = match.group()
-            try:
-                num = float(num_str)
-                return f"{round(num, decimals):.{decimals}f}"
-            except ValueError:
-                return num_str  # Leave unmodified if somehow not parseable
+        # Create columns.
+        columns = [f"column_{index}" for index in range(len(column_plan.columns))]
+        self.preview.configure(columns=columns)
+        width = max(80, 640 // max(len(columns), 1))
+        for column in columns:
+            self.preview.column(column, width=width, stretch=True)
+        self.update_headings()
 
-        # Regex to match numbers (including decimals, optional sign, and scientific notation)
-        number_regex = r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?"
+        self.show_summary(summary, status)
+        self.update_page()
 
-        return re.sub(number_regex, round_match, html)
+    def update_rows(self, summary=None, status: str = None, table=None):
+        """
+        Show rows of parts list changed in place or appended, keeping sort order
+        and page.
 
-    def update_html_preview(self, html_content: str):
+        Args:
+            summary (MassSummary): Summary shown below preview, optional.
+            status (str): Status shown above summary, optional.
+            table (PartTable): Parts list with the same columns replacing the
+                shown one, optional.
         """
-        Update HTML preview.
+        if self.view is None:
+            return
+        if table is not None or len(self.view) != len(self.view.table):
+            self.view.update_order(table)
+        self.show_summary(summary, status)
+        self.update_page()
+
+    def clear(self):
+        """
+        Remove parts list from preview.
+        """
+        self.view = None
+        self.offset = 0
+        self.preview.delete(*self.preview.get_children())
+        self.preview.configure(columns=[])
+        self.scrollbar.set(0, 1)
+        self.show_summary()
+
+    def show_summary(self, summary=None, status: str = None):
+        """
+        Show status and summary below preview.
 
         Args:
-            html_content (str): HTML cotent to update.
+            summary (MassSummary): Summary of parts list, optional.
+            status (str): Status shown above summary, optional.
+        """
+        # Show status first so it is visible without scrolling.
+        text = format_summary(summary)
+        if status:
+            text = f"{status}\n{text}" if text else status
+        self.summary_text.configure(state=NORMAL)
+        self.summary_text.delete("1.0", END)
+        self.summary_text.insert("1.0", text)
+        self.summary_text.configure(state=DISABLED)
+
+    def update_headings(self):
         """
-        # Round numbers for better formatting.
-        rounded_count = self.round_numbers_in_html(html_content, 2)
+        Update column headings with sort order.
+        """
+        for index in range(len(self.view.column_plan.columns)):
+            self.preview.heading(
+                f"column_{index}",
+                text=self.view.get_heading(index),
+                command=lambda index=index: self.sort(index),
+            )
+
+    def sort(self, column_index: int):
+        """
+        Sort preview by column.
+
+        Args:
+            column_index (int): Index of column.
+        """
+        self.view.sort(column_index)
+        self.update_headings()
+        self.update_page()
+
+    def update_page(self):
+        """
+        Replace rows in tree with visible page.
+        """
+        self.preview.delete(*self.preview.get_children())
+        for row in self.view.get_page(self.offset, PAGE_ROWS):
+            self.preview.insert("", END, values=row)
+
+        # Update scrollbar position over whole parts list.
+        if len(self.view) == 0:
+            self.scrollbar.set(0, 1)
+        else:
+            first = self.offset / len(self.view)
+            last = min(self.offset + PAGE_ROWS, len(self.view)) / len(self.view)
+            self.scrollbar.set(first, last)
+
+    def scroll_to(self, offset: int):
+        """
+        Show page starting at row.
 
-        # Additional formatting.
-        formatted_content = f'<div style="font-size: 8px; zoom: 0.5; transform: scale(0.8); transform-origin: top left;">{rounded_count}</div>'
+        Args:
+            offset (int): First visible row.
+        """
+        if self.view is None:
+            return
+        offset = max(0, min(offset, len(self.view) - PAGE_ROWS))
+        if offset != self.offset:
+            self.offset = offset
+            self.update_page()
+
+    def scroll(self, action: str, amount, unit: str = None):
+        """
+        Scroll preview from scrollbar.
 
-        # Update content.
-        self.html_preview.set_html(formatted_content)
+        Args:
+            action (str): "moveto" or "scroll".
+            amount: Fraction to move to, or number of units to scroll.
+            unit (str): "units" or "pages" when scrolling.
+        """
+        if self.view is None:
+            return
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * len(self.view)))
+        elif unit == "pages":
+            self.scroll_to(self.offset + int(amount) * PAGE_ROWS)
+        else:
+            self.scroll_to(self.offset + int(amount))
+
+    def on_mouse_wheel(self, event):
+        """
+        Scroll preview with mouse wheel.
+
+        Args:
+            event: Mouse wheel event.
+        """
+        self.scroll_to(self.offset - 3 * (event.delta // 120))
+        return "break"
 
 
 # - - - - - - - - - - - - - - - - - - - - -
@@ -0,0 +1,270 @@
+"""
+MassPropertiesReader is a class for reading all mass properties of a part in one pass.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import numpy as np
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Inventor AccuracyEnum values of mass property calculations, keyed by name.
+ACCURACY_LEVELS = {
+    "very_high": 24577,
+    "high": 24578,
+    "medium": 24579,
+    "low": 24580,
+}
+
+# Accuracy levels from least to most accurate.
+ACCURACY_ORDER = ["low", "medium", "high", "very_high"]
+
+# MassProperties and CenterOfMass fetches per part when each property is read
+# separately, keyed by field. Each centre of mass coordinate fetches both.
+SEPARATE_FETCHES = {"mass": 1, "centre_of_mass": 6, "inertia": 1}
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def check_accuracy(accuracy: str, required: str) -> bool:
+    """
+    Check values read at an accuracy level are accurate enough.
+
+    Args:
+        accuracy (str): Accuracy level values were read at, None if unknown.
+        required (str): Accuracy level required, None for any.
+
+    Returns:
+        bool: Accuracy at least as high as required.
+    """
+    if required is None:
+        return True
+    if accuracy is None:
+        return False
+    return ACCURACY_ORDER.index(accuracy) >= ACCURACY_ORDER.index(required)
+
+
+def read_principal_inertia(mass_properties) -> tuple:
+    """
+    Read principal moments and axes of inertia about centre of mass.
+
+    Inventor returns products of inertia as integrals of xy dm, so the inertia
+    tensor holds their negatives.
+
+    Args:
+        mass_properties: MassProperties of occurrence or document.
+
+    Returns:
+        tuple: Principal moments in kg mm^2 and principal axes as rows.
+    """
+    ixx, iyy, izz, ixy, iyz, ixz = mass_properties.XYZMoments()
+    tensor = np.array(
+        [[ixx, -ixy, -ixz], [-ixy, iyy, -iyz], [-ixz, -iyz, izz]], dtype=np.float64
+    )
+
+    # Convert from kg cm^2 to kg mm^2.
+    moments, axes = np.linalg.eigh(tensor * 100)
+    return moments.tolist(), axes.T.tolist()
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class MassRecord:
+    """
+    Mass properties read from one part, None where unavailable.
+
+    Attributes
+    ----------
+    mass: double
+        Mass in kg.
+    centre_of_mass: tuple
+        Centre of mass in mm.
+    principal_moments: list
+        Principal moments of inertia about centre of mass in kg mm^2.
+    principal_axes: list
+        Principal axes of inertia as rows, matching principal_moments.
+    accuracy: str
+        Accuracy level read at, None for the document's own level or if mass
+        properties were unavailable.
+    """
+
+    __slots__ = [
+        "mass",
+        "centre_of_mass",
+        "principal_moments",
+        "principal_axes",
+        "accuracy",
+    ]
+
+    def __init__(self):
+        """
+        Initialise with every property unavailable.
+        """
+        self.mass = None
+        self.centre_of_mass = None
+        self.principal_moments = None
+        self.principal_axes = None
+        self.accuracy = None
+
+
+class MassPropertiesReader:
+    """
+    Reads mass, centre of mass and inertia from a single MassProperties handle.
+
+    Each read of MassProperties or CenterOfMass is a separate call to Inventor
+    returning a new object, so the reader fetches each once per part.
+
+    Attributes
+    ----------
+    mass: bool
+        Read mass.
+    centre_of_mass: bool
+        Read centre of mass.
+    inertia: bool
+        Read principal moments and axes of inertia.
+    accuracy: str
+        Accuracy level from ACCURACY_LEVELS, None keeps the document's level.
+    reads: int
+        Number of parts read since fetches were last logged.
+    fetches: int
+        MassProperties and CenterOfMass fetches made since last logged.
+    separate_fetches: int
+        Fetches the same parts would need reading each property separately.
+    """
+
+    def __init__(
+        self,
+        mass: bool = True,
+        centre_of_mass: bool = True,
+        inertia: bool = True,
+        accuracy: str = None,
+    ):
+        """
+        Initialise.
+
+        Args:
+            mass (bool): Read mass. Defaults to True.
+            centre_of_mass (bool): Read centre of mass. Defaults to True.
+            inertia (bool): Read inertia. Defaults to True.
+            accuracy (str): Accuracy level from ACCURACY_LEVELS, optional.
+        """
+        if accuracy is not None and accuracy not in ACCURACY_LEVELS:
+            raise ValueError(
+                f"Unknown accuracy {accuracy}, expected one of {list(ACCURACY_LEVELS)}."
+            )
+        self.mass = mass
+        self.centre_of_mass = centre_of_mass
+        self.inertia = inertia
+        self.accuracy = accuracy
+        self.reads = 0
+        self.fetches = 0
+        self.separate_fetches = 0
+
+    @classmethod
+    def from_fetch_plan(cls, fetch_plan):
+        """
+        Create reader of the mass properties in fetch plan.
+
+        Args:
+            fetch_plan (FetchPlan): Fields to fetch.
+
+        Returns:
+            MassPropertiesReader: Reader.
+        """
+        return cls(
+            "mass" in fetch_plan,
+            "centre_of_mass" in fetch_plan,
+            "inertia" in fetch_plan,
+            fetch_plan.accuracy,
+        )
+
+    def check_needed(self) -> bool:
+        """
+        Check any mass property is read.
+
+        Returns:
+            bool: Reader fetches MassProperties.
+        """
+        return self.mass or self.centre_of_mass or self.inertia
+
+    def read(self, target) -> MassRecord:
+        """
+        Read mass properties.
+
+        Args:
+            target: Occurrence or component definition with MassProperties.
+
+        Returns:
+            MassRecord: Mass properties, None where unavailable.
+        """
+        record = MassRecord()
+        if not self.check_needed():
+            return record
+        self.reads += 1
+        self.separate_fetches += (
+            self.mass * SEPARATE_FETCHES["mass"]
+            + self.centre_of_mass * SEPARATE_FETCHES["centre_of_mass"]
+            + self.inertia * SEPARATE_FETCHES["inertia"]
+        )
+
+        # Fetch one handle for every property.
+        try:
+            self.fetches += 1
+            mass_properties = target.MassProperties
+            if self.accuracy is not None:
+                mass_properties.Accuracy = ACCURACY_LEVELS[self.accuracy]
+        except Exception as e:
+            logger.error(f"Unable to get mass properties of part, {e}")
+            return record
+        record.accuracy = self.accuracy
+
+        if self.mass:
+            try:
+                record.mass = mass_properties.Mass
+            except Exception as e:
+                logger.error(f"Unable to get mass of part, {e}")
+
+        if self.centre_of_mass:
+            try:
+                self.fetches += 1
+                point = mass_properties.CenterOfMass
+
+                # Convert from cm to mm.
+                record.centre_of_mass = (point.X * 10, point.Y * 10, point.Z * 10)
+            except Exception as e:
+                logger.error(f"Unable to get centre of mass of part, {e}")
+
+        if self.inertia:
+            try:
+                moments, axes = read_principal_inertia(mass_properties)
+                record.principal_moments = moments
+                record.principal_axes = axes
+            except Exception as e:
+                logger.error(f"Unable to get inertia of part, {e}")
+
+        return record
+
+    def log_fetches(self):
+        """
+        Log fetches made since last logged against reading each property
+        separately, then reset counts.
+        """
+        if self.reads == 0:
+            return
+        logger.info(
+            f"Read mass properties of {self.reads} parts with {self.fetches} "
+            f"MassProperties and CenterOfMass fetches, "
+            f"{self.separate_fetches} if read separately "
+            f"({self.fetches / self.reads:.1f} against "
+            f"{self.separate_fetches / self.reads:.1f} per part)."
+        )
+        self.reads = 0
+        self.fetches = 0
+        self.separate_fetches = 0
@@ -0,0 +1,139 @@
+"""
+MassRefiner is a class for refining the mass properties of an exported parts list.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+
+from .ExportProgress import ExportProgress
+from .FetchPlan import FetchPlan
+from .PartTable import PartTable
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Table fields replaced for each refined part field.
+REFINED_FIELDS = {
+    "mass": ["mass"],
+    "centre_of_mass": ["x_axis", "y_axis", "z_axis"],
+    "inertia": ["principal_moments", "principal_axes"],
+}
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class MassRefiner:
+    """
+    Recomputes mass properties of a parts list at a higher accuracy.
+
+    The COM worker traverses the assembly again and appends refined parts to
+    parts_list, in the same order as the rows of the table. The UI thread calls
+    apply to write the mass properties of parts that have arrived into their
+    rows, so the table is only changed on the UI thread.
+
+    Attributes
+    ----------
+    table: PartTable
+        Parts list refined in place.
+    fetch_plan: FetchPlan
+        Mass property fields of the export, at the refined accuracy.
+    parts_list: list
+        Refined parts, appended by the COM worker.
+    applied: int
+        Number of refined parts written to the table.
+    mismatched: bool
+        A refined part had a different occurrence path to its row, so the
+        assembly changed and refinement stopped.
+    progress: ExportProgress
+        Progress of refinement, cancelled to stop it.
+    """
+
+    def __init__(self, table: PartTable, fetch_plan: FetchPlan, accuracy: str):
+        """
+        Initialise.
+
+        Args:
+            table (PartTable): Parts list to refine.
+            fetch_plan (FetchPlan): Fetch plan of export.
+            accuracy (str): Accuracy level to refine to.
+        """
+        self.table = table
+        self.fetch_plan = FetchPlan(
+            fetch_plan.fields.intersection(REFINED_FIELDS), accuracy
+        )
+        self.table_fields = ["accuracy"]
+        for field in self.fetch_plan.fields:
+            self.table_fields.extend(REFINED_FIELDS[field])
+        self.parts_list = []
+        self.applied = 0
+        self.mismatched = False
+        self.progress = ExportProgress()
+
+    def check_needed(self) -> bool:
+        """
+        Check export has mass properties to refine.
+
+        Returns:
+            bool: Any mass property fetched.
+        """
+        return bool(self.fetch_plan.fields)
+
+    def apply(self) -> int:
+        """
+        Write mass properties of refined parts that have arrived into the table.
+
+        Returns:
+            int: Number of rows updated.
+        """
+        start = self.applied
+        stop = min(len(self.parts_list), len(self.table))
+        if self.mismatched or stop <= start:
+            return 0
+        parts_list = self.parts_list[start:stop]
+
+        # Stop at first part of a different occurrence to its row.
+        paths = self.table.occurrence_paths
+        for offset, part in enumerate(parts_list):
+            if part.occurrence_path != paths[start + offset]:
+                logger.warning(
+                    f"Refined part {part.occurrence_path} does not match row "
+                    f"{start + offset}, stopping refinement."
+                )
+                self.mismatched = True
+                self.progress.cancel()
+                parts_list = parts_list[:offset]
+                break
+
+        stop = start + len(parts_list)
+        self.table.set_rows(list(range(start, stop)), parts_list, self.table_fields)
+        self.applied = stop
+        return stop - start
+
+    def finish(self) -> bool:
+        """
+        Write remaining refined parts once the COM worker is done.
+
+        Returns:
+            bool: Every row refined, False if cancelled or rows did not match.
+        """
+        self.apply()
+        if self.mismatched:
+            return False
+        if self.progress.cancelled:
+            logger.info(f"Refinement cancelled after {self.applied} rows.")
+            return False
+        if len(self.parts_list) != len(self.table):
+            logger.warning(
+                f"Refinement found {len(self.parts_list)} parts for "
+                f"{len(self.table)} rows, assembly may have changed."
+            )
+            return False
+        logger.info(
+            f"Refined {self.applied} rows to {self.fetch_plan.accuracy} accuracy."
+        )
+        return True
@@ -0,0 +1,116 @@
+"""
+MassSummary is a class for the overall mass and centre of mass of a parts list.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+from html import escape
+
+import numpy as np
+
+from .PartTable import PartTable
+from .InertiaSummary import InertiaSummary
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+AXES = ["x_axis", "y_axis", "z_axis"]
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class MassSummary:
+    """
+    Summary of a parts list, computed with NumPy reductions over a PartTable.
+
+    Attributes
+    ----------
+    part_count: int
+        Number of parts.
+    total_mass: float
+        Sum of mass of parts with a mass.
+    missing_mass: int
+        Number of parts without a mass.
+    missing_centre_of_mass: int
+        Number of parts without a centre of mass.
+    included_mass: float
+        Mass of parts with both mass and centre of mass.
+    moments: list
+        Sum of moments along x, y and z axes of included parts.
+    centre_of_mass: list
+        Overall centre of mass along x, y and z axes, None if no included mass.
+    inertia: InertiaSummary
+        Inertia tensor about centre of mass, None if not requested.
+    """
+
+    def __init__(self, table: PartTable, inertia: bool = False):
+        """
+        Initialise.
+
+        Args:
+            table (PartTable): Parts list.
+            inertia (bool): Whether to compute inertia tensor. Defaults to False.
+        """
+        mass = table.get_column("mass")
+        points = np.column_stack([table.get_column(axis) for axis in AXES])
+
+        # Count missing values.
+        mass_missing = np.isnan(mass)
+        centre_missing = np.isnan(points).any(axis=1)
+        self.part_count = len(table)
+        self.missing_mass = int(np.count_nonzero(mass_missing))
+        self.missing_centre_of_mass = int(np.count_nonzero(centre_missing))
+
+        # Sum masses and moments of parts with complete values.
+        included = ~(mass_missing | centre_missing)
+        self.total_mass = float(mass[~mass_missing].sum())
+        self.included_mass = float(mass[included].sum())
+        self.moments = (mass[included] @ points[included]).tolist()
+        if self.included_mass > 0:
+            self.centre_of_mass = [
+                moment / self.included_mass for moment in self.moments
+            ]
+        else:
+            self.centre_of_mass = [None, None, None]
+
+        self.inertia = InertiaSummary(table) if inertia else None
+
+    def get_rows(self) -> list:
+        """
+        Get summary as label and value pairs.
+
+        Returns:
+            list: Label and value for each summary row.
+        """
+        rows = [
+            ("Parts", self.part_count),
+            ("Total mass (kg)", self.total_mass),
+            ("Parts missing mass", self.missing_mass),
+            ("Parts missing centre of mass", self.missing_centre_of_mass),
+            ("Mass included in centre of mass (kg)", self.included_mass),
+        ]
+        for label, centre, moment in zip("XYZ", self.centre_of_mass, self.moments):
+            rows.append((f"CoM {label}-axis (mm)", centre))
+            rows.append((f"{label}-axis mass sum", moment))
+        return rows
+
+    def to_html(self) -> str:
+        """
+        Get summary as HTML table.
+
+        Returns:
+            str: HTML content.
+        """
+        rows = "".join(
+            f"<tr><th>{escape(label)}</th><td>{escape(str(value))}</td></tr>"
+            for label, value in self.get_rows()
+        )
+        inertia_html = "" if self.inertia is None else self.inertia.to_html()
+        return f"<h3>Summary</h3><table>{rows}</table>{inertia_html}"
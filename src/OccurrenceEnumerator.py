@@ -0,0 +1,209 @@
+"""
+OccurrenceEnumerator is a class for enumerating occurrences in an assembly.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+# Inventor DocumentTypeEnum values.
+PART_DOCUMENT = 12290
+ASSEMBLY_DOCUMENT = 12291
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class OccurrenceEntry:
+    """
+    An occurrence found during enumeration.
+
+    Attributes
+    ----------
+    occurrence:
+        Occurrence.
+    doc_type: int
+        Definition document type, None if unavailable.
+    parent: OccurrenceEntry
+        Entry of parent sub-assembly, None for top-level occurrences.
+    descend: bool
+        Set False on an assembly entry to skip its sub-occurrences.
+    end: bool
+        True when an assembly entry is yielded after its sub-occurrences.
+    """
+
+    def __init__(self, occurrence, doc_type: int, parent=None, depth: int = None):
+        """
+        Initialise.
+
+        Args:
+            occurrence: Occurrence.
+            doc_type (int): Definition document type.
+            parent (OccurrenceEntry): Entry of parent sub-assembly, optional.
+            depth (int): Depth in assembly, looked up from Inventor if not given.
+        """
+        self.occurrence = occurrence
+        self.doc_type = doc_type
+        self.parent = parent
+        self.descend = True
+        self.end = False
+        self._depth = depth
+        self._path = None
+        self._bulk = depth is None
+
+    @property
+    def path(self) -> tuple:
+        """
+        Occurrence names from the top-level assembly down to this occurrence.
+        """
+        if self._path is None:
+            if self._bulk:
+                # Bulk leaf occurrences know their own path.
+                self._path = tuple(occ.Name for occ in self.occurrence.OccurrencePath)
+            else:
+                # Collect names up to the nearest entry with a known path.
+                names = []
+                entry = self
+                while entry is not None and entry._path is None:
+                    names.append(entry.occurrence.Name)
+                    entry = entry.parent
+                parent_path = entry._path if entry is not None else ()
+                self._path = parent_path + tuple(reversed(names))
+        return self._path
+
+    @property
+    def depth(self) -> int:
+        """
+        Depth in assembly, zero for top-level occurrences.
+        """
+        if self._depth is None:
+            self._depth = self.occurrence.OccurrencePath.Count - 1
+        return self._depth
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class OccurrenceEnumerator:
+    """
+    Enumerates occurrences without recursion.
+
+    The "iterative" strategy walks SubOccurrences with an explicit stack, yielding
+    every occurrence. Assembly entries are yielded before their sub-occurrences,
+    and again with end set once their sub-occurrences are finished. The "all_leaf"
+    strategy fetches AllLeafOccurrences in bulk and only yields leaf occurrences,
+    falling back to the iterative strategy if unavailable.
+
+    Attributes
+    ----------
+    strategy: str
+        Enumeration strategy.
+    visited: int
+        Number of occurrences yielded.
+    """
+
+    STRATEGIES = ["iterative", "all_leaf"]
+
+    def __init__(self, strategy: str = "iterative"):
+        """
+        Initialise.
+
+        Args:
+            strategy (str): Enumeration strategy, "iterative" or "all_leaf".
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown enumeration strategy '{strategy}'.")
+        self.strategy = strategy
+        self.visited = 0
+
+    def walk(self, occurrences):
+        """
+        Walk occurrences.
+
+        Args:
+            occurrences: Occurrences of component definition.
+
+        Yields:
+            OccurrenceEntry: Entry for each occurrence.
+        """
+        if self.strategy == "all_leaf":
+            try:
+                leaf_occurrences = occurrences.AllLeafOccurrences
+            except Exception as e:
+                logger.error(f"Unable to get leaf occurrences, walking instead: {e}")
+            else:
+                yield from self.walk_leaf_occurrences(leaf_occurrences)
+                return
+
+        yield from self.walk_sub_occurrences(occurrences)
+
+    def walk_leaf_occurrences(self, leaf_occurrences):
+        """
+        Walk flat collection of leaf occurrences.
+
+        Args:
+            leaf_occurrences: Leaf occurrences.
+
+        Yields:
+            OccurrenceEntry: Entry for each leaf occurrence.
+        """
+        for occurrence in leaf_occurrences:
+            self.visited += 1
+            yield OccurrenceEntry(occurrence, self.get_doc_type(occurrence))
+
+    def walk_sub_occurrences(self, occurrences):
+        """
+        Walk occurrences and sub-occurrences using an explicit stack.
+
+        Args:
+            occurrences: Top-level occurrences.
+
+        Yields:
+            OccurrenceEntry: Entry for each occurrence.
+        """
+        stack = [(iter(occurrences), None)]
+        while stack:
+            iterator, parent = stack[-1]
+
+            # Finish sub-assembly.
+            occurrence = next(iterator, None)
+            if occurrence is None:
+                stack.pop()
+                if parent is not None:
+                    parent.end = True
+                    yield parent
+                continue
+
+            self.visited += 1
+            entry = OccurrenceEntry(
+                occurrence, self.get_doc_type(occurrence), parent, len(stack) - 1
+            )
+            yield entry
+
+            # Descend into sub-assembly.
+            if entry.doc_type == ASSEMBLY_DOCUMENT and entry.descend:
+                stack.append((iter(occurrence.SubOccurrences), entry))
+
+    def get_doc_type(self, occurrence) -> int:
+        """
+        Get definition document type of occurrence.
+
+        Args:
+            occurrence: Occurrence.
+
+        Returns:
+            int: Document type, None if unavailable.
+        """
+        try:
+            return occurrence.DefinitionDocumentType
+        except Exception as e:
+            logger.error(f"Unable to get occurrence document type: {e}")
+            return None
@@ -8,11 +8,46 @@ Created on Thursday 5th Jue 2025.
 
 import logging.config
 
+from .FetchPlan import FetchPlan
+
 # - - - - - - - - - - - - - - - - - - - - -
 
 global logger
 logger = logging.getLogger()
 
+# Fields needed to recreate a part without Inventor.
+RECORD_FIELDS = [
+    "part_number",
+    "part_name",
+    "mass",
+    "x_axis",
+    "y_axis",
+    "z_axis",
+    "principal_moments",
+    "principal_axes",
+    "accuracy",
+]
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def read_document_properties(document) -> dict:
+    """
+    Read document-level properties for a part.
+
+    Args:
+        document: Definition document.
+
+    Returns:
+        dict: Part number and part name.
+    """
+    prop_set = document.PropertySets.Item("Design Tracking Properties")
+    return {
+        "part_number": prop_set.Item("Part Number").Value,
+        "part_name": prop_set.Item("Description").Value,
+    }
+
+
 # - - - - - - - - - - - - - - - - - - - - -
 
 
@@ -42,69 +77,188 @@ class Part:
         Length along z-axis
     z_axis_mass: double
         Centre of mass along z-axis.
+    principal_moments: list
+        Principal moments of inertia about centre of mass in kg mm^2.
+    principal_axes: list
+        Principal axes of inertia as rows, matching principal_moments.
+    accuracy: str
+        Accuracy level mass properties were read at, None if unknown.
+    occurrence_path: tuple
+        Occurrence names from top-level assembly, set during traversal.
+    read_failed: bool
+        Reading part from Inventor failed, so values are placeholders.
     """
 
-    def __init__(self, occurrence=None, assembly_doc=None):
+    def __init__(
+        self, occurrence=None, assembly_doc=None, property_cache=None, fetch_plan=None
+    ):
         """
         Initialise.
 
         Args:
             occurrence: Part occurrence, optional.
             assembly_doc: Assembly document, optional.
+            property_cache (PropertyCache): Cache for document properties, optional.
+            fetch_plan (FetchPlan): Fields to fetch, optional. Defaults to all fields.
         """
+        if fetch_plan is None:
+            fetch_plan = FetchPlan()
+        fields = fetch_plan.fields
+        self.occurrence_path = None
+        self.read_failed = False
         try:
             if occurrence:
-                prop_set = occurrence.Definition.Document.PropertySets.Item(
-                    "Design Tracking Properties"
-                )
+                document = occurrence.Definition.Document
             elif assembly_doc:
-                prop_set = assembly_doc.ComponentDefinition.Document.PropertySets.Item(
-                    "Design Tracking Properties"
-                )
+                document = assembly_doc.ComponentDefinition.Document
             else:
                 logger.error("No occurrence or assembly document provided.")
                 raise ValueError
 
             # Initial values.
-            self.part_number = prop_set.Item("Part Number").Value
-            self.part_name = prop_set.Item("Description").Value
+            self.part_number = None
+            self.part_name = None
+            self.mass = None
+            self.x_axis = None
+            self.y_axis = None
+            self.z_axis = None
+            self.principal_moments = None
+            self.principal_axes = None
+            self.accuracy = None
+
+            if "part_number" in fields or "part_name" in fields:
+                if property_cache is not None:
+                    properties = property_cache.get_document_properties(document)
+                else:
+                    properties = read_document_properties(document)
+                if "part_number" in fields:
+                    self.part_number = properties["part_number"]
+                if "part_name" in fields:
+                    self.part_name = properties["part_name"]
 
             # Set reference document.
             ref_doc = occurrence if occurrence else assembly_doc.ComponentDefinition
 
-            try:
-                self.mass = ref_doc.MassProperties.Mass
-                logger.info("Successfully got mass of part.")
-            except Exception as e:
-                self.mass = None
-                logger.error(f"Unable to get mass of part, {e}")
-
-            try:
-                self.x_axis = ref_doc.MassProperties.CenterOfMass.X * 10
-                self.y_axis = ref_doc.MassProperties.CenterOfMass.Y * 10
-                self.z_axis = ref_doc.MassProperties.CenterOfMass.Z * 10
-                logger.info("Successfully got centre of mass of part.")
-
-                self.x_axis_mass = self.x_axis * self.mass
-                self.y_axis_mass = self.y_axis * self.mass
-                self.z_axis_mass = self.z_axis * self.mass
-
-            except Exception as e:
-                self.x_axis = None
-                self.y_axis = None
-                self.z_axis = None
-                self.x_axis_mass = None
-                self.y_axis_mass = None
-                self.z_axis_mass = None
-                logger.error(f"Unable to get centre of mass of part, {e}")
+            # Read every mass property from one handle.
+            record = fetch_plan.mass_reader.read(ref_doc)
+            self.mass = record.mass
+            if record.centre_of_mass is not None:
+                self.x_axis, self.y_axis, self.z_axis = record.centre_of_mass
+            self.principal_moments = record.principal_moments
+            self.principal_axes = record.principal_axes
+            self.accuracy = record.accuracy
+
+            self.set_centre_of_mass(self.x_axis, self.y_axis, self.z_axis)
         except Exception as e:
             logger.error(f"Unable to process part {occurrence.Name}: {e}")
+            self.read_failed = True
             self.part_number = occurrence.Name
             self.part_name = None
             self.mass = None
             self.x_axis = None
             self.y_axis = None
             self.z_axis = None
-            self.x_axis_mass = None
-            self.y_axis_mass = None
-            self.z_axis_mass = None
+            self.principal_moments = None
+            self.principal_axes = None
+            self.accuracy = None
+
+    @classmethod
+    def from_record(cls, record: dict):
+        """
+        Create part from recorded values without accessing Inventor.
+
+        Args:
+            record (dict): Values for each field in RECORD_FIELDS.
+
+        Returns:
+            Part: New part.
+        """
+        part = cls.__new__(cls)
+        part.occurrence_path = None
+        part.read_failed = False
+        part.part_number = record["part_number"]
+        part.part_name = record["part_name"]
+        part.mass = record["mass"]
+        part.principal_moments = record.get("principal_moments")
+        part.principal_axes = record.get("principal_axes")
+        part.accuracy = record.get("accuracy")
+        part.set_centre_of_mass(record["x_axis"], record["y_axis"], record["z_axis"])
+        return part
+
+    def to_record(self) -> dict:
+        """
+        Get recorded values for part.
+
+        Returns:
+            dict: Values for each field in RECORD_FIELDS.
+        """
+        return {field: getattr(self, field) for field in RECORD_FIELDS}
+
+    def set_centre_of_mass(self, x_axis, y_axis, z_axis):
+        """
+        Set centre of mass of part.
+
+        Args:
+            x_axis (double): Centre of mass along x-axis, optional.
+            y_axis (double): Centre of mass along y-axis, optional.
+            z_axis (double): Centre of mass along z-axis, optional.
+        """
+        if None in (x_axis, y_axis, z_axis):
+            x_axis = y_axis = z_axis = None
+
+        self.x_axis = x_axis
+        self.y_axis = y_axis
+        self.z_axis = z_axis
+
+    def get_moment(self, axis):
+        """
+        Get moment of part along axis.
+
+        Args:
+            axis (double): Centre of mass along axis, optional.
+
+        Returns:
+            double: Moment, None if mass or centre of mass missing.
+        """
+        if axis is None or self.mass is None:
+            return None
+        return axis * self.mass
+
+    # Moments are derived on access, PartTable derives them for all parts at once.
+    @property
+    def x_axis_mass(self):
+        return self.get_moment(self.x_axis)
+
+    @property
+    def y_axis_mass(self):
+        return self.get_moment(self.y_axis)
+
+    @property
+    def z_axis_mass(self):
+        return self.get_moment(self.z_axis)
+
+    def get_principal_moment(self, index: int):
+        """
+        Get principal moment of inertia.
+
+        Args:
+            index (int): Index of principal moment, in ascending order.
+
+        Returns:
+            double: Principal moment, None if missing.
+        """
+        if self.principal_moments is None:
+            return None
+        return self.principal_moments[index]
+
+    @property
+    def principal_moment_1(self):
+        return self.get_principal_moment(0)
+
+    @property
+    def principal_moment_2(self):
+        return self.get_principal_moment(1)
+
+    @property
+    def principal_moment_3(self):
+        return self.get_principal_moment(2)
@@ -0,0 +1,320 @@
+"""
+PartCache is a class for persisting part properties between exports.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+from .Part import Part
+from .FetchPlan import FetchPlan
+from .MassPropertiesReader import check_accuracy
+from .SubAssemblyCache import get_transformation_matrix, transform_part
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Record values for each fetched field.
+FIELD_VALUES = {
+    "part_number": ["part_number"],
+    "part_name": ["part_name"],
+    "mass": ["mass"],
+    "centre_of_mass": ["x_axis", "y_axis", "z_axis"],
+    "inertia": ["principal_moments", "principal_axes"],
+}
+
+# Fetched fields read at the accuracy level of a record.
+ACCURACY_FIELDS = {"mass", "centre_of_mass", "inertia"}
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class PartCache:
+    """
+    An SQLite cache of part properties keyed by definition file path, modification
+    time and size.
+
+    Values are stored in the part document's own coordinates, so any occurrence of
+    the part is created from the cache by applying its transformation. Documents
+    with unsaved changes are never cached. The database is only opened on first
+    use, from the thread that uses it.
+
+    Attributes
+    ----------
+    filename: str
+        Database filename.
+    max_entries: int
+        Maximum number of parts kept, least recently used are removed first.
+    hits: int
+        Number of parts created from the cache.
+    misses: int
+        Number of parts fetched from Inventor and stored.
+    bypassed: int
+        Number of parts fetched from Inventor without using the cache.
+    """
+
+    def __init__(self, filename: str, max_entries: int = 200000):
+        """
+        Initialise without opening database.
+
+        Args:
+            filename (str): Database filename.
+            max_entries (int): Maximum number of parts kept. Defaults to 200000.
+        """
+        self.filename = filename
+        self.max_entries = max_entries
+        self.connection = None
+        self.entries = {}
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open database, creating it if needed.
+
+        Returns:
+            sqlite3.Connection: Database connection.
+        """
+        if self.connection is None:
+            directory = os.path.dirname(self.filename)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.connection = sqlite3.connect(self.filename)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS parts ("
+                "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, "
+                "fields TEXT, record TEXT, last_used REAL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS parts_last_used ON parts (last_used)"
+            )
+            logger.info(f"Opened part cache {self.filename}.")
+        return self.connection
+
+    def get_key(self, document) -> tuple:
+        """
+        Get cache key of document.
+
+        Args:
+            document: Part document.
+
+        Returns:
+            tuple: Path, modification time and size, None if document not cacheable.
+        """
+        try:
+            if document.Dirty:
+                return None
+            path = document.FullFileName
+            stat = os.stat(path)
+        except Exception as e:
+            logger.info(f"Not caching part document: {e}")
+            return None
+        return os.path.normcase(path), stat.st_mtime, stat.st_size
+
+    def lookup(self, key: tuple, fields: set, accuracy: str = None) -> dict:
+        """
+        Look up local part record.
+
+        Args:
+            key (tuple): Path, modification time and size.
+            fields (set): Fields needed.
+            accuracy (str): Accuracy level of mass properties needed, optional.
+
+        Returns:
+            dict: Local part record, None if not cached.
+        """
+        path, mtime, size = key
+        if path not in self.entries:
+            row = (
+                self.connect()
+                .execute(
+                    "SELECT mtime, size, fields, record FROM parts WHERE path = ?",
+                    (path,),
+                )
+                .fetchone()
+            )
+            if row is None:
+                return None
+            self.entries[path] = (
+                row[0],
+                row[1],
+                set(json.loads(row[2])),
+                json.loads(row[3]),
+            )
+
+        # Check entry is for current file and has needed fields.
+        cached_mtime, cached_size, cached_fields, record = self.entries[path]
+        if cached_mtime != mtime or cached_size != size:
+            return None
+        if not fields.issubset(cached_fields):
+            return None
+        if not check_accuracy(record.get("accuracy"), accuracy):
+            return None
+        self.used.add(path)
+        return record
+
+    def get_part(self, occurrence, property_cache=None, fetch_plan=None) -> Part:
+        """
+        Get part of occurrence, from cache if available.
+
+        Args:
+            occurrence: Part occurrence.
+            property_cache (PropertyCache): Cache for document properties, optional.
+            fetch_plan (FetchPlan): Fields to fetch, optional. Defaults to all fields.
+
+        Returns:
+            Part: Part in top-level assembly space.
+        """
+        if fetch_plan is None:
+            fetch_plan = FetchPlan()
+        fields = set(fetch_plan.fields)
+        key = self.get_key(occurrence.Definition.Document)
+        if key is None:
+            self.bypassed += 1
+            return Part(
+                occurrence, property_cache=property_cache, fetch_plan=fetch_plan
+            )
+
+        # Create part from cache.
+        record = self.lookup(key, fields, fetch_plan.accuracy)
+        if record is not None:
+            self.hits += 1
+            part = Part.from_record(record)
+            transform_part(part, get_transformation_matrix(occurrence))
+            return part
+
+        # Fetch from Inventor and store in local coordinates.
+        self.misses += 1
+        part = Part(occurrence, property_cache=property_cache, fetch_plan=fetch_plan)
+        if part.read_failed:
+            return part
+        record = self.get_local_record(
+            part, get_transformation_matrix(occurrence), fields
+        )
+        if record is not None:
+            self.store(key, fields, record)
+        return part
+
+    def get_local_record(self, part: Part, matrix: np.ndarray, fields: set) -> dict:
+        """
+        Get record of part in local coordinates.
+
+        Args:
+            part (Part): Part in top-level assembly space.
+            matrix (np.ndarray): Transformation matrix of part occurrence.
+            fields (set): Fields fetched.
+
+        Returns:
+            dict: Local part record, None if a fetched field is missing.
+        """
+        # Missing values mean fetching failed, so are not cached.
+        record = part.to_record()
+        for field in fields:
+            if any(record[name] is None for name in FIELD_VALUES[field]):
+                return None
+
+        # Convert to local coordinates.
+        local = Part.from_record(record)
+        transform_part(local, np.linalg.inv(matrix))
+        return local.to_record()
+
+    def store(self, key: tuple, fields: set, record: dict):
+        """
+        Store local part record.
+
+        Cached mass properties are only kept alongside new ones if they were
+        read at the new record's accuracy or higher, as the record has a single
+        accuracy level.
+
+        Args:
+            key (tuple): Path, modification time and size.
+            fields (set): Fields in record.
+            record (dict): Local part record.
+        """
+        path, mtime, size = key
+
+        # Keep other fields already cached for same file.
+        if path in self.entries:
+            cached_mtime, cached_size, cached_fields, cached_record = self.entries[path]
+            if cached_mtime == mtime and cached_size == size:
+                record = dict(record)
+                cached_accuracy = cached_record.get("accuracy")
+                if not fields.intersection(ACCURACY_FIELDS):
+                    record["accuracy"] = cached_accuracy
+                elif not check_accuracy(cached_accuracy, record["accuracy"]):
+                    # Drop mass properties less accurate than the new record.
+                    cached_fields = cached_fields.difference(ACCURACY_FIELDS)
+                for field in cached_fields.difference(fields):
+                    for name in FIELD_VALUES[field]:
+                        record[name] = cached_record[name]
+                fields = fields.union(cached_fields)
+
+        self.connect().execute(
+            "INSERT OR REPLACE INTO parts VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                mtime,
+                size,
+                json.dumps(sorted(fields)),
+                json.dumps(record),
+                time.time(),
+            ),
+        )
+        self.entries[path] = (mtime, size, set(fields), record)
+
+    def flush(self):
+        """
+        Record part usage, remove least recently used parts and commit.
+        """
+        if self.connection is None:
+            return
+
+        # Update usage of cache hits.
+        now = time.time()
+        self.connection.executemany(
+            "UPDATE parts SET last_used = ? WHERE path = ?",
+            [(now, path) for path in self.used],
+        )
+        self.used.clear()
+
+        # Remove least recently used parts over size cap.
+        count = self.connection.execute("SELECT COUNT(*) FROM parts").fetchone()[0]
+        if count > self.max_entries:
+            self.connection.execute(
+                "DELETE FROM parts WHERE path IN "
+                "(SELECT path FROM parts ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,),
+            )
+            self.entries.clear()
+            logger.info(f"Removed {count - self.max_entries} parts from part cache.")
+        self.connection.commit()
+
+    def close(self):
+        """
+        Flush and close database.
+        """
+        self.flush()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def log_statistics(self):
+        """
+        Log cache hit and miss counts.
+        """
+        logger.info(
+            f"Part cache: {self.hits} hits, {self.misses} misses, "
+            f"{self.bypassed} bypassed."
+        )
@@ -0,0 +1,64 @@
+"""
+PartStream is a class for showing parts of an export while traversal is still running.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+
+from .PartTable import PartTable
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class PartStream:
+    """
+    Parts found by a running export, taken into a table in batches.
+
+    The COM worker appends parts to parts_list as traversal finds them. The UI
+    thread calls take to append parts that have arrived since the last batch to
+    table, so the table is only changed on the UI thread and can be previewed
+    before traversal finishes.
+
+    Attributes
+    ----------
+    parts_list: list
+        Parts found so far, appended by the COM worker.
+    table: PartTable
+        Parts taken so far.
+    batches: int
+        Number of batches taken.
+    """
+
+    def __init__(self):
+        """
+        Initialise.
+        """
+        self.parts_list = []
+        self.table = PartTable()
+        self.batches = 0
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def take(self) -> int:
+        """
+        Append parts that have arrived to table.
+
+        Returns:
+            int: Number of parts appended.
+        """
+        start = len(self.table)
+        stop = len(self.parts_list)
+        if stop <= start:
+            return 0
+        self.table.extend(self.parts_list[start:stop])
+        self.batches += 1
+        return stop - start
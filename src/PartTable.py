@@ -0,0 +1,361 @@
+"""
+PartTable is a class for storing parts lists column by column.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import sys
+
+import numpy as np
+import pandas as pd
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+# Text columns, stored as lists of interned strings.
+STRING_FIELDS = ["part_number", "part_name", "accuracy"]
+
+# Numeric columns and the shape of each value, stored as float64 arrays with NaN
+# for missing values.
+NUMERIC_FIELDS = {
+    "mass": (),
+    "x_axis": (),
+    "y_axis": (),
+    "z_axis": (),
+    "principal_moments": (3,),
+    "principal_axes": (3, 3),
+}
+
+# Moment columns and the centre of mass column they are derived from.
+MOMENT_FIELDS = {
+    "x_axis_mass": "x_axis",
+    "y_axis_mass": "y_axis",
+    "z_axis_mass": "z_axis",
+}
+
+# Principal moment columns and their index in principal_moments.
+PRINCIPAL_MOMENT_FIELDS = {
+    "principal_moment_1": 0,
+    "principal_moment_2": 1,
+    "principal_moment_3": 2,
+}
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def intern_string(value):
+    """
+    Intern string so repeated values share one object.
+
+    Args:
+        value: Value to intern, optional.
+
+    Returns:
+        Interned string, or value unchanged if not a string.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def to_number(value, shape: tuple = ()):
+    """
+    Convert value to float, using NaN for missing values.
+
+    Args:
+        value: Value, optional.
+        shape (tuple): Shape of value. Defaults to a single value.
+
+    Returns:
+        Value, or NaN with shape of value.
+    """
+    if value is not None:
+        return value
+    if shape:
+        return np.full(shape, np.nan)
+    return np.nan
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class PartTable:
+    """
+    A columnar parts list.
+
+    Attributes
+    ----------
+    strings: dict
+        Lists of interned strings keyed by field.
+    numbers: dict
+        Float64 arrays keyed by field, NaN where missing. Arrays grow as parts
+        are appended, so only the first len(table) values are used.
+    occurrence_paths: list
+        Occurrence path of each part.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialise.
+
+        Args:
+            capacity (int): Initial number of rows allocated. Defaults to 1024.
+        """
+        self.length = 0
+        self.strings = {field: [] for field in STRING_FIELDS}
+        self.numbers = {
+            field: np.full((max(capacity, 1),) + shape, np.nan)
+            for field, shape in NUMERIC_FIELDS.items()
+        }
+        self.occurrence_paths = []
+        self.moments = None
+
+    @classmethod
+    def from_parts(cls, parts_list: list):
+        """
+        Create table from parts.
+
+        Args:
+            parts_list (list): List of parts.
+
+        Returns:
+            PartTable: New table.
+        """
+        table = cls(len(parts_list))
+        table.extend(parts_list)
+        return table
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: slice):
+        """
+        Get rows of table, sharing numeric arrays with this table.
+
+        Args:
+            index (slice): Rows to get.
+
+        Returns:
+            PartTable: Table of selected rows.
+        """
+        if not isinstance(index, slice):
+            raise TypeError("PartTable rows can only be selected with a slice.")
+        start, stop, step = index.indices(self.length)
+        table = PartTable.__new__(PartTable)
+        table.strings = {
+            field: values[start:stop:step] for field, values in self.strings.items()
+        }
+        table.numbers = {
+            field: self.get_column(field)[start:stop:step] for field in NUMERIC_FIELDS
+        }
+        table.occurrence_paths = self.occurrence_paths[start:stop:step]
+        table.length = len(table.occurrence_paths)
+        table.moments = None
+        return table
+
+    def take(self, indices):
+        """
+        Get rows of table in given order.
+
+        Args:
+            indices: Row indices.
+
+        Returns:
+            PartTable: Table of selected rows.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        table = PartTable.__new__(PartTable)
+        table.strings = {
+            field: [values[index] for index in indices.tolist()]
+            for field, values in self.strings.items()
+        }
+        table.numbers = {
+            field: self.get_column(field)[indices] for field in NUMERIC_FIELDS
+        }
+        table.occurrence_paths = [
+            self.occurrence_paths[index] for index in indices.tolist()
+        ]
+        table.length = len(indices)
+        table.moments = None
+        return table
+
+    def copy(self):
+        """
+        Copy table.
+
+        Returns:
+            PartTable: Table with copied columns.
+        """
+        table = PartTable.__new__(PartTable)
+        table.strings = {field: list(values) for field, values in self.strings.items()}
+        table.numbers = {field: values.copy() for field, values in self.numbers.items()}
+        table.occurrence_paths = list(self.occurrence_paths)
+        table.length = self.length
+        table.moments = None
+        return table
+
+    def set_rows(self, indices: list, parts_list: list, fields: list = None):
+        """
+        Replace rows of table.
+
+        Args:
+            indices (list): Row indices to replace.
+            parts_list (list): Part for each row.
+            fields (list): Fields to replace, optional. Defaults to every field
+                and the occurrence path.
+        """
+        if not indices:
+            return
+
+        for field, values in self.strings.items():
+            if fields is not None and field not in fields:
+                continue
+            for index, part in zip(indices, parts_list):
+                values[index] = intern_string(getattr(part, field))
+        for field, values in self.numbers.items():
+            if fields is not None and field not in fields:
+                continue
+            shape = NUMERIC_FIELDS[field]
+            values[indices] = [
+                to_number(getattr(part, field), shape) for part in parts_list
+            ]
+        if fields is None:
+            for index, part in zip(indices, parts_list):
+                self.occurrence_paths[index] = part.occurrence_path
+        self.moments = None
+
+    def reserve(self, capacity: int):
+        """
+        Make sure numeric arrays can hold capacity rows.
+
+        Args:
+            capacity (int): Number of rows needed.
+        """
+        allocated = len(self.numbers["mass"])
+        if capacity <= allocated:
+            return
+
+        # Double allocation so appends stay amortised constant time.
+        allocated = max(capacity, allocated * 2)
+        for field, values in self.numbers.items():
+            grown = np.full((allocated,) + NUMERIC_FIELDS[field], np.nan)
+            grown[: self.length] = values[: self.length]
+            self.numbers[field] = grown
+
+    def append(self, part):
+        """
+        Append part to table.
+
+        Args:
+            part (Part): Part to append.
+        """
+        self.extend([part])
+
+    def extend(self, parts_list: list):
+        """
+        Append parts to table.
+
+        Args:
+            parts_list (list): Parts to append.
+        """
+        parts_list = list(parts_list)
+        if not parts_list:
+            return
+        start = self.length
+        stop = start + len(parts_list)
+        self.reserve(stop)
+
+        # Add string columns.
+        for field, values in self.strings.items():
+            values.extend(intern_string(getattr(part, field)) for part in parts_list)
+
+        # Add numeric columns.
+        for field, values in self.numbers.items():
+            shape = NUMERIC_FIELDS[field]
+            values[start:stop] = [
+                to_number(getattr(part, field), shape) for part in parts_list
+            ]
+
+        self.occurrence_paths.extend(part.occurrence_path for part in parts_list)
+        self.length = stop
+        self.moments = None
+
+    def get_moments(self) -> dict:
+        """
+        Get moment columns, derived once for all parts.
+
+        Returns:
+            dict: Float64 arrays keyed by moment field.
+        """
+        if self.moments is None:
+            mass = self.get_column("mass")
+            self.moments = {
+                field: self.get_column(axis) * mass
+                for field, axis in MOMENT_FIELDS.items()
+            }
+        return self.moments
+
+    def get_column(self, field: str):
+        """
+        Get column of table.
+
+        Args:
+            field (str): Field name.
+
+        Returns:
+            Array view for numeric fields, list for string fields.
+        """
+        if field in self.numbers:
+            return self.numbers[field][: self.length]
+        if field in MOMENT_FIELDS:
+            return self.get_moments()[field]
+        if field in PRINCIPAL_MOMENT_FIELDS:
+            index = PRINCIPAL_MOMENT_FIELDS[field]
+            return self.get_column("principal_moments")[:, index]
+        if field in self.strings:
+            return self.strings[field]
+        raise KeyError(f"Unknown part field {field}.")
+
+    def get_values(self, field: str) -> list:
+        """
+        Get column values as Python objects, using None for missing values.
+
+        Args:
+            field (str): Field name.
+
+        Returns:
+            list: Column values.
+        """
+        column = self.get_column(field)
+        if isinstance(column, list):
+            return column
+        values = column.astype(object)
+        values[np.isnan(column)] = None
+        return values.tolist()
+
+    def to_dataframe(self, column_plan) -> pd.DataFrame:
+        """
+        Create pandas dataframe from columns of table.
+
+        Args:
+            column_plan (ColumnPlan): Columns to include.
+
+        Returns:
+            pd.DataFrame: Dataframe with one column per plan column.
+        """
+        dataframe = pd.DataFrame(
+            {
+                index: self.get_column(field)
+                for index, field in enumerate(column_plan.attribute_names)
+            },
+            index=pd.RangeIndex(self.length),
+        )
+        dataframe.columns = column_plan.display_names
+        return dataframe
@@ -0,0 +1,183 @@
+"""
+PartTableView is a class for paging and sorting a PartTable for display.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+
+import numpy as np
+
+from .ColumnPlan import ColumnPlan
+from .PartTable import PartTable
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def format_summary_value(value) -> str:
+    """
+    Format summary value for display.
+
+    Args:
+        value: Value, None if missing.
+
+    Returns:
+        str: Text shown in summary.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def format_summary(summary) -> str:
+    """
+    Format summary as lines of text.
+
+    Args:
+        summary (MassSummary): Summary of parts list, optional.
+
+    Returns:
+        str: Summary text.
+    """
+    if summary is None:
+        return ""
+    rows = summary.get_rows()
+    if summary.inertia is not None:
+        rows += summary.inertia.get_rows()
+    return "\n".join(f"{label}: {format_summary_value(value)}" for label, value in rows)
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class PartTableView:
+    """
+    A sorted view of a PartTable that formats only the rows asked for.
+
+    Sorting builds an index permutation over the table columns, so no rows are
+    copied and a page of rows is formatted only when it is shown.
+
+    Attributes
+    ----------
+    table: PartTable
+        Parts list.
+    column_plan: ColumnPlan
+        Columns shown.
+    order: np.ndarray
+        Table row index of each displayed row.
+    sort_column: int
+        Index of column sorted by, None if in export order.
+    descending: bool
+        Whether sorted column is in descending order.
+    """
+
+    def __init__(self, table: PartTable, column_plan: ColumnPlan):
+        """
+        Initialise in export order.
+
+        Args:
+            table (PartTable): Parts list.
+            column_plan (ColumnPlan): Columns shown.
+        """
+        self.table = table
+        self.column_plan = column_plan
+        self.order = np.arange(len(table))
+        self.sort_column = None
+        self.descending = False
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def sort(self, column_index: int):
+        """
+        Sort by column, reversing order if already sorted by it. Missing values
+        are always last.
+
+        Args:
+            column_index (int): Index of column in plan.
+        """
+        # Toggle direction on repeated sort.
+        if column_index == self.sort_column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column_index
+            self.descending = False
+
+        self.order = self.get_sorted_order()
+
+    def get_sorted_order(self):
+        """
+        Get row order sorted by sort column, keeping ties in export order.
+
+        Returns:
+            np.ndarray: Table row index of each displayed row.
+        """
+        # Sort present values, missing values are always last.
+        column = self.table.get_column(
+            self.column_plan.attribute_names[self.sort_column]
+        )
+        if isinstance(column, list):
+            missing = np.array([value is None for value in column], dtype=bool)
+            present = np.flatnonzero(~missing)
+            keys = np.array([column[index] for index in present], dtype=str)
+            order = present[np.argsort(keys, kind="stable")]
+        else:
+            missing = np.isnan(column)
+            present = np.flatnonzero(~missing)
+            order = present[np.argsort(column[present], kind="stable")]
+        if self.descending:
+            order = order[::-1]
+        return np.concatenate([order, np.flatnonzero(missing)])
+
+    def update_order(self, table: PartTable = None):
+        """
+        Update order after rows are appended to table, keeping sort column and
+        direction.
+
+        Args:
+            table (PartTable): Table replacing the viewed table, optional.
+        """
+        if table is not None:
+            self.table = table
+        if self.sort_column is None:
+            self.order = np.arange(len(self.table))
+        else:
+            self.order = self.get_sorted_order()
+
+    def get_heading(self, column_index: int) -> str:
+        """
+        Get column heading, marking sorted column.
+
+        Args:
+            column_index (int): Index of column in plan.
+
+        Returns:
+            str: Heading text.
+        """
+        heading = self.column_plan.display_names[column_index]
+        if column_index != self.sort_column:
+            return heading
+        return f"{heading} {'▼' if self.descending else '▲'}"
+
+    def get_page(self, start: int, count: int) -> list:
+        """
+        Get formatted rows of page.
+
+        Args:
+            start (int): First displayed row.
+            count (int): Number of rows.
+
+        Returns:
+            list: Tuple of cell text for each row.
+        """
+        stop = start + count
+        return self.column_plan.format_table(self.table.take(self.order[start:stop]))
@@ -6,11 +6,13 @@ Created on Friday 13th June 2025.
 
 """
 
-from tkinter import Frame, Label, DoubleVar, StringVar
+from tkinter import Frame, Label, Button, DoubleVar, StringVar
 from tkinter import ttk
 import tkinter.font as tkFont
 import logging.config
 
+from .ExportProgress import ExportProgress
+
 # - - - - - - - - - - - - - - - - - - - - -
 
 global logger
@@ -25,6 +27,7 @@ class ProgressBarWindow(Frame):
         Frame.__init__(self, window)
 
         self.progress = 0
+        self.maximum = 0
 
         # Create fonts.
         normal_font = tkFont.Font(family="Ubuntu", size=10)
@@ -53,38 +56,61 @@ class ProgressBarWindow(Frame):
         )
         percentage_label.grid(row=3, column=0)
 
-    def reset_progress(self):
-        """
-        Reset progress bar.
-        """
-        self.progress = 0
+        # Create throughput label.
+        self.throughput_var = StringVar(self)
+        throughput_label = Label(
+            self, textvariable=self.throughput_var, font=small_font
+        )
+        throughput_label.grid(row=4, column=0)
+
+        # Create cancel button.
+        self.cancel_button = Button(self, text="Cancel", width=10)
+        self.cancel_button.grid(row=5, column=0, pady=10)
 
-    def set_length(self, max_length: int):
+    def track(self, progress: ExportProgress, interval: int = 100):
         """
-        Set max length of progress bar.
+        Show export progress, checking again after interval.
 
         Args:
-            max_length (int): Max length of progress bar.
+            progress (ExportProgress): Progress of export.
+            interval (int): Time between checks in ms. Defaults to 100.
         """
-        self.maximum = max_length
-        self.update()
+        # Stop once window is closed.
+        if not self.winfo_exists():
+            return
+
+        # Cancel export from button.
+        if progress.cancelled:
+            self.cancel_button.configure(text="Cancelling...", state="disabled")
+        else:
+            self.cancel_button.configure(command=progress.cancel)
+
+        completed, maximum, task = progress.snapshot()
+        self.progress = completed
+        self.maximum = maximum
+
+        # Update widgets.
+        percentage = round(min(completed * 100 / maximum, 100), 2) if maximum else 0
+        self.percentage_var.set(percentage)
+        self.percentage_string_var.set(f"{percentage}%")
+        self.progress_bar["value"] = percentage
+        self.task_var.set(task)
+        self.throughput_var.set(self.format_throughput(*progress.get_throughput()))
 
-    def add_to_progress_bar(self):
-        """
-        Add to progress bar.
-        """
-        self.progress += 1
-        self.percentage_var.set(round(self.progress * 100 / self.maximum, 2))
-        self.percentage_string_var.set(f"{self.percentage_var.get()}%")
-        self.progress_bar.step(100 / self.maximum)
-        self.update()
+        self.after(interval, self.track, progress, interval)
 
-    def update_task(self, task: str):
+    def format_throughput(self, rate: float, remaining: float) -> str:
         """
-        Update task.
+        Format rate and time remaining.
 
         Args:
-            task (str): Current task.
+            rate (float): Occurrences per second, optional.
+            remaining (float): Seconds remaining, optional.
+
+        Returns:
+            str: Throughput text.
         """
-        self.task_var.set(task)
-        self.update()
+        if rate is None:
+            return ""
+        minutes, seconds = divmod(int(round(remaining)), 60)
+        return f"{rate:.0f} occurrences/s, {minutes}:{seconds:02d} remaining"
@@ -0,0 +1,78 @@
+"""
+PropertyCache is a class for caching document properties during traversal.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+
+from .Part import read_document_properties
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class PropertyCache:
+    """
+    A traversal-scoped cache of document-level part properties.
+
+    Values that belong to the definition document, such as part number and
+    description, are shared by every occurrence of that definition so are only
+    fetched once. Occurrence-level values, such as the centre of mass in assembly
+    space, are not cached.
+
+    Attributes
+    ----------
+    properties: dict
+        Document properties keyed by definition document FullFileName.
+    hits: int
+        Number of lookups served from the cache.
+    misses: int
+        Number of lookups fetched from Inventor.
+    """
+
+    def __init__(self):
+        """
+        Initialise.
+        """
+        self.properties = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_document_properties(self, document) -> dict:
+        """
+        Get document properties, fetching from Inventor if not cached.
+
+        Args:
+            document: Definition document.
+
+        Returns:
+            dict: Document properties.
+        """
+        key = document.FullFileName
+
+        # Check cache.
+        if key in self.properties:
+            self.hits += 1
+            return self.properties[key]
+
+        # Fetch from Inventor.
+        self.misses += 1
+        properties = read_document_properties(document)
+        self.properties[key] = properties
+        return properties
+
+    def log_statistics(self):
+        """
+        Log cache hit and miss counts.
+        """
+        logger.info(
+            f"Property cache: {self.hits} hits, {self.misses} misses, "
+            f"{len(self.properties)} definitions."
+        )
@@ -0,0 +1,380 @@
+"""
+RecordingBackend is a class for recording every Inventor call of a session for replay.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import functools
+import gzip
+import json
+import time
+import types
+
+from .InventorBackend import InventorBackend
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# Version of recording file format.
+RECORDING_VERSION = 1
+
+# Values stored directly in recordings, anything else is recorded as an object.
+PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+# Types returned when reading a method rather than a property.
+METHOD_TYPES = (
+    types.MethodType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    functools.partial,
+)
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def check_primitive(value) -> bool:
+    """
+    Check value can be stored directly in a recording.
+
+    Args:
+        value: Value returned by Inventor.
+
+    Returns:
+        bool: Primitive or tuple of primitives.
+    """
+    if isinstance(value, (tuple, list)):
+        return all(isinstance(item, PRIMITIVE_TYPES) for item in value)
+    return isinstance(value, PRIMITIVE_TYPES)
+
+
+def get_call_key(name: str, args: tuple) -> str:
+    """
+    Get recording key of method call.
+
+    Args:
+        name (str): Method name.
+        args (tuple): Call arguments.
+
+    Returns:
+        str: Key, e.g. 'Item(["Design Tracking Properties"])'.
+    """
+    return f"{name}({json.dumps(list(args), default=str)})"
+
+
+def unwrap(value):
+    """
+    Get Inventor object wrapped by proxy.
+
+    Args:
+        value: RecordingProxy or value.
+
+    Returns:
+        Wrapped object, or value unchanged.
+    """
+    if isinstance(value, RecordingProxy):
+        return value._target
+    return value
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class RecordingProxy:
+    """
+    Wraps an Inventor object, recording each attribute read, method call,
+    iteration and length through the backend.
+    """
+
+    def __init__(self, backend, target, object_id: int):
+        object.__setattr__(self, "_backend", backend)
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_object_id", object_id)
+
+    def __getattr__(self, name: str):
+        return self._backend.read(self, name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self._target, name, unwrap(value))
+
+    def __bool__(self) -> bool:
+        # Objects are truthy without reading a recorded length.
+        return True
+
+    def __iter__(self):
+        return iter(self._backend.iterate(self))
+
+    def __len__(self) -> int:
+        return self._backend.call(self, "__len__", self._target.__len__, ())
+
+
+class RecordingMethod:
+    """
+    Wraps an Inventor method, recording each call through the backend.
+    """
+
+    def __init__(self, backend, proxy: RecordingProxy, name: str, method):
+        self.backend = backend
+        self.proxy = proxy
+        self.name = name
+        self.method = method
+
+    def __call__(self, *args):
+        return self.backend.call(self.proxy, self.name, self.method, args)
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class RecordingBackend(InventorBackend):
+    """
+    Wraps another backend and records the session for ReplayBackend.
+
+    Every object returned by Inventor is given an id from the object and member
+    it was read from, so repeated reads of the same member share one recording.
+    Each member records its result, or the error raised, with the number of
+    reads and total time taken, so replays can reproduce per-call latency.
+
+    Attributes
+    ----------
+    backend: InventorBackend
+        Backend recorded.
+    objects: list
+        Recorded members of each object, keyed by member or call key.
+    documents: list
+        Documents opened, in order.
+    """
+
+    name = "recording"
+
+    def __init__(self, backend: InventorBackend):
+        """
+        Initialise.
+
+        Args:
+            backend (InventorBackend): Backend to record.
+        """
+        self.backend = backend
+        self.objects = []
+        self.child_ids = {}
+        self.documents = []
+
+    # - - - - - - - - - - - - - - - -
+    # Methods for recording calls.
+
+    def get_child_id(self, object_id: int, key: str) -> int:
+        """
+        Get id of object returned by member.
+
+        Args:
+            object_id (int): Id of object read from, None for root.
+            key (str): Member or call key.
+
+        Returns:
+            int: Object id.
+        """
+        if (object_id, key) not in self.child_ids:
+            self.child_ids[(object_id, key)] = len(self.objects)
+            self.objects.append({})
+        return self.child_ids[(object_id, key)]
+
+    def record(self, object_id: int, key: str, seconds: float, entry: dict):
+        """
+        Record result of member.
+
+        Args:
+            object_id (int): Id of object read from.
+            key (str): Member or call key.
+            seconds (float): Time taken.
+            entry (dict): Recorded result, without timing.
+        """
+        members = self.objects[object_id]
+        if key not in members:
+            members[key] = dict(entry, n=0, s=0.0)
+        members[key]["n"] += 1
+        members[key]["s"] += seconds
+
+    def wrap(self, object_id: int, key: str, seconds: float, value):
+        """
+        Record value returned by member, wrapping objects in proxies.
+
+        Args:
+            object_id (int): Id of object read from.
+            key (str): Member or call key.
+            seconds (float): Time taken.
+            value: Value returned.
+
+        Returns:
+            Value, or RecordingProxy for objects.
+        """
+        if check_primitive(value):
+            stored = list(value) if isinstance(value, tuple) else value
+            self.record(object_id, key, seconds, {"v": stored})
+            return value
+        child_id = self.get_child_id(object_id, key)
+        self.record(object_id, key, seconds, {"o": child_id})
+        return RecordingProxy(self, value, child_id)
+
+    def invoke(self, proxy: RecordingProxy, key: str, function, *args):
+        """
+        Time function, recording any error raised.
+
+        Returns:
+            tuple: Result and time taken.
+        """
+        object_id = proxy._object_id
+        start_time = time.perf_counter()
+        try:
+            result = function(*args)
+        except Exception as e:
+            self.record(object_id, key, time.perf_counter() - start_time, {"e": str(e)})
+            raise
+        return result, time.perf_counter() - start_time
+
+    def read(self, proxy: RecordingProxy, name: str):
+        """
+        Read attribute of proxied object.
+
+        Args:
+            proxy (RecordingProxy): Proxy read from.
+            name (str): Attribute name.
+
+        Returns:
+            Value, RecordingProxy or RecordingMethod.
+        """
+        target = proxy._target
+        value, seconds = self.invoke(proxy, name, getattr, target, name)
+        object_id = proxy._object_id
+        if isinstance(value, METHOD_TYPES):
+            self.record(object_id, name, seconds, {"m": 1})
+            return RecordingMethod(self, proxy, name, value)
+        return self.wrap(object_id, name, seconds, value)
+
+    def call(self, proxy: RecordingProxy, name: str, method, args: tuple):
+        """
+        Call method of proxied object.
+
+        Args:
+            proxy (RecordingProxy): Proxy of object.
+            name (str): Method name.
+            method: Method of wrapped object.
+            args (tuple): Call arguments.
+
+        Returns:
+            Value or RecordingProxy.
+        """
+        key = get_call_key(name, args)
+        value, seconds = self.invoke(proxy, key, method, *[unwrap(arg) for arg in args])
+        return self.wrap(proxy._object_id, key, seconds, value)
+
+    def iterate(self, proxy: RecordingProxy) -> list:
+        """
+        Iterate over proxied collection.
+
+        Args:
+            proxy (RecordingProxy): Proxy of collection.
+
+        Returns:
+            list: RecordingProxy of each item.
+        """
+        target = proxy._target
+        items, seconds = self.invoke(proxy, "__iter__", list, target)
+        object_id = proxy._object_id
+        ids = [
+            self.get_child_id(object_id, f"[{index}]") for index in range(len(items))
+        ]
+        self.record(object_id, "__iter__", seconds, {"i": ids})
+        return [
+            RecordingProxy(self, item, item_id) for item, item_id in zip(items, ids)
+        ]
+
+    def save(self, filename: str):
+        """
+        Save recording as gzipped JSON.
+
+        Args:
+            filename (str): Recording filename.
+        """
+        with gzip.open(filename, "wt", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": RECORDING_VERSION,
+                    "backend": self.backend.name,
+                    "documents": self.documents,
+                    "objects": self.objects,
+                },
+                f,
+                separators=(",", ":"),
+            )
+        logger.info(
+            f"Saved recording of {self.call_count} calls on {len(self.objects)} objects "
+            f"to {filename}."
+        )
+
+    # - - - - - - - - - - - - - - - -
+    # InventorBackend methods.
+
+    @property
+    def call_count(self) -> int:
+        """
+        Total number of calls recorded.
+        """
+        return sum(entry["n"] for members in self.objects for entry in members.values())
+
+    def initialise_thread(self):
+        self.backend.initialise_thread()
+
+    def uninitialise_thread(self):
+        self.backend.uninitialise_thread()
+
+    def pump_messages(self):
+        self.backend.pump_messages()
+
+    def connect(self, visible: bool = True):
+        """
+        Connect to Inventor application, recording from it.
+
+        Args:
+            visible (bool): Show Inventor window, or None to leave it unchanged.
+                Defaults to True.
+
+        Returns:
+            RecordingProxy: Application.
+        """
+        app = self.backend.connect(visible)
+        return RecordingProxy(self, app, self.get_child_id(None, "Application"))
+
+    def cast(self, document, interface: str):
+        """
+        Cast proxied document, recording the cast document.
+
+        Args:
+            document (RecordingProxy): Document.
+            interface (str): Interface name.
+
+        Returns:
+            RecordingProxy: Document with interface.
+        """
+        object_id = document._object_id
+        cast_document = self.backend.cast(unwrap(document), interface)
+        child_id = self.get_child_id(object_id, f"cast:{interface}")
+        self.record(object_id, f"cast:{interface}", 0.0, {"o": child_id})
+        return RecordingProxy(self, cast_document, child_id)
+
+    def with_events(self, source, handler_class):
+        """
+        Attach event handler, events are not recorded.
+        """
+        return self.backend.with_events(unwrap(source), handler_class)
+
+    def open_document(self, app, filename: str, visible: bool = True) -> tuple:
+        """
+        Open document, recording its filename.
+        """
+        if filename not in self.documents:
+            self.documents.append(filename)
+        return super().open_document(app, filename, visible)
@@ -0,0 +1,222 @@
+"""
+ReplayBackend is a class for replaying a recorded Inventor session without Inventor.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import fnmatch
+import gzip
+import json
+
+from .FakeBackend import wait
+from .InventorBackend import InventorBackend
+from .RecordingBackend import RECORDING_VERSION, get_call_key
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class ReplayObject:
+    """
+    A recorded Inventor object, serving recorded attribute reads, method calls,
+    iterations and lengths through the backend.
+    """
+
+    def __init__(self, backend, object_id: int):
+        object.__setattr__(self, "_backend", backend)
+        object.__setattr__(self, "_object_id", object_id)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        entry = self._backend.get_entry(self._object_id, name)
+        if "m" not in entry:
+            return self._backend.resolve(entry)
+        return lambda *args: self._backend.resolve(
+            self._backend.get_entry(self._object_id, get_call_key(name, args))
+        )
+
+    def __setattr__(self, name: str, value):
+        # Property writes have no recorded effect.
+        pass
+
+    def __bool__(self) -> bool:
+        # Objects are truthy without reading a recorded length.
+        return True
+
+    def __iter__(self):
+        return iter(
+            self._backend.resolve(self._backend.get_entry(self._object_id, "__iter__"))
+        )
+
+    def __len__(self) -> int:
+        key = get_call_key("__len__", ())
+        return self._backend.resolve(self._backend.get_entry(self._object_id, key))
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class ReplayBackend(InventorBackend):
+    """
+    Serves a session recorded by RecordingBackend.
+
+    Each read returns the recorded result, or raises the recorded error as a
+    RuntimeError, after waiting the recorded mean time of that member scaled by
+    latency_scale. Reads never made while recording raise AttributeError.
+
+    Attributes
+    ----------
+    objects: list
+        Recorded members of each object, keyed by member or call key.
+    documents: list
+        Documents opened while recording, in order.
+    latency_scale: float
+        Multiplier of recorded call times, 0 replays without waiting.
+    calls: int
+        Number of recorded reads served.
+    """
+
+    name = "replay"
+
+    def __init__(self, recording: dict, latency_scale: float = 1.0):
+        """
+        Initialise.
+
+        Args:
+            recording (dict): Recording saved by RecordingBackend.
+            latency_scale (float): Multiplier of recorded call times. Defaults
+                to 1.
+        """
+        if recording.get("version") != RECORDING_VERSION:
+            raise ValueError(
+                f"Unsupported recording version {recording.get('version')}."
+            )
+        self.objects = recording["objects"]
+        self.documents = recording["documents"]
+        self.latency_scale = latency_scale
+        self.calls = 0
+
+    @classmethod
+    def load(cls, filename: str, latency_scale: float = 1.0):
+        """
+        Load recording saved by RecordingBackend.
+
+        Args:
+            filename (str): Recording filename.
+            latency_scale (float): Multiplier of recorded call times. Defaults
+                to 1.
+
+        Returns:
+            ReplayBackend: Backend replaying recording.
+        """
+        with gzip.open(filename, "rt", encoding="utf-8") as f:
+            recording = json.load(f)
+        logger.info(
+            f"Loaded recording of {len(recording['objects'])} objects from {filename}."
+        )
+        return cls(recording, latency_scale)
+
+    def find_documents(self, patterns: list) -> list:
+        """
+        Find recorded documents matching patterns.
+
+        Args:
+            patterns (list): Filename patterns, all documents if empty.
+
+        Returns:
+            list: Matching recorded documents, in recorded order.
+        """
+        if not patterns:
+            return list(self.documents)
+        return [
+            filename
+            for filename in self.documents
+            if any(fnmatch.fnmatch(filename, pattern) for pattern in patterns)
+        ]
+
+    def get_entry(self, object_id: int, key: str) -> dict:
+        """
+        Get recorded member of object.
+
+        Args:
+            object_id (int): Recorded object id.
+            key (str): Member or call key.
+
+        Returns:
+            dict: Recorded member.
+        """
+        try:
+            return self.objects[object_id][key]
+        except KeyError:
+            raise AttributeError(f"{key} of object {object_id} was not recorded.")
+
+    def resolve(self, entry: dict):
+        """
+        Replay recorded member.
+
+        Args:
+            entry (dict): Recorded member.
+
+        Returns:
+            Recorded value, ReplayObject, or list of ReplayObject for iterations.
+        """
+        self.calls += 1
+        if self.latency_scale:
+            wait(self.latency_scale * entry["s"] / entry["n"])
+        if "e" in entry:
+            raise RuntimeError(entry["e"])
+        if "o" in entry:
+            return ReplayObject(self, entry["o"])
+        if "i" in entry:
+            return [ReplayObject(self, item_id) for item_id in entry["i"]]
+        value = entry["v"]
+        return tuple(value) if isinstance(value, list) else value
+
+    # - - - - - - - - - - - - - - - -
+    # InventorBackend methods.
+
+    @property
+    def call_count(self) -> int:
+        """
+        Total number of recorded reads served.
+        """
+        return self.calls
+
+    def connect(self, visible: bool = True) -> ReplayObject:
+        """
+        Connect to recorded Inventor application.
+
+        Args:
+            visible (bool): Unused, kept for backend interface.
+
+        Returns:
+            ReplayObject: Application.
+        """
+        return ReplayObject(self, 0)
+
+    def cast(self, document: ReplayObject, interface: str) -> ReplayObject:
+        """
+        Get recorded cast of document.
+
+        Args:
+            document (ReplayObject): Document.
+            interface (str): Interface name.
+
+        Returns:
+            ReplayObject: Document with interface.
+        """
+        return self.resolve(self.get_entry(document._object_id, f"cast:{interface}"))
+
+    def with_events(self, source, handler_class):
+        """
+        Create event handler, recordings hold no events.
+        """
+        return handler_class()
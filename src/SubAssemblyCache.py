@@ -0,0 +1,252 @@
+"""
+SubAssemblyCache is a class for memoizing expansion of repeated sub-assemblies.
+
+Created on Friday 16th October 2026.
+@author: Harry New
+
+"""
+
+import logging.config
+import numpy as np
+
+from .Part import Part
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+global logger
+logger = logging.getLogger()
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+def get_transformation_matrix(occurrence) -> np.ndarray:
+    """
+    Get transformation matrix of occurrence in top-level assembly space.
+
+    Args:
+        occurrence: Occurrence.
+
+    Returns:
+        np.ndarray: 4x4 homogeneous matrix with translation in mm.
+    """
+    transformation = occurrence.Transformation
+
+    # Read all 16 cells in row order in one call, reading each cell if unavailable.
+    try:
+        data = transformation.GetMatrixData([0.0] * 16)
+        matrix = np.array(data, dtype=np.float64).reshape(4, 4)
+    except Exception:
+        matrix = np.array(
+            [
+                [transformation.Cell(row, column) for column in range(1, 5)]
+                for row in range(1, 5)
+            ],
+            dtype=np.float64,
+        )
+    # Convert translation from cm to mm.
+    matrix[:3, 3] *= 10
+    return matrix
+
+
+def transform_points(matrix: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Apply homogeneous transformation to points.
+
+    Args:
+        matrix (np.ndarray): 4x4 homogeneous matrix.
+        points (np.ndarray): Nx3 array of points, NaN where missing.
+
+    Returns:
+        np.ndarray: Nx3 array of transformed points.
+    """
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def transform_axes(matrix: np.ndarray, axes: np.ndarray) -> np.ndarray:
+    """
+    Apply rotation of homogeneous transformation to sets of axes.
+
+    Args:
+        matrix (np.ndarray): 4x4 homogeneous matrix.
+        axes (np.ndarray): Nx3x3 array of axes as rows, NaN where missing.
+
+    Returns:
+        np.ndarray: Nx3x3 array of rotated axes.
+    """
+    return axes @ matrix[:3, :3].T
+
+
+def transform_part(part: Part, matrix: np.ndarray):
+    """
+    Apply homogeneous transformation to centre of mass and principal axes of part.
+
+    Args:
+        part (Part): Part.
+        matrix (np.ndarray): 4x4 homogeneous matrix.
+    """
+    if part.x_axis is not None:
+        point = np.array([[part.x_axis, part.y_axis, part.z_axis]])
+        part.set_centre_of_mass(*transform_points(matrix, point)[0].tolist())
+    if part.principal_axes is not None:
+        axes = np.array([part.principal_axes])
+        part.principal_axes = transform_axes(matrix, axes)[0].tolist()
+
+
+def get_axes_array(records: list) -> np.ndarray:
+    """
+    Get principal axes of part records.
+
+    Args:
+        records (list): Part records.
+
+    Returns:
+        np.ndarray: Nx3x3 array of axes as rows, NaN where missing.
+    """
+    axes = np.full((len(records), 3, 3), np.nan)
+    for index, record in enumerate(records):
+        if record.get("principal_axes") is not None:
+            axes[index] = record["principal_axes"]
+    return axes
+
+
+# - - - - - - - - - - - - - - - - - - - - -
+
+
+class SubAssemblyCache:
+    """
+    A traversal-scoped cache of sub-assembly leaf parts in local coordinates.
+
+    The first instance of each sub-assembly definition is traversed as normal and
+    its parts are stored relative to that instance. Further instances are created
+    from the stored parts by applying the occurrence transformation to all centres
+    of mass at once. Flexible sub-assemblies are always traversed as their parts
+    can be positioned differently in each instance.
+
+    Attributes
+    ----------
+    definitions: dict
+        Part records, relative occurrence paths, local centres of mass and local
+        principal axes keyed by definition FullFileName.
+    hits: int
+        Number of sub-assembly instances expanded from the cache.
+    misses: int
+        Number of sub-assembly instances traversed.
+    """
+
+    def __init__(self):
+        """
+        Initialise.
+        """
+        self.definitions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def check_memoizable(self, occurrence) -> bool:
+        """
+        Check sub-assembly occurrence can be expanded from the cache.
+
+        Args:
+            occurrence: Sub-assembly occurrence.
+
+        Returns:
+            bool: Memoizable or not.
+        """
+        try:
+            return not occurrence.Flexible
+        except Exception as e:
+            logger.error(f"Unable to check if occurrence is flexible: {e}")
+            return False
+
+    def expand(self, occurrence, path: tuple = None) -> list:
+        """
+        Expand sub-assembly occurrence from the cache.
+
+        Args:
+            occurrence: Sub-assembly occurrence.
+            path (tuple): Occurrence path of sub-assembly, optional.
+
+        Returns:
+            list: Parts in top-level assembly space, None if not cached.
+        """
+        if not self.check_memoizable(occurrence):
+            return None
+
+        key = occurrence.Definition.Document.FullFileName
+        if key not in self.definitions:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        # Transform cached centres of mass.
+        records, relative_paths, local_points, local_axes = self.definitions[key]
+        matrix = get_transformation_matrix(occurrence)
+        points = transform_points(matrix, local_points)
+        axes = transform_axes(matrix, local_axes)
+
+        # Create parts.
+        parts = []
+        for record, relative_path, point, part_axes in zip(
+            records, relative_paths, points.tolist(), axes.tolist()
+        ):
+            part = Part.from_record(record)
+            if part.x_axis is not None:
+                part.set_centre_of_mass(*point)
+            if part.principal_axes is not None:
+                part.principal_axes = part_axes
+            if path is not None and relative_path is not None:
+                part.occurrence_path = path + relative_path
+            parts.append(part)
+        return parts
+
+    def store(self, occurrence, parts: list, path: tuple = None):
+        """
+        Store parts of traversed sub-assembly occurrence.
+
+        Args:
+            occurrence: Sub-assembly occurrence.
+            parts (list): Parts found in sub-assembly.
+            path (tuple): Occurrence path of sub-assembly, optional.
+        """
+        if not self.check_memoizable(occurrence):
+            return
+
+        # Get centres of mass, NaN where missing.
+        records = [part.to_record() for part in parts]
+        points = np.array(
+            [
+                [
+                    np.nan if record[axis] is None else record[axis]
+                    for axis in ["x_axis", "y_axis", "z_axis"]
+                ]
+                for record in records
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+
+        # Get occurrence paths relative to sub-assembly.
+        depth = 0 if path is None else len(path)
+        relative_paths = []
+        for part in parts:
+            if path is None or part.occurrence_path is None:
+                relative_paths.append(None)
+            else:
+                relative_paths.append(part.occurrence_path[depth:])
+
+        # Convert to local coordinates.
+        inverse = np.linalg.inv(get_transformation_matrix(occurrence))
+        key = occurrence.Definition.Document.FullFileName
+        self.definitions[key] = (
+            records,
+            relative_paths,
+            transform_points(inverse, points),
+            transform_axes(inverse, get_axes_array(records)),
+        )
+
+    def log_statistics(self):
+        """
+        Log cache hit and miss counts.
+        """
+        logger.info(
+            f"Sub-assembly cache: {self.hits} hits, {self.misses} misses, "
+            f"{len(self.definitions)} definitions."
+        )
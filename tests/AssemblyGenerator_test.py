@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from src.AssemblyGenerator import AssemblyGenerator, random_rotation
+from src.FakeBackend import FakeBackend
+from src.InventorManager import InventorManager
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_occurrence_counts():
+    """
+    Test generated assembly has fan-out to the power of depth parts.
+    """
+    generator = AssemblyGenerator(depth=2, fan_out=3, reuse_ratio=0.0)
+    backend = FakeBackend()
+    top_level = generator.generate(backend)
+
+    occurrences = backend.get_component_definition(top_level).Occurrences
+
+    assert occurrences.AllLeafOccurrences.Count == 9
+    assert generator.occurrences == 12
+    assert generator.definition_count == 13
+
+
+def test_full_reuse():
+    """
+    Test every occurrence of a level reuses its first definition.
+    """
+    generator = AssemblyGenerator(depth=3, fan_out=4, reuse_ratio=1.0)
+    generator.generate()
+
+    assert generator.definition_count == 4
+
+
+def test_missing_properties():
+    """
+    Test parts are missing mass at missing rate.
+    """
+    generator = AssemblyGenerator(depth=1, fan_out=5, reuse_ratio=0.0, missing_rate=1)
+    backend = FakeBackend()
+    top_level = generator.generate(backend)
+
+    parts_list = InventorManager(backend=backend).get_parts_list(top_level)
+
+    assert [part.mass for part in parts_list] == [None] * 5
+    assert [part.part_name for part in parts_list] == [""] * 5
+
+
+def test_same_seed_same_assembly():
+    """
+    Test generation is reproducible from seed.
+    """
+    backends = [FakeBackend(), FakeBackend()]
+    for backend in backends:
+        AssemblyGenerator(depth=2, fan_out=4, seed=7).generate(backend)
+
+    first, second = [
+        {
+            filename: [(name, child) for name, child, _, _ in definition.occurrences]
+            for filename, definition in backend.definitions.items()
+        }
+        for backend in backends
+    ]
+    assert first == second
+
+
+def test_from_occurrences():
+    """
+    Test fan-out is chosen to give about the number of parts.
+    """
+    generator = AssemblyGenerator.from_occurrences(10000, depth=4)
+
+    assert generator.fan_out == 10
+    assert generator.leaf_occurrences == 10000
+
+
+def test_random_rotation():
+    """
+    Test rotations are proper and orthonormal.
+    """
+    rotation = random_rotation(np.random.default_rng(0))
+
+    assert rotation @ rotation.T == pytest.approx(np.eye(3))
+    assert np.linalg.det(rotation) == pytest.approx(1.0)
+
+
+def test_invalid_ratio():
+    """
+    Test ratios outside 0 to 1 raise error.
+    """
+    with pytest.raises(ValueError):
+        AssemblyGenerator(reuse_ratio=1.5)
@@ -0,0 +1,185 @@
+import json
+import os
+
+import pytest
+from src.BatchExporter import (
+    BatchExporter,
+    find_assemblies,
+    format_result,
+    get_output_names,
+    read_assembly_list,
+)
+from src.ColumnPlan import ColumnPlan
+from src.FetchPlan import FetchPlan
+from src.Part import Part
+
+# - - - - - - - - - - - - - - - - -
+
+with open("config/option_config.json") as f:
+    options_config = json.load(f)
+
+
+class FakeManager:
+    """
+    Inventor manager returning a fixed parts list per assembly.
+    """
+
+    def __init__(self, parts_lists: dict):
+        self.parts_lists = parts_lists
+        self.calls = []
+        self.closed = 0
+
+    def get_parts_list(self, document, **kwargs):
+        self.calls.append((document, kwargs))
+        if document not in self.parts_lists:
+            raise RuntimeError(f"Unable to open assembly document {document}.")
+        return self.parts_lists[document]
+
+    def close_document(self):
+        self.closed += 1
+
+
+def create_part(part_number, mass):
+    """
+    Create part from values.
+    """
+    return Part.from_record(
+        {
+            "part_number": part_number,
+            "part_name": "Bracket",
+            "mass": mass,
+            "x_axis": 1.0,
+            "y_axis": 2.0,
+            "z_axis": 3.0,
+        }
+    )
+
+
+def create_exporter(manager, output_directory, formats=("html", "csv")):
+    """
+    Create exporter for part number and mass.
+    """
+    column_plan = ColumnPlan.from_options(options_config, ["Part Number", "Mass"])
+    return BatchExporter(
+        manager,
+        column_plan,
+        FetchPlan.from_column_plan(column_plan),
+        list(formats),
+        str(output_directory),
+    )
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_find_assemblies(tmp_path):
+    """
+    Test patterns expand in order without duplicates.
+    """
+    for name in ["B.iam", "A.iam", "C.ipt"]:
+        (tmp_path / name).write_text("")
+
+    filenames = find_assemblies(
+        [str(tmp_path / "*.iam"), str(tmp_path / "A.iam"), str(tmp_path / "D.iam")]
+    )
+
+    assert [os.path.basename(filename) for filename in filenames] == [
+        "A.iam",
+        "B.iam",
+    ]
+
+
+def test_read_assembly_list(tmp_path):
+    """
+    Test blank lines and comments are ignored.
+    """
+    assembly_list = tmp_path / "assemblies.txt"
+    assembly_list.write_text("# Vehicles\nA.iam\n\n  configs/*.iam  \n")
+
+    assert read_assembly_list(str(assembly_list)) == ["A.iam", "configs/*.iam"]
+
+
+def test_export_all_shares_caches(tmp_path):
+    """
+    Test each assembly is written and caches are shared between assemblies.
+    """
+    manager = FakeManager(
+        {
+            "A.iam": [create_part("TBRE-001", 2.0)],
+            "B.iam": [create_part("TBRE-001", 2.0), create_part("TBRE-002", None)],
+        }
+    )
+    exporter = create_exporter(manager, tmp_path / "out")
+    lines = []
+
+    results = exporter.export_all(["A.iam", "B.iam"], report=lines.append)
+
+    assert [result.part_count for result in results] == [1, 2]
+    assert manager.closed == 2
+    assert (
+        manager.calls[0][1]["property_cache"] is manager.calls[1][1]["property_cache"]
+    )
+    assert (
+        manager.calls[0][1]["sub_assembly_cache"]
+        is manager.calls[1][1]["sub_assembly_cache"]
+    )
+    assert sorted(os.listdir(tmp_path / "out")) == [
+        "A_PARTS_LIST.csv",
+        "A_PARTS_LIST.html",
+        "B_PARTS_LIST.csv",
+        "B_PARTS_LIST.html",
+    ]
+    csv = (tmp_path / "out" / "B_PARTS_LIST.csv").read_text().splitlines()
+    assert csv[0] == "Part Number,Mass (kg)"
+    assert len(lines) == 3
+    assert lines[-1].startswith("Exported 2 of 2 assemblies")
+
+
+def test_failed_assembly_continues(tmp_path):
+    """
+    Test a failed assembly is reported and later assemblies still export.
+    """
+    manager = FakeManager({"B.iam": [create_part("TBRE-001", 2.0)]})
+    exporter = create_exporter(manager, tmp_path, formats=["html"])
+
+    results = exporter.export_all(["A.iam", "B.iam"], report=lambda text: None)
+
+    assert "Unable to open" in results[0].error
+    assert "FAILED" in format_result(results[0])
+    assert results[1].error is None
+    assert results[1].outputs == [str(tmp_path / "B_PARTS_LIST.html")]
+    assert manager.closed == 2
+
+
+def test_same_name_assemblies(tmp_path):
+    """
+    Test assemblies with the same name in different folders are all written.
+    """
+    filenames = [r"C:\front\GEARBOX.iam", r"C:\rear\gearbox.iam", "C:/GEARBOX.iam"]
+    manager = FakeManager(
+        {
+            filename: [create_part(f"TBRE-00{index}", 2.0)]
+            for index, filename in enumerate(filenames)
+        }
+    )
+    exporter = create_exporter(manager, tmp_path, formats=["csv"])
+
+    results = exporter.export_all(filenames, report=lambda text: None)
+
+    assert get_output_names(filenames) == ["GEARBOX", "gearbox_2", "GEARBOX_3"]
+    assert [result.outputs for result in results] == [
+        [str(tmp_path / "GEARBOX_PARTS_LIST.csv")],
+        [str(tmp_path / "gearbox_2_PARTS_LIST.csv")],
+        [str(tmp_path / "GEARBOX_3_PARTS_LIST.csv")],
+    ]
+    for index, result in enumerate(results):
+        with open(result.outputs[0]) as f:
+            assert f"TBRE-00{index}" in f.read()
+
+
+def test_unknown_format(tmp_path):
+    """
+    Test unknown output format raises error.
+    """
+    with pytest.raises(ValueError):
+        create_exporter(FakeManager({}), tmp_path, formats=["pdf"])
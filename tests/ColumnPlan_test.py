@@ -0,0 +1,131 @@
+import json
+
+import pytest
+from src.ColumnPlan import ColumnPlan, Column
+from src.Part import Part
+from src.PartTable import PartTable
+
+# - - - - - - - - - - - - - - - - -
+
+with open("config/option_config.json") as f:
+    options_config = json.load(f)
+
+
+def create_part():
+    """
+    Create part with every field set.
+    """
+    return Part.from_record(
+        {
+            "part_number": "TBRE-001",
+            "part_name": "Bracket",
+            "mass": 2.0,
+            "x_axis": 10.0,
+            "y_axis": 20.0,
+            "z_axis": 30.0,
+        }
+    )
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_from_options_order():
+    """
+    Test columns follow selected options in order.
+    """
+    column_plan = ColumnPlan.from_options(options_config, ["Mass", "Part Number"])
+
+    assert column_plan.attribute_names == ["mass", "part_number"]
+    assert column_plan.required_fields == {"mass", "part_number"}
+
+
+def test_get_row_matches_attributes():
+    """
+    Test row values match each part attribute.
+    """
+    part = create_part()
+    selected_options = [option["option_name"] for option in options_config["options"]]
+    column_plan = ColumnPlan.from_options(options_config, selected_options)
+
+    expected = tuple(
+        getattr(part, attribute) for attribute in column_plan.attribute_names
+    )
+    assert column_plan.get_row(part) == expected
+
+
+def test_single_column_row():
+    """
+    Test single column plan still returns a tuple.
+    """
+    column_plan = ColumnPlan([Column("P/N", "part_number")])
+
+    assert column_plan.get_row(create_part()) == ("TBRE-001",)
+    assert ColumnPlan([]).get_row(create_part()) == ()
+
+
+def test_format_row():
+    """
+    Test formatters are applied per column.
+    """
+    column_plan = ColumnPlan(
+        [Column("P/N", "part_number"), Column("Mass", "mass", "{:.3f}".format)]
+    )
+
+    assert column_plan.format_row(create_part()) == ["TBRE-001", "2.000"]
+
+
+def test_unknown_option():
+    """
+    Test unknown option raises error.
+    """
+    with pytest.raises(KeyError):
+        ColumnPlan.from_options(options_config, ["Colour"])
+
+
+def test_number_precision_from_options():
+    """
+    Test number columns use precision from option config.
+    """
+    column_plan = ColumnPlan.from_options(options_config, ["Part Number", "Mass"])
+
+    assert column_plan.format_row(create_part()) == ["TBRE-001", "2.000"]
+
+
+def test_format_table_matches_format_row():
+    """
+    Test vectorized table formatting matches formatting each part.
+    """
+    parts = [
+        create_part(),
+        Part.from_record(
+            {
+                "part_number": "TBRE-002",
+                "part_name": None,
+                "mass": None,
+                "x_axis": -1.23456,
+                "y_axis": 0.005,
+                "z_axis": 1e6,
+            }
+        ),
+    ]
+    selected_options = [
+        option["option_name"]
+        for option in options_config["options"]
+        if option["option_name"] != "Inertia"
+    ]
+    column_plan = ColumnPlan.from_options(options_config, selected_options)
+
+    rows = list(column_plan.iter_formatted_rows(PartTable.from_parts(parts)))
+
+    assert rows == [tuple(column_plan.format_row(part)) for part in parts]
+    assert rows[1][1] == ""
+    assert rows[1][3:6] == ("-1.23", "0.01", "1000000.00")
+
+
+def test_unknown_column_type():
+    """
+    Test unknown column type raises error.
+    """
+    with pytest.raises(ValueError):
+        Column("Colour", "colour", column_type="colour")
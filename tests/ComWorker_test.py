@@ -0,0 +1,50 @@
+import threading
+
+import pytest
+
+from src.ComWorker import ComWorker
+from src.ExportProgress import ExportProgress
+from src.FakeBackend import FakeBackend
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_submit():
+    """
+    Test requests run in order on a single worker thread.
+    """
+    worker = ComWorker(backend=FakeBackend())
+    futures = [worker.submit(threading.get_ident) for _ in range(5)]
+    thread_ids = {future.result(timeout=5) for future in futures}
+    worker.stop()
+
+    assert len(thread_ids) == 1
+    assert threading.get_ident() not in thread_ids
+
+
+def test_submit_exception():
+    """
+    Test exceptions are returned through the future.
+    """
+    worker = ComWorker(backend=FakeBackend())
+    future = worker.submit(int, "not a number")
+    with pytest.raises(ValueError):
+        future.result(timeout=5)
+    worker.stop()
+
+
+def test_export_progress_cancel():
+    """
+    Test export progress is shared between threads.
+    """
+    progress = ExportProgress()
+    worker = ComWorker(backend=FakeBackend())
+    worker.submit(progress.set_length, 4)
+    worker.submit(progress.add_to_progress_bar)
+    worker.submit(progress.update_task, "Getting part details...").result(timeout=5)
+    worker.stop()
+
+    assert progress.snapshot() == (1, 4, "Getting part details...")
+    assert not progress.cancelled
+    progress.cancel()
+    assert progress.cancelled
@@ -0,0 +1,91 @@
+from src.DocumentTracker import (
+    DocumentTracker,
+    ApplicationEventsHandler,
+    BEFORE_EVENT,
+    AFTER_EVENT,
+)
+
+# - - - - - - - - - - - - - - - - -
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class FakeApplicationEvents:
+    """
+    Local event source firing events at a handler like Inventor would.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def open_document(self, name):
+        for timing in [BEFORE_EVENT, AFTER_EVENT]:
+            self.handler.OnOpenDocument(None, name, timing, None, None)
+        for timing in [BEFORE_EVENT, AFTER_EVENT]:
+            self.handler.OnActivateDocument(None, timing, None, None)
+
+    def close_document(self, name):
+        for timing in [BEFORE_EVENT, AFTER_EVENT]:
+            self.handler.OnCloseDocument(None, name, timing, None, None)
+
+
+def create_tracker():
+    """
+    Create tracker connected to fake event source.
+    """
+    clock = FakeClock()
+    tracker = DocumentTracker(debounce=0.3, clock=clock)
+    handler = ApplicationEventsHandler()
+    handler.tracker = tracker
+    return tracker, FakeApplicationEvents(handler), clock
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_no_events():
+    """
+    Test no change reported without events.
+    """
+    tracker, _, clock = create_tracker()
+    clock.time = 10.0
+    assert not tracker.check()
+
+
+def test_debounced_change():
+    """
+    Test burst of events is reported once after debounce time.
+    """
+    tracker, events, clock = create_tracker()
+    events.open_document(r"C:\vehicle\TBRE25.iam")
+    assert tracker.events == 2
+
+    # Still settling.
+    clock.time = 0.2
+    assert not tracker.check()
+
+    # Settled, reported once.
+    clock.time = 0.3
+    assert tracker.check()
+    assert not tracker.check()
+
+
+def test_events_extend_debounce():
+    """
+    Test events during debounce time delay the change.
+    """
+    tracker, events, clock = create_tracker()
+    events.open_document(r"C:\vehicle\TBRE25.iam")
+    clock.time = 0.2
+    events.close_document(r"C:\vehicle\TBRE25.iam")
+
+    clock.time = 0.4
+    assert not tracker.check()
+    clock.time = 0.5
+    assert tracker.check()
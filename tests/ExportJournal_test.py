@@ -0,0 +1,99 @@
+import os
+
+from src.ExportJournal import ExportJournal
+
+# - - - - - - - - - - - - - - - - -
+
+assembly_name = r"C:\vehicle\TBRE25.iam"
+fields = ["part_number", "mass"]
+record = {
+    "part_number": "TBRE-001",
+    "part_name": None,
+    "mass": 0.5,
+    "x_axis": None,
+    "y_axis": None,
+    "z_axis": None,
+}
+
+
+def create_run(tmp_path, name: str) -> str:
+    """
+    Create log directory for a run.
+    """
+    log_path = os.path.join(tmp_path, name)
+    os.mkdir(log_path)
+    return log_path
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_resume_incomplete(tmp_path):
+    """
+    Test incomplete journal is resumed by the next run.
+    """
+    journal = ExportJournal.open(create_run(tmp_path, "run_1"), assembly_name, fields)
+    journal.append(("Chassis:1",), record)
+    journal.append(("FL:1", "Upright:1"), record)
+    journal.close()
+
+    resumed = ExportJournal.open(create_run(tmp_path, "run_2"), assembly_name, fields)
+    assert resumed.filename == journal.filename
+    assert set(resumed.records) == {("Chassis:1",), ("FL:1", "Upright:1")}
+    assert resumed.records[("Chassis:1",)] == record
+
+    # Appending continues the same journal.
+    resumed.append(("FR:1", "Upright:1"), record)
+    resumed.complete()
+    header, records, complete = ExportJournal.read(journal.filename)
+    assert header["assembly"] == assembly_name
+    assert len(records) == 3
+    assert complete
+
+
+def test_complete_not_resumed(tmp_path):
+    """
+    Test complete journal starts a new export.
+    """
+    journal = ExportJournal.open(create_run(tmp_path, "run_1"), assembly_name, fields)
+    journal.append(("Chassis:1",), record)
+    journal.complete()
+
+    new_journal = ExportJournal.open(
+        create_run(tmp_path, "run_2"), assembly_name, fields
+    )
+    assert new_journal.filename != journal.filename
+    assert new_journal.records == {}
+    new_journal.close()
+
+
+def test_different_fields_not_resumed(tmp_path):
+    """
+    Test journal with different fields starts a new export.
+    """
+    journal = ExportJournal.open(create_run(tmp_path, "run_1"), assembly_name, fields)
+    journal.close()
+
+    new_journal = ExportJournal.open(
+        create_run(tmp_path, "run_2"), assembly_name, ["part_number"]
+    )
+    assert new_journal.filename != journal.filename
+    new_journal.close()
+
+
+def test_partial_line_ignored(tmp_path):
+    """
+    Test partially written line from a crash is ignored and repaired.
+    """
+    journal = ExportJournal.open(create_run(tmp_path, "run_1"), assembly_name, fields)
+    journal.append(("Chassis:1",), record)
+    journal.file.write('{"path": ["FL:1"], "pa')
+    journal.close()
+
+    resumed = ExportJournal.open(create_run(tmp_path, "run_2"), assembly_name, fields)
+    assert list(resumed.records) == [("Chassis:1",)]
+    resumed.append(("FL:1",), record)
+    resumed.close()
+
+    _, records, _ = ExportJournal.read(journal.filename)
+    assert list(records) == [("Chassis:1",), ("FL:1",)]
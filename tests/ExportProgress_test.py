@@ -0,0 +1,71 @@
+import pytest
+from src.ExportProgress import ExportProgress
+
+# - - - - - - - - - - - - - - - - -
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_throughput():
+    """
+    Test rate and time remaining from progress.
+    """
+    clock = FakeClock()
+    progress = ExportProgress(clock=clock)
+    progress.set_length(1000)
+
+    assert progress.get_throughput() == (None, None)
+
+    clock.time = 2.0
+    progress.set_progress(250)
+    rate, remaining = progress.get_throughput()
+    assert rate == pytest.approx(125.0)
+    assert remaining == pytest.approx(6.0)
+
+
+def test_remaining_not_negative():
+    """
+    Test progress past estimated total has no time remaining.
+    """
+    clock = FakeClock()
+    progress = ExportProgress(clock=clock)
+    progress.set_length(10)
+    clock.time = 1.0
+    progress.set_progress(12)
+
+    assert progress.get_throughput()[1] == 0
+
+
+def test_task_throttled():
+    """
+    Test task updates are limited to task interval.
+    """
+    clock = FakeClock()
+    progress = ExportProgress(task_interval=0.1, clock=clock)
+
+    assert progress.check_task_due()
+    clock.time = 0.05
+    assert not progress.check_task_due()
+    clock.time = 0.15
+    assert progress.check_task_due()
+
+
+def test_snapshot():
+    """
+    Test snapshot of progress.
+    """
+    progress = ExportProgress()
+    progress.set_length(5)
+    progress.add_to_progress_bar()
+    progress.update_task("Getting occurrences...")
+
+    assert progress.snapshot() == (1, 5, "Getting occurrences...")
@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+from src.ExportSnapshot import ExportSnapshot, check_moved
+from src.Part import Part
+
+# - - - - - - - - - - - - - - - - -
+
+fields = ["mass", "centre_of_mass"]
+
+
+def create_part(path, x_axis):
+    """
+    Create part at occurrence path.
+    """
+    part = Part.from_record(
+        {
+            "part_number": None,
+            "part_name": None,
+            "mass": 1.0,
+            "x_axis": x_axis,
+            "y_axis": 0.0,
+            "z_axis": 0.0,
+        }
+    )
+    part.occurrence_path = path
+    return part
+
+
+def translation(x_axis):
+    """
+    Create matrix translating along x-axis in mm.
+    """
+    matrix = np.eye(4)
+    matrix[0, 3] = x_axis
+    return matrix
+
+
+@pytest.fixture
+def files(tmp_path):
+    """
+    Create assembly and part files on disk.
+    """
+    names = {}
+    for name in ["top.iam", "corner.iam", "upright.ipt", "bolt.ipt"]:
+        filename = tmp_path / name
+        filename.write_bytes(b"file")
+        names[name] = str(filename)
+    return names
+
+
+def create_snapshot(files):
+    """
+    Create snapshot of top-level bolt and a corner sub-assembly with an upright.
+    """
+    snapshot = ExportSnapshot(files["top.iam"], fields)
+    snapshot.add_part(create_part(("Bolt:1",), 5.0), files["bolt.ipt"])
+    snapshot.start_assembly(("Corner:1",), files["corner.iam"], translation(100.0))
+    snapshot.add_part(
+        create_part(("Corner:1", "Upright:1"), 110.0), files["upright.ipt"]
+    )
+    snapshot.end_assembly(("Corner:1",))
+    return snapshot
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_unchanged_reused(files):
+    """
+    Test unchanged parts and sub-assemblies are reused.
+    """
+    previous = create_snapshot(files)
+    previous.find_changed_files(set())
+
+    assert not previous.check_top_level_changed()
+    part = previous.get_part(("Bolt:1",), files["bolt.ipt"], np.eye(4))
+    assert part.x_axis == 5.0
+
+    delta = previous.get_delta(("Corner:1",), files["corner.iam"], translation(100.0))
+    parts = previous.expand_assembly(("Corner:1",), delta)
+    assert [part.occurrence_path for part in parts] == [("Corner:1", "Upright:1")]
+    assert previous.reused == 2
+
+
+def test_moved_sub_assembly(files):
+    """
+    Test reused sub-assembly parts follow its new placement.
+    """
+    previous = create_snapshot(files)
+    previous.find_changed_files(set())
+
+    delta = previous.get_delta(("Corner:1",), files["corner.iam"], translation(300.0))
+    parts = previous.expand_assembly(("Corner:1",), delta)
+
+    assert check_moved(delta)
+    assert parts[0].x_axis == pytest.approx(310.0)
+
+
+def test_changed_part_file(files):
+    """
+    Test sub-assembly containing changed part file is not reused.
+    """
+    previous = create_snapshot(files)
+    with open(files["upright.ipt"], "ab") as f:
+        f.write(b"changed")
+    previous.find_changed_files(set())
+
+    delta = previous.get_delta(("Corner:1",), files["corner.iam"], translation(100.0))
+    assert delta is not None
+    assert previous.expand_assembly(("Corner:1",), delta) is None
+    assert (
+        previous.get_part(("Corner:1", "Upright:1"), files["upright.ipt"], delta)
+        is None
+    )
+
+
+def test_dirty_top_level(files):
+    """
+    Test unsaved top-level assembly stops top-level parts being reused.
+    """
+    previous = create_snapshot(files)
+    previous.find_changed_files({files["top.iam"]})
+
+    assert previous.check_top_level_changed()
+    assert previous.get_part(("Bolt:1",), files["bolt.ipt"], None) is None
+
+
+def test_copy_assembly(files):
+    """
+    Test reused sub-assembly is kept in new snapshot for next export.
+    """
+    previous = create_snapshot(files)
+    previous.find_changed_files(set())
+    snapshot = ExportSnapshot(files["top.iam"], fields)
+
+    path = ("Corner:1",)
+    delta = previous.get_delta(path, files["corner.iam"], translation(100.0))
+    snapshot.start_assembly(path, files["corner.iam"], translation(100.0))
+    snapshot.copy_assembly(previous, path, delta)
+    for part in previous.expand_assembly(path, delta):
+        snapshot.add_part(part, previous.part_files[part.occurrence_path], False)
+
+    assert snapshot.assemblies[path].files == previous.assemblies[path].files
+    assert snapshot.assemblies[path].part_paths == [("Corner:1", "Upright:1")]
+    assert not snapshot.changed_paths
+
+
+def test_matches():
+    """
+    Test snapshot only matches same assembly and fields.
+    """
+    snapshot = ExportSnapshot("top.iam", fields)
+
+    assert snapshot.check_matches("top.iam", ["centre_of_mass", "mass"])
+    assert not snapshot.check_matches("top.iam", ["mass"])
+    assert not snapshot.check_matches("other.iam", fields)
@@ -0,0 +1,133 @@
+import time
+
+import numpy as np
+import pytest
+from src.FakeBackend import FakeBackend
+from src.InventorManager import InventorManager
+from src.OccurrenceEnumerator import PART_DOCUMENT, ASSEMBLY_DOCUMENT
+
+# - - - - - - - - - - - - - - - - -
+
+
+def translation(x, y=0.0, z=0.0):
+    """
+    Create 4x4 matrix translating by cm.
+    """
+    matrix = np.eye(4)
+    matrix[:3, 3] = [x, y, z]
+    return matrix
+
+
+def create_backend(latency=0.0):
+    """
+    Create top-level assembly with a bolt and two placed sub-assemblies.
+    """
+    backend = FakeBackend(latency)
+    backend.add_part(
+        "C:/fake/Bolt.ipt",
+        "TBRE-001",
+        "Bolt",
+        mass=0.5,
+        centre_of_mass=(0.0, 0.0, 1.0),
+        inertia=np.diag([1.0, 2.0, 3.0]),
+    )
+    backend.add_part("C:/fake/Sticker.ipt", "TBRE-002")
+    backend.add_assembly("C:/fake/Bracket.iam", "TBRE-100")
+    backend.add_occurrence("C:/fake/Bracket.iam", "C:/fake/Bolt.ipt")
+    backend.add_occurrence("C:/fake/Bracket.iam", "C:/fake/Sticker.ipt")
+    backend.add_assembly("C:/fake/Top.iam", "TBRE-000")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Bolt.ipt")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Bracket.iam")
+    backend.add_occurrence(
+        "C:/fake/Top.iam", "C:/fake/Bracket.iam", matrix=translation(10.0)
+    )
+    return backend
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_open_document():
+    """
+    Test opening documents through backend.
+    """
+    backend = create_backend()
+    app = backend.connect()
+
+    document, assembly_doc = backend.open_document(app, "C:/fake/Top.iam")
+
+    assert document.DocumentType == ASSEMBLY_DOCUMENT
+    assert app.ActiveDocument.FullFileName == "C:/fake/Top.iam"
+    assert assembly_doc.ComponentDefinition.Occurrences.Count == 3
+    with pytest.raises(FileNotFoundError):
+        backend.open_document(app, "C:/fake/Missing.iam")
+
+
+def test_connect_keeps_visibility():
+    """
+    Test connecting without visibility leaves application visibility unchanged.
+    """
+    backend = create_backend()
+    backend.connect(False)
+
+    app = backend.connect(None)
+
+    assert app.Visible is False
+
+
+def test_occurrences_in_assembly_space():
+    """
+    Test sub-occurrences are placed, named and typed like Inventor.
+    """
+    backend = create_backend()
+    occurrences = backend.get_component_definition("C:/fake/Top.iam").Occurrences
+    bracket = occurrences.Item(3)
+    bolt = bracket.SubOccurrences.Item(1)
+
+    assert bracket.Name == "Bracket:2"
+    assert bolt.DefinitionDocumentType == PART_DOCUMENT
+    assert [occurrence.Name for occurrence in bolt.OccurrencePath] == [
+        "Bracket:2",
+        "Bolt:1",
+    ]
+    assert bolt.Transformation.Cell(1, 4) == 10.0
+    assert bolt.Transformation.GetMatrixData([0.0] * 16)[3] == 10.0
+    assert bolt.MassProperties.CenterOfMass.X == 10.0
+    assert occurrences.AllLeafOccurrences.Count == 5
+
+
+def test_export_pipeline():
+    """
+    Test parts list is exported from fake assembly through InventorManager.
+    """
+    backend = create_backend()
+    manager = InventorManager(backend=backend)
+
+    parts_list = manager.get_parts_list("C:/fake/Top.iam")
+
+    assert [part.part_number for part in parts_list] == [
+        "TBRE-001",
+        "TBRE-001",
+        "TBRE-002",
+        "TBRE-001",
+        "TBRE-002",
+    ]
+    assert [part.x_axis for part in parts_list] == [0.0, 0.0, None, 100.0, None]
+    assert parts_list[0].z_axis == 10.0
+    assert parts_list[0].principal_moments == pytest.approx([100.0, 200.0, 300.0])
+    assert backend.calls["MassProperties.Mass"] > 0
+
+
+def test_latency():
+    """
+    Test each call waits for latency.
+    """
+    backend = create_backend(latency=0.001)
+    definition = backend.get_component_definition("C:/fake/Top.iam")
+
+    start_time = time.perf_counter()
+    definition.Document.FullFileName
+    elapsed = time.perf_counter() - start_time
+
+    assert backend.call_count == 2
+    assert elapsed >= 0.002
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+from src.ColumnPlan import ColumnPlan
+from src.FetchPlan import FetchPlan
+from src.Part import Part
+
+# - - - - - - - - - - - - - - - - -
+
+with open("config/option_config.json") as f:
+    options_config = json.load(f)
+
+
+class FakeValue:
+    def __init__(self, value):
+        self.Value = value
+
+
+class FakePropertySet:
+    def Item(self, name):
+        return FakeValue({"Part Number": "TBRE-001", "Description": "Bolt"}[name])
+
+
+class FakePropertySets:
+    def Item(self, name):
+        return FakePropertySet()
+
+
+class FakeDocument:
+    FullFileName = r"C:\parts\bolt.ipt"
+    PropertySets = FakePropertySets()
+
+
+class FakeDefinition:
+    Document = FakeDocument()
+
+
+class FakePoint:
+    X = 1.0
+    Y = 2.0
+    Z = 3.0
+
+
+class FakeMassProperties:
+    Mass = 0.5
+    CenterOfMass = FakePoint()
+
+
+class FakeOccurrence:
+    Name = "Bolt:1"
+    Definition = FakeDefinition()
+
+    def __init__(self):
+        self.mass_property_reads = 0
+
+    @property
+    def MassProperties(self):
+        self.mass_property_reads += 1
+        return FakeMassProperties()
+
+
+# - - - - - - - - - - - - - - - - -
+
+plan_test_data = [
+    (["Part Number"], {"part_number"}),
+    (["Part Name", "Mass"], {"part_name", "mass"}),
+    (["Moment"], {"mass", "centre_of_mass"}),
+    ([], set()),
+]
+
+
+@pytest.mark.parametrize("selected_options,fields", plan_test_data)
+def test_from_column_plan(selected_options, fields):
+    """
+    Test fetch plan fields for columns of selected options.
+    """
+    column_plan = ColumnPlan.from_options(options_config, selected_options)
+    plan = FetchPlan.from_column_plan(column_plan, "low")
+    assert plan.fields == fields
+    assert plan.accuracy == "low"
+
+
+def test_part_number_only():
+    """
+    Test part number only export never touches mass properties.
+    """
+    occurrence = FakeOccurrence()
+    part = Part(occurrence, fetch_plan=FetchPlan(["part_number"]))
+
+    assert part.part_number == "TBRE-001"
+    assert part.part_name is None
+    assert part.mass is None
+    assert part.x_axis is None
+    assert occurrence.mass_property_reads == 0
+
+
+def test_full_plan():
+    """
+    Test all fields are fetched without a fetch plan.
+    """
+    part = Part(FakeOccurrence())
+
+    assert part.part_name == "Bolt"
+    assert part.mass == 0.5
+    assert part.x_axis == pytest.approx(10.0)
+    assert part.z_axis_mass == pytest.approx(15.0)
+
+
+def test_unknown_field():
+    """
+    Test unknown fields are rejected.
+    """
+    with pytest.raises(ValueError):
+        FetchPlan(["volume"])
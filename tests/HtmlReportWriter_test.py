@@ -0,0 +1,72 @@
+import io
+
+from src.HtmlReportWriter import (
+    iter_html_parts_list,
+    write_html_parts_list,
+    CHUNK_ROWS,
+)
+from src.ColumnPlan import ColumnPlan, Column
+from src.Part import Part
+
+# - - - - - - - - - - - - - - - - -
+
+columns = ColumnPlan(
+    [Column("Part Number", "part_number"), Column("Mass (kg)", "mass")]
+)
+
+
+def create_part(part_number, mass):
+    """
+    Create part from values.
+    """
+    return Part.from_record(
+        {
+            "part_number": part_number,
+            "part_name": None,
+            "mass": mass,
+            "x_axis": None,
+            "y_axis": None,
+            "z_axis": None,
+        }
+    )
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_escape_values():
+    """
+    Test values are HTML escaped.
+    """
+    html = "".join(iter_html_parts_list([create_part("<M6> & nut", 0.5)], columns))
+
+    assert "<th>Part Number</th><th>Mass (kg)</th>" in html
+    assert "<tr><td>&lt;M6&gt; &amp; nut</td><td>0.5</td></tr>" in html
+    assert "<M6>" not in html
+
+
+def test_row_chunks():
+    """
+    Test rows are generated in bounded chunks.
+    """
+    parts = (create_part(f"TBRE-{i}", 1.0) for i in range(CHUNK_ROWS * 2 + 1))
+    chunks = list(iter_html_parts_list(parts, columns))
+
+    # Header, three row chunks and footer.
+    assert len(chunks) == 5
+    assert chunks[1].count("<tr>") == CHUNK_ROWS
+    assert chunks[3].count("<tr>") == 1
+
+
+def test_write_matches_generated():
+    """
+    Test written file matches generated content.
+    """
+    parts = [create_part("TBRE-001", None), create_part("TBRE-002", 2.0)]
+    f = io.StringIO()
+    written = write_html_parts_list(f, parts, columns)
+
+    assert f.getvalue() == "".join(iter_html_parts_list(parts, columns))
+    assert written == len(f.getvalue())
+    assert "<td></td>" in f.getvalue()
+    assert "None" not in f.getvalue()
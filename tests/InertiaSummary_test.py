@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from src.InertiaSummary import InertiaSummary
+from src.MassSummary import MassSummary
+from src.MassPropertiesReader import read_principal_inertia
+from src.Part import Part
+from src.PartTable import PartTable
+
+# - - - - - - - - - - - - - - - - -
+
+
+class FakeMassProperties:
+    def __init__(self, xyz_moments):
+        self.xyz_moments = xyz_moments
+
+    def XYZMoments(self):
+        return self.xyz_moments
+
+
+def create_part(mass, centre_of_mass, moments=None, axes=None):
+    """
+    Create part from values.
+    """
+    x_axis, y_axis, z_axis = centre_of_mass
+    return Part.from_record(
+        {
+            "part_number": "TBRE-001",
+            "part_name": None,
+            "mass": mass,
+            "x_axis": x_axis,
+            "y_axis": y_axis,
+            "z_axis": z_axis,
+            "principal_moments": moments,
+            "principal_axes": axes,
+        }
+    )
+
+
+def random_rotation(rng):
+    """
+    Create random rotation matrix.
+    """
+    q, r = np.linalg.qr(rng.normal(size=(3, 3)))
+    return q * np.sign(np.diag(r))
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_read_principal_inertia():
+    """
+    Test principal moments are read in ascending order in kg mm^2.
+    """
+    moments, axes = read_principal_inertia(
+        FakeMassProperties((3.0, 1.0, 2.0, 0.0, 0.0, 0.0))
+    )
+
+    assert moments == pytest.approx([100.0, 200.0, 300.0])
+    assert np.abs(axes) == pytest.approx(np.array([[0, 1, 0], [0, 0, 1], [1, 0, 0]]))
+
+
+def test_point_masses():
+    """
+    Test parts without inertia are included as point masses.
+    """
+    table = PartTable.from_parts(
+        [create_part(1.0, (100.0, 0.0, 0.0)), create_part(1.0, (-100.0, 0.0, 0.0))]
+    )
+    summary = InertiaSummary(table)
+
+    assert summary.missing_inertia == 2
+    assert summary.centre_of_mass == pytest.approx([0.0, 0.0, 0.0])
+    assert np.array(summary.tensor) == pytest.approx(np.diag([0.0, 20000.0, 20000.0]))
+
+
+def test_matches_per_part_sum():
+    """
+    Test batched reduction matches summing parts one at a time.
+    """
+    rng = np.random.default_rng(0)
+    parts = []
+    for _ in range(50):
+        parts.append(
+            create_part(
+                rng.uniform(0.1, 5.0),
+                rng.uniform(-500, 500, 3).tolist(),
+                np.sort(rng.uniform(10, 1000, 3)).tolist(),
+                random_rotation(rng).tolist(),
+            )
+        )
+    summary = InertiaSummary(PartTable.from_parts(parts))
+
+    # Sum each part about overall centre of mass.
+    masses = np.array([part.mass for part in parts])
+    points = np.array([[part.x_axis, part.y_axis, part.z_axis] for part in parts])
+    centre = masses @ points / masses.sum()
+    expected = np.zeros((3, 3))
+    for part, point in zip(parts, points):
+        axes = np.array(part.principal_axes)
+        expected += axes.T @ np.diag(part.principal_moments) @ axes
+        offset = point - centre
+        expected += part.mass * (offset @ offset * np.eye(3) - np.outer(offset, offset))
+
+    assert summary.missing_inertia == 0
+    assert np.array(summary.tensor) == pytest.approx(expected)
+    assert summary.principal_moments == pytest.approx(np.linalg.eigvalsh(expected))
+
+
+def test_missing_mass_excluded():
+    """
+    Test parts without mass are excluded.
+    """
+    table = PartTable.from_parts(
+        [
+            create_part(None, (0.0, 0.0, 0.0), [1.0, 1.0, 1.0], np.eye(3).tolist()),
+            create_part(2.0, (0.0, 0.0, 0.0), [1.0, 2.0, 3.0], np.eye(3).tolist()),
+        ]
+    )
+    summary = InertiaSummary(table)
+
+    assert summary.included_parts == 1
+    assert np.array(summary.tensor) == pytest.approx(np.diag([1.0, 2.0, 3.0]))
+
+
+def test_summary_block():
+    """
+    Test inertia block is only added when requested.
+    """
+    table = PartTable.from_parts([create_part(1.0, (0.0, 0.0, 0.0))])
+
+    assert "Inertia" not in MassSummary(table).to_html()
+    assert "Inertia Tensor" in MassSummary(table, inertia=True).to_html()
+    assert table.get_values("principal_moment_1") == [None]
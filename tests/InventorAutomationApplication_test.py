@@ -1,6 +1,15 @@
+import json
+import os
+
 import pytest
 
+from src.AssemblyGenerator import AssemblyGenerator
+from src.ExportProgress import ExportProgress
+from src.FakeBackend import FakeBackend
 from src.InventorAutomationApplication import InventorAutomationApplication
+from src.InventorManager import InventorManager
+from src.PartCache import PartCache
+from src.PartTable import PartTable
 
 # - - - - - - - - - - - - - - - - -
 
@@ -35,3 +44,194 @@ def test_select_file(filename: str):
     assert ret
     assert ret_filename == filename
     assert app.assembly_doc is not None
+
+
+# - - - - - - - - - - - - - - - - -
+
+SELECTED_OPTIONS = ["Part Number", "Part Name", "Mass", "Centre of Mass"]
+COMPARED_FIELDS = ["part_number", "part_name", "mass", "x_axis", "y_axis", "z_axis"]
+
+
+class CancellingProgress(ExportProgress):
+    """
+    Export progress cancelled once enough parts are found.
+    """
+
+    def __init__(self, cancel_after: int):
+        super().__init__()
+        self.cancel_after = cancel_after
+
+    def set_progress(self, progress: int):
+        super().set_progress(progress)
+        if progress >= self.cancel_after:
+            self.cancel()
+
+
+def create_headless_app(tmp_path, monkeypatch, seed: int = 5):
+    """
+    Create application without window or Inventor, exporting a generated assembly.
+
+    Args:
+        tmp_path: Temporary directory, used as working directory.
+        monkeypatch: Pytest monkeypatch fixture.
+        seed (int): Seed of generated assembly.
+
+    Returns:
+        tuple: Application, backend and top-level filename.
+    """
+    with open("config/option_config.json") as f:
+        options_config = json.load(f)
+
+    backend = FakeBackend()
+    generator = AssemblyGenerator(depth=3, fan_out=4, reuse_ratio=0.5, seed=seed)
+    top_level = generator.generate(backend)
+
+    # Create generated part files relative to working directory.
+    monkeypatch.chdir(tmp_path)
+    for filename in backend.definitions:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, "wb") as f:
+            f.write(b"part")
+    log_path = tmp_path / "logs" / "run"
+    log_path.mkdir(parents=True)
+
+    app = InventorAutomationApplication.__new__(InventorAutomationApplication)
+    app.backend = backend
+    app.app = backend.connect(False)
+    _, app.assembly_doc = backend.open_document(app.app, top_level, False)
+    app.log_path = str(log_path)
+    app.options_config = options_config
+    app.column_plans = {}
+    app.preview_accuracy = "low"
+    app.enumeration_strategy = "iterative"
+    app.memoize_sub_assemblies = True
+    app.part_cache = PartCache(str(tmp_path / "parts.sqlite"))
+    app.export_snapshot = None
+    app.recent_parts_list = None
+    return app, backend, top_level
+
+
+def collect(app, backend, progress: ExportProgress = None) -> tuple:
+    """
+    Collect parts of headless application, counting Inventor calls.
+
+    Args:
+        app (InventorAutomationApplication): Headless application.
+        backend (FakeBackend): Fake Inventor.
+        progress (ExportProgress): Progress of export, optional.
+
+    Returns:
+        tuple: Parts list and number of calls.
+    """
+    backend.reset_calls()
+    table = app.collect_parts(SELECTED_OPTIONS, progress or ExportProgress())
+    return table, backend.call_count
+
+
+def assert_matches_uncached(table, backend, top_level: str):
+    """
+    Check parts list matches an uncached traversal of the assembly.
+
+    Args:
+        table (PartTable): Parts list.
+        backend (FakeBackend): Fake Inventor.
+        top_level (str): Top-level assembly filename.
+    """
+    manager = InventorManager(backend=backend)
+    parts_list = manager.get_parts_list(top_level, memoize_sub_assemblies=False)
+    expected = PartTable.from_parts(parts_list)
+
+    assert len(table) == len(expected)
+    assert len(set(table.occurrence_paths)) == len(table)
+    for field in COMPARED_FIELDS:
+        for value, expected_value in zip(
+            table.get_values(field), expected.get_values(field)
+        ):
+            if expected_value is None or isinstance(expected_value, str):
+                assert value == expected_value
+            else:
+                assert value == pytest.approx(expected_value)
+
+
+def test_collect_parts_cold(tmp_path, monkeypatch):
+    """
+    Test headless export with empty caches matches uncached traversal.
+    """
+    app, backend, top_level = create_headless_app(tmp_path, monkeypatch)
+
+    table, _ = collect(app, backend)
+
+    assert app.export_snapshot is not None
+    assert_matches_uncached(table, backend, top_level)
+
+
+def test_collect_parts_unchanged(tmp_path, monkeypatch):
+    """
+    Test re-exporting unchanged assembly reuses last export.
+    """
+    app, backend, top_level = create_headless_app(tmp_path, monkeypatch)
+    table, cold_calls = collect(app, backend)
+    app.recent_parts_list = table
+
+    table, warm_calls = collect(app, backend)
+
+    assert warm_calls < cold_calls
+    assert_matches_uncached(table, backend, top_level)
+
+
+def test_collect_parts_changed_file(tmp_path, monkeypatch):
+    """
+    Test re-exporting after a part changes updates its rows.
+    """
+    app, backend, top_level = create_headless_app(tmp_path, monkeypatch)
+    table, _ = collect(app, backend)
+    app.recent_parts_list = table
+
+    # Change mass of a part placed in the assembly, saving its file.
+    part_number = next(
+        part_number
+        for part_number, mass in zip(
+            table.get_values("part_number"), table.get_values("mass")
+        )
+        if mass is not None
+    )
+    changed = next(
+        definition
+        for definition in backend.definitions.values()
+        if definition.properties.get("Part Number") == part_number
+    )
+    changed.mass += 1.0
+    with open(changed.filename, "wb") as f:
+        f.write(b"changed part")
+
+    new_table, _ = collect(app, backend)
+
+    assert_matches_uncached(new_table, backend, top_level)
+    for number, mass, new_mass in zip(
+        table.get_values("part_number"),
+        table.get_values("mass"),
+        new_table.get_values("mass"),
+    ):
+        if number == part_number:
+            assert new_mass != pytest.approx(mass)
+
+
+def test_collect_parts_resumed(tmp_path, monkeypatch):
+    """
+    Test export cancelled part way through resumes from its journal.
+    """
+    app, backend, top_level = create_headless_app(tmp_path, monkeypatch)
+    table, _ = collect(app, backend, CancellingProgress(10))
+    assert 0 < len(table)
+    assert app.export_snapshot is None
+
+    # Resume in a later run.
+    log_path = tmp_path / "logs" / "resumed"
+    log_path.mkdir()
+    app.log_path = str(log_path)
+    table, _ = collect(app, backend)
+
+    # Journal of cancelled export is appended to rather than a new one started.
+    assert app.export_snapshot is not None
+    assert os.listdir(log_path) == []
+    assert_matches_uncached(table, backend, top_level)
@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+from src.FakeBackend import FakeBackend
+from src.FetchPlan import FetchPlan
+from src.MassPropertiesReader import (
+    MassPropertiesReader,
+    ACCURACY_LEVELS,
+    check_accuracy,
+)
+
+# - - - - - - - - - - - - - - - - -
+
+
+def create_occurrences():
+    """
+    Create assembly with a bolt and a part without mass properties.
+    """
+    backend = FakeBackend()
+    backend.add_part(
+        "C:/fake/Bolt.ipt",
+        "TBRE-001",
+        mass=0.5,
+        centre_of_mass=(1.0, 2.0, 3.0),
+        inertia=np.diag([1.0, 2.0, 3.0]),
+    )
+    backend.add_part("C:/fake/Sticker.ipt", "TBRE-002")
+    backend.add_assembly("C:/fake/Top.iam", "TBRE-000")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Bolt.ipt")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Sticker.ipt")
+    occurrences = list(backend.get_component_definition("C:/fake/Top.iam").Occurrences)
+    backend.reset_calls()
+    return backend, occurrences
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_read():
+    """
+    Test every mass property is read from one handle.
+    """
+    backend, occurrences = create_occurrences()
+
+    record = MassPropertiesReader().read(occurrences[0])
+
+    assert record.mass == 0.5
+    assert record.centre_of_mass == pytest.approx((10.0, 20.0, 30.0))
+    assert record.principal_moments == pytest.approx([100.0, 200.0, 300.0])
+    assert backend.calls["ComponentOccurrence.MassProperties"] == 1
+    assert backend.calls["MassProperties.CenterOfMass"] == 1
+    assert backend.call_count == 7
+
+
+def test_read_from_fetch_plan():
+    """
+    Test only mass properties in fetch plan are read.
+    """
+    backend, occurrences = create_occurrences()
+    reader = MassPropertiesReader.from_fetch_plan(FetchPlan(["mass"]))
+
+    record = reader.read(occurrences[0])
+
+    assert record.mass == 0.5
+    assert record.centre_of_mass is None
+    assert record.principal_moments is None
+    assert backend.call_count == 2
+
+    backend.reset_calls()
+    MassPropertiesReader.from_fetch_plan(FetchPlan(["part_number"])).read(
+        occurrences[0]
+    )
+    assert backend.call_count == 0
+
+
+def test_accuracy():
+    """
+    Test accuracy is set on the handle before reading.
+    """
+    backend, occurrences = create_occurrences()
+
+    record = MassPropertiesReader(accuracy="low").read(occurrences[0])
+
+    assert record.accuracy == "low"
+    assert backend.calls["MassProperties.Accuracy"] == 1
+    assert ACCURACY_LEVELS["low"] != ACCURACY_LEVELS["high"]
+    with pytest.raises(ValueError):
+        MassPropertiesReader(accuracy="extreme")
+
+
+def test_missing_mass_properties():
+    """
+    Test part without mass properties gives empty record.
+    """
+    backend, occurrences = create_occurrences()
+
+    record = MassPropertiesReader().read(occurrences[1])
+
+    assert record.mass is None
+    assert record.centre_of_mass is None
+    assert record.principal_axes is None
+    assert record.accuracy is None
+    assert backend.call_count == 1
+
+
+def test_check_accuracy():
+    """
+    Test higher accuracy levels satisfy lower ones.
+    """
+    assert check_accuracy("high", "low")
+    assert check_accuracy("high", "high")
+    assert not check_accuracy("medium", "high")
+    assert not check_accuracy(None, "low")
+    assert check_accuracy(None, None)
+
+
+def test_fetches_counted():
+    """
+    Test fetches are counted against reading each property separately.
+    """
+    backend, occurrences = create_occurrences()
+    reader = FetchPlan(["mass", "centre_of_mass"]).mass_reader
+
+    for occurrence in occurrences:
+        reader.read(occurrence)
+
+    assert reader.reads == 2
+    assert reader.fetches == 3
+    assert reader.separate_fetches == 14
+    assert reader.fetches == (
+        backend.calls["ComponentOccurrence.MassProperties"]
+        + backend.calls["MassProperties.CenterOfMass"]
+    )
+
+    reader.log_fetches()
+    assert reader.reads == reader.fetches == reader.separate_fetches == 0
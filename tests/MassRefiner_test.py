@@ -0,0 +1,100 @@
+from src.FetchPlan import FetchPlan
+from src.MassRefiner import MassRefiner
+from src.Part import Part
+from src.PartTable import PartTable
+
+# - - - - - - - - - - - - - - - - -
+
+
+def create_part(name, mass, accuracy):
+    """
+    Create part of occurrence with values.
+    """
+    part = Part.from_record(
+        {
+            "part_number": f"TBRE-{name}",
+            "part_name": "Bracket",
+            "mass": mass,
+            "x_axis": 1.0,
+            "y_axis": 2.0,
+            "z_axis": 3.0,
+            "accuracy": accuracy,
+        }
+    )
+    part.occurrence_path = (f"{name}:1",)
+    return part
+
+
+def create_refiner(count=4):
+    """
+    Create refiner of table exported at low accuracy.
+    """
+    table = PartTable.from_parts(
+        [create_part(str(index), 1.0, "low") for index in range(count)]
+    )
+    return MassRefiner(table, FetchPlan(["part_number", "mass"]), "high")
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_fetch_plan():
+    """
+    Test refinement only fetches mass properties of export.
+    """
+    refiner = create_refiner()
+
+    assert refiner.fetch_plan.fields == {"mass"}
+    assert refiner.fetch_plan.accuracy == "high"
+    assert refiner.check_needed()
+    assert not MassRefiner(
+        PartTable(), FetchPlan(["part_number"]), "high"
+    ).check_needed()
+
+
+def test_apply_as_parts_arrive():
+    """
+    Test arrived parts replace mass properties of their rows only.
+    """
+    refiner = create_refiner()
+    refiner.parts_list.extend(create_part(str(index), 1.5, "high") for index in [0, 1])
+    refiner.parts_list[0].part_number = None
+
+    assert refiner.apply() == 2
+    assert refiner.apply() == 0
+    assert refiner.table.get_values("mass") == [1.5, 1.5, 1.0, 1.0]
+    assert refiner.table.get_values("accuracy") == ["high", "high", "low", "low"]
+    assert refiner.table.get_values("part_number")[0] == "TBRE-0"
+
+    refiner.parts_list.extend(create_part(str(index), 1.5, "high") for index in [2, 3])
+    assert refiner.finish()
+    assert refiner.table.get_values("accuracy") == ["high"] * 4
+
+
+def test_mismatched_occurrence_stops():
+    """
+    Test refinement stops at first part of a different occurrence to its row.
+    """
+    refiner = create_refiner()
+    refiner.parts_list.extend(
+        create_part(name, 1.5, "high") for name in ["0", "new", "1"]
+    )
+
+    assert refiner.apply() == 1
+    assert refiner.mismatched
+    assert refiner.progress.cancelled
+    assert not refiner.finish()
+    assert refiner.table.get_values("mass") == [1.5, 1.0, 1.0, 1.0]
+
+
+def test_cancelled_keeps_refined_rows():
+    """
+    Test cancelled refinement keeps rows already refined.
+    """
+    refiner = create_refiner()
+    refiner.parts_list.append(create_part("0", 1.5, "high"))
+    refiner.progress.cancel()
+
+    assert not refiner.finish()
+    assert refiner.applied == 1
+    assert refiner.table.get_values("accuracy") == ["high", "low", "low", "low"]
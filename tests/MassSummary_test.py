@@ -0,0 +1,105 @@
+import time
+
+import pytest
+from src.ColumnPlan import ColumnPlan, Column
+from src.HtmlReportWriter import iter_html_parts_list
+from src.MassSummary import MassSummary
+from src.Part import Part
+from src.PartTable import PartTable
+
+# - - - - - - - - - - - - - - - - -
+
+
+def create_part(mass, centre_of_mass):
+    """
+    Create part from values.
+    """
+    x_axis, y_axis, z_axis = centre_of_mass
+    return Part.from_record(
+        {
+            "part_number": "TBRE-001",
+            "part_name": None,
+            "mass": mass,
+            "x_axis": x_axis,
+            "y_axis": y_axis,
+            "z_axis": z_axis,
+        }
+    )
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_centre_of_mass():
+    """
+    Test overall centre of mass is mass weighted.
+    """
+    table = PartTable.from_parts(
+        [create_part(1.0, (0.0, 0.0, 0.0)), create_part(3.0, (100.0, 40.0, -20.0))]
+    )
+    summary = MassSummary(table)
+
+    assert summary.total_mass == pytest.approx(4.0)
+    assert summary.moments == pytest.approx([300.0, 120.0, -60.0])
+    assert summary.centre_of_mass == pytest.approx([75.0, 30.0, -15.0])
+
+
+def test_missing_counted():
+    """
+    Test parts with missing values are counted and excluded from centre of mass.
+    """
+    table = PartTable.from_parts(
+        [
+            create_part(2.0, (10.0, 10.0, 10.0)),
+            create_part(None, (50.0, 50.0, 50.0)),
+            create_part(5.0, (None, None, None)),
+        ]
+    )
+    summary = MassSummary(table)
+
+    assert summary.part_count == 3
+    assert summary.missing_mass == 1
+    assert summary.missing_centre_of_mass == 1
+    assert summary.total_mass == pytest.approx(7.0)
+    assert summary.included_mass == pytest.approx(2.0)
+    assert summary.centre_of_mass == pytest.approx([10.0, 10.0, 10.0])
+
+
+def test_empty():
+    """
+    Test empty parts list has no centre of mass.
+    """
+    summary = MassSummary(PartTable())
+
+    assert summary.part_count == 0
+    assert summary.total_mass == 0.0
+    assert summary.centre_of_mass == [None, None, None]
+
+
+def test_html_footer():
+    """
+    Test summary is written after parts table.
+    """
+    table = PartTable.from_parts([create_part(1.0, (1.0, 2.0, 3.0))])
+    html = "".join(
+        iter_html_parts_list(
+            table, ColumnPlan([Column("Mass", "mass")]), MassSummary(table)
+        )
+    )
+
+    assert html.index("</table>") < html.index("<h3>Summary</h3>")
+    assert "<tr><th>Total mass (kg)</th><td>1.0</td></tr>" in html
+
+
+def test_large_parts_list():
+    """
+    Test summary of tens of thousands of parts takes milliseconds.
+    """
+    table = PartTable.from_parts(
+        [create_part(float(i % 7), (i, -i, 2 * i)) for i in range(50000)]
+    )
+
+    start_time = time.perf_counter()
+    summary = MassSummary(table)
+    assert time.perf_counter() - start_time < 0.05
+    assert summary.part_count == 50000
@@ -0,0 +1,151 @@
+import sys
+
+import pytest
+
+from src.OccurrenceEnumerator import (
+    OccurrenceEnumerator,
+    PART_DOCUMENT,
+    ASSEMBLY_DOCUMENT,
+)
+
+# - - - - - - - - - - - - - - - - -
+
+
+class FakePath(list):
+    @property
+    def Count(self):
+        return len(self)
+
+
+class FakeOccurrence:
+    def __init__(self, name, children=None, parent=None):
+        self.Name = name
+        self.SubOccurrences = children or []
+        self.DefinitionDocumentType = (
+            ASSEMBLY_DOCUMENT if children is not None else PART_DOCUMENT
+        )
+        parent_path = parent.OccurrencePath if parent else []
+        self.OccurrencePath = FakePath(parent_path + [self])
+
+
+class FakeOccurrences(list):
+    @property
+    def AllLeafOccurrences(self):
+        leaves = []
+        stack = list(reversed(self))
+        while stack:
+            occurrence = stack.pop()
+            if occurrence.DefinitionDocumentType == PART_DOCUMENT:
+                leaves.append(occurrence)
+            stack.extend(reversed(occurrence.SubOccurrences))
+        return leaves
+
+
+def create_assembly():
+    """
+    Create assembly with a repeated corner sub-assembly.
+    """
+    occurrences = FakeOccurrences()
+    for corner in ["FL:1", "FR:1"]:
+        assembly = FakeOccurrence(corner, children=[])
+        assembly.SubOccurrences.append(FakeOccurrence("Upright:1", parent=assembly))
+        assembly.SubOccurrences.append(FakeOccurrence("Hub:1", parent=assembly))
+        occurrences.append(assembly)
+    occurrences.append(FakeOccurrence("Chassis:1"))
+    return occurrences
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_iterative_walk():
+    """
+    Test iterative walk yields paths, depths and assembly ends in order.
+    """
+    enumerator = OccurrenceEnumerator("iterative")
+    events = [
+        (entry.path, entry.depth, entry.end)
+        for entry in enumerator.walk(create_assembly())
+    ]
+
+    assert events == [
+        (("FL:1",), 0, False),
+        (("FL:1", "Upright:1"), 1, False),
+        (("FL:1", "Hub:1"), 1, False),
+        (("FL:1",), 0, True),
+        (("FR:1",), 0, False),
+        (("FR:1", "Upright:1"), 1, False),
+        (("FR:1", "Hub:1"), 1, False),
+        (("FR:1",), 0, True),
+        (("Chassis:1",), 0, False),
+    ]
+    assert enumerator.visited == 7
+
+
+def test_iterative_walk_skip_descend():
+    """
+    Test sub-occurrences are skipped when descend is cleared.
+    """
+    enumerator = OccurrenceEnumerator("iterative")
+    paths = []
+    for entry in enumerator.walk(create_assembly()):
+        paths.append(entry.path)
+        if entry.path == ("FR:1",):
+            entry.descend = False
+
+    assert ("FR:1", "Hub:1") not in paths
+    assert paths.count(("FR:1",)) == 1
+
+
+def test_all_leaf_walk():
+    """
+    Test bulk leaf walk yields the same parts as the iterative walk.
+    """
+    enumerator = OccurrenceEnumerator("all_leaf")
+    entries = list(enumerator.walk(create_assembly()))
+
+    assert [entry.path for entry in entries] == [
+        ("FL:1", "Upright:1"),
+        ("FL:1", "Hub:1"),
+        ("FR:1", "Upright:1"),
+        ("FR:1", "Hub:1"),
+        ("Chassis:1",),
+    ]
+    assert [entry.depth for entry in entries] == [1, 1, 1, 1, 0]
+
+
+def test_all_leaf_fallback():
+    """
+    Test bulk leaf walk falls back to iterative walk.
+    """
+    occurrences = list(create_assembly())
+    enumerator = OccurrenceEnumerator("all_leaf")
+    entries = list(enumerator.walk(occurrences))
+
+    assert len(entries) == 9
+
+
+def test_deep_assembly():
+    """
+    Test walking assemblies deeper than the recursion limit.
+    """
+    depth = sys.getrecursionlimit() + 100
+    leaf = FakeOccurrence("Bolt:1")
+    for level in range(depth):
+        leaf = FakeOccurrence(f"Level:{level}", children=[leaf])
+
+    enumerator = OccurrenceEnumerator("iterative")
+    parts = [
+        entry for entry in enumerator.walk([leaf]) if entry.doc_type == PART_DOCUMENT
+    ]
+    assert len(parts) == 1
+    assert parts[0].depth == depth
+    assert len(parts[0].path) == depth + 1
+
+
+def test_unknown_strategy():
+    """
+    Test unknown strategies are rejected.
+    """
+    with pytest.raises(ValueError):
+        OccurrenceEnumerator("recursive")
@@ -0,0 +1,322 @@
+import os
+
+import numpy as np
+import pytest
+from src.AssemblyGenerator import AssemblyGenerator
+from src.FakeBackend import FakeBackend
+from src.FetchPlan import FetchPlan
+from src.InventorManager import InventorManager
+from src.PartCache import PartCache
+
+# - - - - - - - - - - - - - - - - -
+
+fetch_plan = FetchPlan(["part_number", "part_name", "mass", "centre_of_mass"])
+
+
+class FakeValue:
+    def __init__(self, value):
+        self.Value = value
+
+
+class FakePropertySet:
+    def __init__(self, values):
+        self.values = values
+
+    def Item(self, name):
+        return FakeValue(self.values[name])
+
+
+class FakePropertySets:
+    def __init__(self, values):
+        self.values = values
+
+    def Item(self, name):
+        return FakePropertySet(self.values)
+
+
+class FailingPropertySets:
+    def Item(self, name):
+        raise RuntimeError("Property sets unavailable.")
+
+
+class FakeDocument:
+    def __init__(self, full_file_name, dirty=False):
+        self.FullFileName = full_file_name
+        self.Dirty = dirty
+        self.PropertySets = FakePropertySets(
+            {"Part Number": "TBRE-001", "Description": "Upright"}
+        )
+
+
+class FakeDefinition:
+    def __init__(self, document):
+        self.Document = document
+
+
+class FakePoint:
+    def __init__(self, point):
+        self.X, self.Y, self.Z = point
+
+
+class FakeMassProperties:
+    def __init__(self, mass, centre_of_mass):
+        self.Mass = mass
+        self.CenterOfMass = FakePoint(centre_of_mass)
+
+
+class FakeMatrix:
+    def __init__(self, matrix):
+        self.matrix = matrix
+
+    def Cell(self, row, column):
+        return self.matrix[row - 1][column - 1]
+
+
+class FakeOccurrence:
+    """
+    Part occurrence translated by offset in cm, counting mass property reads.
+    """
+
+    def __init__(self, document, offset, local_centre=(1.0, 2.0, 3.0)):
+        self.Name = "Upright:1"
+        self.Definition = FakeDefinition(document)
+        self.Transformation = FakeMatrix(
+            [
+                [1, 0, 0, offset[0]],
+                [0, 1, 0, offset[1]],
+                [0, 0, 1, offset[2]],
+                [0, 0, 0, 1],
+            ]
+        )
+        self.world_centre = np.add(local_centre, offset).tolist()
+        self.reads = 0
+
+    @property
+    def MassProperties(self):
+        self.reads += 1
+        return FakeMassProperties(2.0, self.world_centre)
+
+
+@pytest.fixture
+def part_file(tmp_path):
+    """
+    Create part file on disk.
+    """
+    filename = tmp_path / "upright.ipt"
+    filename.write_bytes(b"part")
+    return str(filename)
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_hit_skips_inventor(tmp_path, part_file):
+    """
+    Test cached part is created without reading mass properties.
+    """
+    filename = str(tmp_path / "cache" / "parts.sqlite")
+    document = FakeDocument(part_file)
+
+    # First run fetches from Inventor.
+    cache = PartCache(filename)
+    first = FakeOccurrence(document, (0, 0, 0))
+    cache.get_part(first, fetch_plan=fetch_plan)
+    cache.close()
+    assert cache.misses == 1
+
+    # Second run creates part from cache at new position.
+    cache = PartCache(filename)
+    second = FakeOccurrence(document, (10, 0, 0))
+    part = cache.get_part(second, fetch_plan=fetch_plan)
+    cache.close()
+
+    assert cache.hits == 1
+    assert second.reads == 0
+    assert part.part_number == "TBRE-001"
+    assert part.mass == 2.0
+    assert [part.x_axis, part.y_axis, part.z_axis] == pytest.approx([110.0, 20.0, 30.0])
+
+
+def test_modified_file_misses(tmp_path, part_file):
+    """
+    Test changed file is fetched again.
+    """
+    cache = PartCache(str(tmp_path / "parts.sqlite"))
+    document = FakeDocument(part_file)
+    cache.get_part(FakeOccurrence(document, (0, 0, 0)), fetch_plan=fetch_plan)
+
+    # Change file size.
+    with open(part_file, "ab") as f:
+        f.write(b"changed")
+    occurrence = FakeOccurrence(document, (0, 0, 0))
+    cache.get_part(occurrence, fetch_plan=fetch_plan)
+
+    assert cache.misses == 2
+    assert occurrence.reads > 0
+
+
+def test_dirty_document_bypassed(tmp_path, part_file):
+    """
+    Test documents with unsaved changes are not cached.
+    """
+    cache = PartCache(str(tmp_path / "parts.sqlite"))
+    document = FakeDocument(part_file, dirty=True)
+    cache.get_part(FakeOccurrence(document, (0, 0, 0)))
+    cache.get_part(FakeOccurrence(document, (0, 0, 0)))
+
+    assert cache.bypassed == 2
+    assert cache.connection is None
+
+
+def test_missing_fields_merged(tmp_path, part_file):
+    """
+    Test cached part without needed fields is fetched again and merged.
+    """
+    cache = PartCache(str(tmp_path / "parts.sqlite"))
+    document = FakeDocument(part_file)
+    cache.get_part(FakeOccurrence(document, (0, 0, 0)), fetch_plan=FetchPlan(["mass"]))
+    cache.get_part(
+        FakeOccurrence(document, (0, 0, 0)), fetch_plan=FetchPlan(["part_number"])
+    )
+    cache.get_part(FakeOccurrence(document, (0, 0, 0)), fetch_plan=FetchPlan(["mass"]))
+
+    assert cache.misses == 2
+    assert cache.hits == 1
+
+
+def test_failed_read_not_cached(tmp_path, part_file):
+    """
+    Test part that failed to read is not cached under its file.
+    """
+    cache = PartCache(str(tmp_path / "parts.sqlite"))
+    document = FakeDocument(part_file)
+    document.PropertySets = FailingPropertySets()
+    plan = FetchPlan(["part_number"])
+
+    first = FakeOccurrence(document, (0, 0, 0))
+    first.Name = "Bolt:1"
+    second = FakeOccurrence(document, (0, 0, 0))
+    second.Name = "Bolt:7"
+    assert cache.get_part(first, fetch_plan=plan).part_number == "Bolt:1"
+    part = cache.get_part(second, fetch_plan=plan)
+
+    assert part.read_failed
+    assert part.part_number == "Bolt:7"
+    assert cache.misses == 2
+    assert cache.hits == 0
+
+
+def test_accuracy_levels(tmp_path, part_file):
+    """
+    Test cached part is only used when read at required accuracy or higher.
+    """
+    cache = PartCache(str(tmp_path / "parts.sqlite"))
+    document = FakeDocument(part_file)
+    fields = ["mass", "centre_of_mass"]
+
+    for accuracy in ["low", "low", "high", "low", "high"]:
+        part = cache.get_part(
+            FakeOccurrence(document, (0, 0, 0)),
+            fetch_plan=FetchPlan(fields, accuracy),
+        )
+
+    assert cache.misses == 2
+    assert cache.hits == 3
+    assert part.accuracy == "high"
+
+
+def test_less_accurate_fields_not_merged(tmp_path, part_file):
+    """
+    Test cached mass properties are not relabelled with a higher accuracy.
+    """
+    cache = PartCache(str(tmp_path / "parts.sqlite"))
+    key = cache.get_key(FakeDocument(part_file))
+    record = {
+        "part_number": "TBRE-001",
+        "part_name": None,
+        "mass": 2.0,
+        "x_axis": 1.0,
+        "y_axis": 2.0,
+        "z_axis": 3.0,
+        "principal_moments": None,
+        "principal_axes": None,
+        "accuracy": None,
+    }
+    cache.store(key, {"part_number", "mass", "centre_of_mass"}, record)
+    cache.store(key, {"mass"}, dict(record, mass=2.5, accuracy="high"))
+
+    assert cache.lookup(key, {"centre_of_mass"}, "high") is None
+    assert cache.lookup(key, {"part_number", "mass"}, "high")["mass"] == 2.5
+
+    # Fields without an accuracy keep the cached accuracy.
+    cache.store(key, {"part_name"}, dict(record, part_name="Upright"))
+    assert cache.lookup(key, {"part_name", "mass"}, "high")["mass"] == 2.5
+
+
+def test_warm_cache_fewer_calls(tmp_path, monkeypatch):
+    """
+    Test exporting from a warm cache makes fewer Inventor calls than without it.
+    """
+    backend = FakeBackend()
+    generator = AssemblyGenerator(depth=2, fan_out=6, reuse_ratio=0.5, seed=3)
+    top_level = generator.generate(backend)
+
+    # Create generated part files relative to working directory.
+    monkeypatch.chdir(tmp_path)
+    for filename in backend.definitions:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, "wb") as f:
+            f.write(b"part")
+
+    def export(part_cache):
+        manager = InventorManager(backend=backend)
+        backend.reset_calls()
+        parts_list = manager.get_parts_list(
+            top_level, memoize_sub_assemblies=False, part_cache=part_cache
+        )
+        return parts_list, backend.call_count
+
+    uncached_parts, uncached_calls = export(None)
+    cache = PartCache(str(tmp_path / "parts.sqlite"))
+    export(cache)
+    cold_hits = cache.hits
+    warm_parts, warm_calls = export(cache)
+
+    assert cache.hits - cold_hits == len(warm_parts)
+    assert warm_calls < uncached_calls
+    assert backend.calls["Matrix.Cell"] == 0
+    for warm, uncached in zip(warm_parts, uncached_parts):
+        assert warm.part_number == uncached.part_number
+        assert warm.mass == pytest.approx(uncached.mass)
+        assert [warm.x_axis, warm.y_axis, warm.z_axis] == pytest.approx(
+            [uncached.x_axis, uncached.y_axis, uncached.z_axis]
+        )
+
+
+def test_least_recently_used_removed(tmp_path):
+    """
+    Test size cap removes least recently used parts.
+    """
+    cache = PartCache(str(tmp_path / "parts.sqlite"), max_entries=1)
+    for name in ["a.ipt", "b.ipt"]:
+        filename = tmp_path / name
+        filename.write_bytes(b"part")
+        cache.get_part(
+            FakeOccurrence(FakeDocument(str(filename)), (0, 0, 0)),
+            fetch_plan=fetch_plan,
+        )
+    cache.flush()
+
+    rows = cache.connection.execute("SELECT path FROM parts").fetchall()
+    assert rows == [(os.path.normcase(str(tmp_path / "b.ipt")),)]
+
+
+def test_opened_lazily(tmp_path):
+    """
+    Test database is not created until used.
+    """
+    filename = tmp_path / "parts.sqlite"
+    cache = PartCache(str(filename))
+    cache.close()
+
+    assert not filename.exists()
@@ -0,0 +1,68 @@
+import threading
+
+from src.Part import Part
+from src.PartStream import PartStream
+
+# - - - - - - - - - - - - - - - - -
+
+
+def create_part(index):
+    """
+    Create part from values.
+    """
+    part = Part.from_record(
+        {
+            "part_number": f"TBRE-{index:03d}",
+            "part_name": "Bracket",
+            "mass": 1.0,
+            "x_axis": float(index),
+            "y_axis": 0.0,
+            "z_axis": 0.0,
+        }
+    )
+    part.occurrence_path = (f"Bracket:{index}",)
+    return part
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_take_arrived_parts():
+    """
+    Test each batch appends only parts that arrived since the last one.
+    """
+    stream = PartStream()
+    assert stream.take() == 0
+
+    stream.parts_list.extend(create_part(index) for index in range(3))
+    assert stream.take() == 3
+    assert stream.take() == 0
+
+    stream.parts_list.append(create_part(3))
+    assert stream.take() == 1
+    assert len(stream) == 4
+    assert stream.batches == 2
+    assert stream.table.get_values("x_axis") == [0.0, 1.0, 2.0, 3.0]
+    assert stream.table.occurrence_paths[3] == ("Bracket:3",)
+
+
+def test_take_while_appending():
+    """
+    Test batches taken while a worker appends parts hold every part in order.
+    """
+    stream = PartStream()
+    count = 5000
+
+    def append_parts():
+        for index in range(count):
+            stream.parts_list.append(create_part(index))
+
+    worker = threading.Thread(target=append_parts)
+    worker.start()
+    while worker.is_alive():
+        stream.take()
+    worker.join()
+    stream.take()
+
+    assert len(stream) == count
+    assert stream.table.get_values("x_axis") == [float(index) for index in range(count)]
@@ -0,0 +1,147 @@
+import time
+
+import pytest
+from src.ColumnPlan import ColumnPlan, Column
+from src.MassSummary import MassSummary
+from src.Part import Part
+from src.PartTable import PartTable
+from src.PartTableView import PartTableView, format_summary
+
+# - - - - - - - - - - - - - - - - -
+
+columns = ColumnPlan(
+    [
+        Column("P/N", "part_number"),
+        Column("Mass (kg)", "mass", column_type="number", precision=2),
+    ]
+)
+
+
+def create_part(part_number, mass):
+    """
+    Create part from values.
+    """
+    return Part.from_record(
+        {
+            "part_number": part_number,
+            "part_name": None,
+            "mass": mass,
+            "x_axis": 1.0,
+            "y_axis": 2.0,
+            "z_axis": 3.0,
+        }
+    )
+
+
+def create_view():
+    """
+    Create view of small parts list.
+    """
+    table = PartTable.from_parts(
+        [
+            create_part("B", 2.0),
+            create_part(None, None),
+            create_part("C", 0.5),
+            create_part("A", 1.25),
+        ]
+    )
+    return PartTableView(table, columns)
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_page_in_export_order():
+    """
+    Test page is formatted in export order with blanks for missing values.
+    """
+    view = create_view()
+
+    assert view.get_page(0, 2) == [("B", "2.00"), ("", "")]
+    assert view.get_page(3, 10) == [("A", "1.25")]
+
+
+def test_sort_numeric_column():
+    """
+    Test sorting numeric column toggles direction with missing values last.
+    """
+    view = create_view()
+
+    view.sort(1)
+    assert [row[1] for row in view.get_page(0, 4)] == ["0.50", "1.25", "2.00", ""]
+    assert view.get_heading(1) == "Mass (kg) ▲"
+
+    view.sort(1)
+    assert [row[1] for row in view.get_page(0, 4)] == ["2.00", "1.25", "0.50", ""]
+    assert view.get_heading(1) == "Mass (kg) ▼"
+    assert view.get_heading(0) == "P/N"
+
+
+def test_sort_string_column():
+    """
+    Test sorting string column with missing values last.
+    """
+    view = create_view()
+
+    view.sort(0)
+
+    assert [row[0] for row in view.get_page(0, 4)] == ["A", "B", "C", ""]
+
+
+def test_summary_text():
+    """
+    Test summary is formatted as text lines.
+    """
+    table = PartTable.from_parts([create_part("A", 2.0)])
+
+    text = format_summary(MassSummary(table))
+
+    assert "Parts: 1" in text
+    assert "Total mass (kg): 2.00" in text
+    assert format_summary(None) == ""
+
+
+@pytest.mark.parametrize("count", [20000])
+def test_large_table_page_fast(count):
+    """
+    Test sorting and paging a large table does not format every row.
+    """
+    table = PartTable.from_parts(
+        [create_part(f"TBRE-{index:05d}", index * 0.1) for index in range(count)]
+    )
+    view = PartTableView(table, columns)
+
+    start_time = time.perf_counter()
+    view.sort(1)
+    view.sort(1)
+    page = view.get_page(0, 28)
+    elapsed = time.perf_counter() - start_time
+
+    assert page[0][0] == f"TBRE-{count - 1:05d}"
+    assert len(page) == 28
+    assert elapsed < 0.5
+
+
+def test_update_order_of_appended_rows():
+    """
+    Test appended rows are shown in sort order of view.
+    """
+    view = create_view()
+    view.sort(1)
+
+    view.table.append(create_part("D", 1.0))
+    view.update_order()
+
+    assert [row[0] for row in view.get_page(0, 5)] == ["C", "D", "A", "B", ""]
+
+
+def test_update_order_of_replaced_table():
+    """
+    Test replacing table keeps export order of unsorted view.
+    """
+    view = create_view()
+
+    view.update_order(PartTable.from_parts([create_part("E", 3.0)]))
+
+    assert len(view) == 1
+    assert view.get_page(0, 5) == [("E", "3.00")]
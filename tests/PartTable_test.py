@@ -0,0 +1,181 @@
+import math
+
+import numpy as np
+import pytest
+from src.ColumnPlan import ColumnPlan, Column
+from src.HtmlReportWriter import iter_html_parts_list
+from src.Part import Part
+from src.PartTable import PartTable
+
+# - - - - - - - - - - - - - - - - -
+
+columns = ColumnPlan(
+    [
+        Column("P/N", "part_number"),
+        Column("Mass (kg)", "mass"),
+        Column("X-axis mass", "x_axis_mass"),
+    ]
+)
+
+
+def create_part(part_number, mass, centre_of_mass=(1.0, 2.0, 3.0)):
+    """
+    Create part from values.
+    """
+    x_axis, y_axis, z_axis = centre_of_mass
+    return Part.from_record(
+        {
+            "part_number": part_number,
+            "part_name": "Bracket",
+            "mass": mass,
+            "x_axis": x_axis,
+            "y_axis": y_axis,
+            "z_axis": z_axis,
+        }
+    )
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_missing_values_nan():
+    """
+    Test missing numeric values are stored as NaN.
+    """
+    table = PartTable.from_parts(
+        [create_part("A", None), create_part("B", 2.0, (None, None, None))]
+    )
+
+    assert table.get_column("mass").dtype == np.float64
+    assert math.isnan(table.get_column("mass")[0])
+    assert math.isnan(table.get_column("x_axis")[1])
+    assert table.get_values("mass") == [None, 2.0]
+
+
+def test_moments_match_parts():
+    """
+    Test vectorized moments match per part moments.
+    """
+    parts = [create_part("A", 2.0), create_part("B", None), create_part("C", 0.5)]
+    table = PartTable.from_parts(parts)
+
+    for field in ["x_axis_mass", "y_axis_mass", "z_axis_mass"]:
+        assert table.get_values(field) == [getattr(part, field) for part in parts]
+
+
+def test_strings_interned():
+    """
+    Test repeated strings share one object.
+    """
+    table = PartTable.from_parts(
+        [create_part("".join(["TBRE-", "001"]), 1.0) for _ in range(3)]
+    )
+
+    numbers = table.get_column("part_number")
+    assert numbers[0] is numbers[1] is numbers[2]
+
+
+def test_append_grows():
+    """
+    Test appending beyond capacity keeps earlier values.
+    """
+    table = PartTable(capacity=2)
+    for i in range(5):
+        table.append(create_part(f"P{i}", float(i)))
+
+    assert len(table) == 5
+    assert table.get_column("mass").tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert table.get_column("x_axis_mass").tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_slice():
+    """
+    Test slicing returns table of selected rows.
+    """
+    table = PartTable.from_parts([create_part(f"P{i}", float(i)) for i in range(5)])
+    head = table[:2]
+
+    assert len(head) == 2
+    assert head.get_column("part_number") == ["P0", "P1"]
+    with pytest.raises(TypeError):
+        table[0]
+
+
+def test_dataframe():
+    """
+    Test dataframe columns follow column plan.
+    """
+    table = PartTable.from_parts([create_part("A", 2.0), create_part("B", None)])
+    dataframe = table.to_dataframe(columns)
+
+    assert list(dataframe.columns) == ["P/N", "Mass (kg)", "X-axis mass"]
+    assert dataframe["X-axis mass"].iloc[0] == pytest.approx(2.0)
+    assert dataframe["Mass (kg)"].isna().iloc[1]
+
+
+def test_html_matches_parts():
+    """
+    Test HTML from table matches HTML from parts.
+    """
+    parts = [create_part("<A>", 2.0), create_part("B", None)]
+    table = PartTable.from_parts(parts)
+
+    assert "".join(iter_html_parts_list(table, columns)) == "".join(
+        iter_html_parts_list(parts, columns)
+    )
+
+
+def test_empty_parts_list():
+    """
+    Test table can be created from empty parts list.
+    """
+    table = PartTable.from_parts([])
+
+    assert len(table) == 0
+    assert table.get_column("principal_moments").shape == (0, 3)
+
+
+def test_set_rows_on_copy():
+    """
+    Test replacing rows of a copy leaves original unchanged.
+    """
+    table = PartTable.from_parts([create_part(f"P{i}", float(i)) for i in range(3)])
+    patched = table.copy()
+    patched.set_rows([1], [create_part("Q1", 10.0)])
+
+    assert patched.get_column("part_number") == ["P0", "Q1", "P2"]
+    assert patched.get_column("x_axis_mass").tolist() == [0.0, 10.0, 2.0]
+    assert table.get_column("part_number") == ["P0", "P1", "P2"]
+    assert table.get_column("mass").tolist() == [0.0, 1.0, 2.0]
+
+
+def test_take_rows_in_order():
+    """
+    Test taking rows keeps given order.
+    """
+    table = PartTable.from_parts(
+        [create_part("A", 2.0), create_part("B", None), create_part("C", 0.5)]
+    )
+
+    taken = table.take([2, 0])
+
+    assert taken.get_column("part_number") == ["C", "A"]
+    assert taken.get_values("mass") == [0.5, 2.0]
+    assert len(taken) == 2
+
+
+def test_set_rows_of_fields():
+    """
+    Test only given fields are replaced.
+    """
+    table = PartTable.from_parts([create_part("TBRE-001", 1.0)])
+    table.occurrence_paths[0] = ("Upright:1",)
+    refined = create_part(None, 2.0)
+    refined.accuracy = "high"
+
+    table.set_rows([0], [refined], ["mass", "accuracy"])
+
+    assert table.get_values("part_number") == ["TBRE-001"]
+    assert table.get_values("mass") == [2.0]
+    assert table.get_values("accuracy") == ["high"]
+    assert table.occurrence_paths == [("Upright:1",)]
@@ -0,0 +1,71 @@
+import pytest
+
+from src.PropertyCache import PropertyCache
+
+# - - - - - - - - - - - - - - - - -
+
+
+class FakeProperty:
+    def __init__(self, value):
+        self.Value = value
+
+
+class FakePropertySet:
+    def __init__(self, document):
+        self.document = document
+
+    def Item(self, name):
+        self.document.reads += 1
+        return FakeProperty(self.document.values[name])
+
+
+class FakePropertySets:
+    def __init__(self, document):
+        self.document = document
+
+    def Item(self, name):
+        assert name == "Design Tracking Properties"
+        return FakePropertySet(self.document)
+
+
+class FakeDocument:
+    def __init__(self, full_file_name, part_number, description):
+        self.FullFileName = full_file_name
+        self.values = {"Part Number": part_number, "Description": description}
+        self.reads = 0
+        self.PropertySets = FakePropertySets(self)
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_get_document_properties():
+    """
+    Test document properties are fetched once per definition.
+    """
+    bolt = FakeDocument(r"C:\parts\bolt.ipt", "TBRE-001", "M6 Bolt")
+    bracket = FakeDocument(r"C:\parts\bracket.ipt", "TBRE-002", "Bracket")
+    cache = PropertyCache()
+
+    for document in [bolt, bracket, bolt, bolt]:
+        properties = cache.get_document_properties(document)
+        assert properties["part_number"] == document.values["Part Number"]
+        assert properties["part_name"] == document.values["Description"]
+
+    assert cache.hits == 2
+    assert cache.misses == 2
+    assert bolt.reads == 2
+    assert bracket.reads == 2
+
+
+def test_failed_read_not_cached():
+    """
+    Test failed property reads are not stored in the cache.
+    """
+    broken = FakeDocument(r"C:\parts\broken.ipt", "TBRE-003", "Broken")
+    del broken.values["Description"]
+    cache = PropertyCache()
+
+    with pytest.raises(KeyError):
+        cache.get_document_properties(broken)
+    assert broken.FullFileName not in cache.properties
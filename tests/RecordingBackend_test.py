@@ -0,0 +1,88 @@
+import gzip
+import json
+
+import numpy as np
+import pytest
+from src.FakeBackend import FakeBackend
+from src.InventorManager import InventorManager
+from src.RecordingBackend import RecordingBackend, RecordingProxy
+
+# - - - - - - - - - - - - - - - - -
+
+
+def create_backend():
+    """
+    Create assembly with a bolt placed twice and a part without mass.
+    """
+    backend = FakeBackend()
+    backend.add_part(
+        "C:/fake/Bolt.ipt",
+        "TBRE-001",
+        "Bolt",
+        mass=0.5,
+        centre_of_mass=(0.0, 0.0, 1.0),
+        inertia=np.diag([1.0, 2.0, 3.0]),
+    )
+    backend.add_part("C:/fake/Sticker.ipt", "TBRE-002")
+    backend.add_assembly("C:/fake/Top.iam", "TBRE-000")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Bolt.ipt")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Bolt.ipt")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Sticker.ipt")
+    return backend
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_record_reads():
+    """
+    Test repeated reads of a member share one recording with a read count.
+    """
+    recorder = RecordingBackend(create_backend())
+    app = recorder.connect()
+
+    document, _ = recorder.open_document(app, "C:/fake/Top.iam")
+    document.FullFileName
+    document.FullFileName
+
+    assert isinstance(document, RecordingProxy)
+    assert recorder.documents == ["C:/fake/Top.iam"]
+    members = recorder.objects[document._object_id]
+    assert members["FullFileName"]["v"] == "C:/fake/Top.iam"
+    assert members["FullFileName"]["n"] == 2
+
+
+def test_record_iteration_and_errors():
+    """
+    Test iterations record each item and errors are recorded and raised.
+    """
+    backend = create_backend()
+    recorder = RecordingBackend(backend)
+    app = recorder.connect()
+    _, assembly_doc = recorder.open_document(app, "C:/fake/Top.iam")
+
+    occurrences = list(assembly_doc.ComponentDefinition.Occurrences)
+    with pytest.raises(RuntimeError):
+        occurrences[2].MassProperties.Mass
+
+    assert len(occurrences) == 3
+    assert occurrences[0].Name == "Bolt:1"
+    assert "e" in recorder.objects[occurrences[2]._object_id]["MassProperties"]
+
+
+def test_save(tmp_path):
+    """
+    Test recording of export is saved as gzipped JSON.
+    """
+    recorder = RecordingBackend(create_backend())
+    manager = InventorManager(backend=recorder)
+    manager.get_parts_list("C:/fake/Top.iam")
+    filename = tmp_path / "recording.json.gz"
+
+    recorder.save(filename)
+
+    with gzip.open(filename, "rt") as f:
+        recording = json.load(f)
+    assert recording["backend"] == "fake"
+    assert recording["documents"] == ["C:/fake/Top.iam"]
+    assert len(recording["objects"]) == len(recorder.objects)
@@ -0,0 +1,99 @@
+import time
+
+import numpy as np
+import pytest
+from src.FakeBackend import FakeBackend
+from src.InventorManager import InventorManager
+from src.RecordingBackend import RecordingBackend
+from src.ReplayBackend import ReplayBackend
+
+# - - - - - - - - - - - - - - - - -
+
+
+def record_export(tmp_path, latency=0.0):
+    """
+    Record export of an assembly with a bolt placed twice and a part without mass.
+
+    Returns:
+        tuple: Recording filename and exported parts list.
+    """
+    backend = FakeBackend(latency)
+    backend.add_part(
+        "C:/fake/Bolt.ipt",
+        "TBRE-001",
+        "Bolt",
+        mass=0.5,
+        centre_of_mass=(0.0, 0.0, 1.0),
+        inertia=np.diag([1.0, 2.0, 3.0]),
+    )
+    backend.add_part("C:/fake/Sticker.ipt", "TBRE-002")
+    backend.add_assembly("C:/fake/Top.iam", "TBRE-000")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Bolt.ipt")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Bolt.ipt")
+    backend.add_occurrence("C:/fake/Top.iam", "C:/fake/Sticker.ipt")
+
+    recorder = RecordingBackend(backend)
+    parts_list = InventorManager(backend=recorder).get_parts_list("C:/fake/Top.iam")
+    filename = tmp_path / "recording.json.gz"
+    recorder.save(filename)
+    return filename, parts_list
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_replay_export(tmp_path):
+    """
+    Test replayed export gives the recorded parts list.
+    """
+    filename, recorded_parts = record_export(tmp_path)
+    backend = ReplayBackend.load(filename, latency_scale=0)
+
+    parts_list = InventorManager(backend=backend).get_parts_list("C:/fake/Top.iam")
+
+    assert [vars(part) for part in parts_list] == [
+        vars(part) for part in recorded_parts
+    ]
+    assert parts_list[2].mass is None
+    assert backend.calls > 0
+
+
+def test_replay_latency(tmp_path):
+    """
+    Test replay waits for recorded call times.
+    """
+    filename, _ = record_export(tmp_path, latency=0.002)
+    backend = ReplayBackend.load(filename)
+    document = backend.connect().Documents.Open("C:/fake/Top.iam", False)
+
+    start_time = time.perf_counter()
+    document.DocumentType
+    elapsed = time.perf_counter() - start_time
+
+    assert elapsed >= 0.002
+
+
+def test_unrecorded_read(tmp_path):
+    """
+    Test reads not made while recording raise AttributeError.
+    """
+    filename, _ = record_export(tmp_path)
+    backend = ReplayBackend.load(filename, latency_scale=0)
+    app = backend.connect()
+
+    with pytest.raises(AttributeError):
+        app.Documents.Open("C:/fake/Other.iam", True)
+    with pytest.raises(AttributeError):
+        app.SoftwareVersion
+
+
+def test_find_documents(tmp_path):
+    """
+    Test assembly patterns match recorded documents.
+    """
+    filename, _ = record_export(tmp_path)
+    backend = ReplayBackend.load(filename)
+
+    assert backend.find_documents([]) == ["C:/fake/Top.iam"]
+    assert backend.find_documents(["*/Top.iam"]) == ["C:/fake/Top.iam"]
+    assert backend.find_documents(["*.ipt"]) == []
@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+
+from src.Part import Part
+from src.SubAssemblyCache import SubAssemblyCache, get_transformation_matrix
+
+# - - - - - - - - - - - - - - - - -
+
+
+class FakeMatrix:
+    def __init__(self, matrix):
+        self.matrix = matrix
+
+    def Cell(self, row, column):
+        return self.matrix[row - 1][column - 1]
+
+
+class FakeDocument:
+    def __init__(self, full_file_name):
+        self.FullFileName = full_file_name
+
+
+class FakeDefinition:
+    def __init__(self, full_file_name):
+        self.Document = FakeDocument(full_file_name)
+
+
+class FakeOccurrence:
+    def __init__(self, full_file_name, matrix, flexible=False):
+        self.Definition = FakeDefinition(full_file_name)
+        self.Transformation = FakeMatrix(matrix)
+        self.Flexible = flexible
+
+
+def rotation_z(angle, translation):
+    """
+    Create transformation matrix rotating about z-axis, translation in cm.
+    """
+    c, s = np.cos(angle), np.sin(angle)
+    return [
+        [c, -s, 0, translation[0]],
+        [s, c, 0, translation[1]],
+        [0, 0, 1, translation[2]],
+        [0, 0, 0, 1],
+    ]
+
+
+def world_part(matrix, local_point, mass=2.0):
+    """
+    Create part positioned by transformation matrix.
+    """
+    transformation = get_transformation_matrix(FakeOccurrence("", matrix))
+    point = transformation[:3, :3] @ np.array(local_point) + transformation[:3, 3]
+    return Part.from_record(
+        {
+            "part_number": "TBRE-001",
+            "part_name": "Upright",
+            "mass": mass,
+            "x_axis": point[0],
+            "y_axis": point[1],
+            "z_axis": point[2],
+        }
+    )
+
+
+# - - - - - - - - - - - - - - - - -
+
+
+def test_expand_replays_transformation():
+    """
+    Test repeated sub-assembly is expanded with its own transformation.
+    """
+    front_left = rotation_z(0.0, [10, 20, 0])
+    rear_right = rotation_z(np.pi / 2, [-10, -20, 5])
+    cache = SubAssemblyCache()
+
+    # First instance is traversed and stored.
+    assert cache.expand(FakeOccurrence("corner.iam", front_left)) is None
+    cache.store(
+        FakeOccurrence("corner.iam", front_left),
+        [world_part(front_left, [1.0, 2.0, 3.0])],
+    )
+
+    # Second instance is expanded from the cache.
+    parts = cache.expand(FakeOccurrence("corner.iam", rear_right))
+    expected = world_part(rear_right, [1.0, 2.0, 3.0])
+    assert len(parts) == 1
+    assert parts[0].part_number == "TBRE-001"
+    assert parts[0].x_axis == pytest.approx(expected.x_axis)
+    assert parts[0].y_axis == pytest.approx(expected.y_axis)
+    assert parts[0].z_axis == pytest.approx(expected.z_axis)
+    assert parts[0].x_axis_mass == pytest.approx(expected.x_axis * 2.0)
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_expand_keeps_missing_centre_of_mass():
+    """
+    Test parts without centre of mass stay without centre of mass.
+    """
+    identity = rotation_z(0.0, [0, 0, 0])
+    missing = world_part(identity, [1.0, 2.0, 3.0])
+    missing.set_centre_of_mass(None, None, None)
+    cache = SubAssemblyCache()
+    cache.store(
+        FakeOccurrence("corner.iam", identity),
+        [missing, world_part(identity, [1.0, 2.0, 3.0], mass=None)],
+    )
+
+    parts = cache.expand(FakeOccurrence("corner.iam", rotation_z(1.0, [1, 1, 1])))
+    assert parts[0].mass == 2.0
+    assert parts[0].x_axis is None
+    assert parts[0].x_axis_mass is None
+    assert parts[1].mass is None
+    assert parts[1].x_axis is not None
+    assert parts[1].x_axis_mass is None
+
+
+def test_flexible_not_memoized():
+    """
+    Test flexible sub-assemblies are always traversed.
+    """
+    identity = rotation_z(0.0, [0, 0, 0])
+    cache = SubAssemblyCache()
+    cache.store(
+        FakeOccurrence("linkage.iam", identity, flexible=True),
+        [world_part(identity, [1.0, 2.0, 3.0])],
+    )
+
+    assert "linkage.iam" not in cache.definitions
+    assert cache.expand(FakeOccurrence("linkage.iam", identity, True)) is None
+
+
+def test_expand_occurrence_paths():
+    """
+    Test expanded parts get occurrence paths under their own sub-assembly.
+    """
+    identity = rotation_z(0.0, [0, 0, 0])
+    part = world_part(identity, [1.0, 2.0, 3.0])
+    part.occurrence_path = ("FL:1", "Upright:1")
+    cache = SubAssemblyCache()
+    cache.store(FakeOccurrence("corner.iam", identity), [part], ("FL:1",))
+
+    parts = cache.expand(FakeOccurrence("corner.iam", identity), ("RR:1",))
+    assert parts[0].occurrence_path == ("RR:1", "Upright:1")
+
+
+def test_expand_rotates_principal_axes():
+    """
+    Test principal axes of expanded parts follow occurrence rotation.
+    """
+    first = rotation_z(0.0, [0, 0, 0])
+    second = rotation_z(np.pi / 2, [0, 0, 0])
+    cache = SubAssemblyCache()
+
+    part = world_part(first, [1.0, 0.0, 0.0])
+    part.principal_moments = [1.0, 2.0, 3.0]
+    part.principal_axes = np.eye(3).tolist()
+    cache.store(FakeOccurrence("corner.iam", first), [part])
+    parts = cache.expand(FakeOccurrence("corner.iam", second))
+
+    assert parts[0].principal_moments == [1.0, 2.0, 3.0]
+    assert np.array(parts[0].principal_axes) == pytest.approx(
+        np.array([[0, 1, 0], [-1, 0, 0], [0, 0, 1]])
+    )